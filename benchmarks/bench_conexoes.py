@@ -0,0 +1,134 @@
+"""Latência por chamada do DatabaseManager: conexão por chamada x pool.
+
+Uso: python benchmarks/bench_conexoes.py [--clientes 100000] [--repeticoes 200]
+
+O modo "antes" substitui o pool por um objeto que abre e fecha uma conexão
+sqlite3 padrão a cada chamada, reproduzindo o comportamento original.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabacaria.core import DatabaseManager
+from tabacaria.core.cache import CatalogoProdutos, CacheLRU
+
+
+class ConexaoPorChamada:
+    # Mesma interface do ConnectionPool, mas com uma conexão nova por chamada
+    def __init__(self, db_name):
+        self.db_name = db_name
+
+    @contextmanager
+    def read(self, cancelar=None):
+        conn = sqlite3.connect(self.db_name)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        conn = sqlite3.connect(self.db_name)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def apos_commit(self, funcao):
+        funcao()
+
+    def versao_dados(self):
+        # Um valor novo a cada chamada: o catálogo de produtos relê a tabela
+        return object()
+
+    def close(self):
+        pass
+
+
+def popular(db_name, n_clientes):
+    conn = sqlite3.connect(db_name)
+    inicio = date(1950, 1, 1)
+    conn.executemany(
+        '''INSERT INTO clientes
+           (nome, telefone, email, data_nascimento, data_cadastro, preferencias, observacoes, fumante_ativo)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+        ((f"Cliente {i:06d}", f"11 9{i:08d}", f"cliente{i}@exemplo.com",
+          (inicio + timedelta(days=i % 20000)).isoformat(), "2024-01-01",
+          "Cigarro", "", i % 3 != 0)
+         for i in range(n_clientes)))
+    conn.executemany(
+        'INSERT INTO compras (cliente_id, produto_id, data_compra, quantidade, valor_total) VALUES (?, ?, ?, ?, ?)',
+        ((random.randint(1, n_clientes), random.randint(1, 7), "2024-06-01", 1, 10.0)
+         for _ in range(n_clientes)))
+    conn.commit()
+    conn.close()
+
+
+def medir(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - t0)
+    return statistics.median(tempos) * 1000
+
+
+def cenarios(db, n_clientes):
+    ids = [random.randint(1, n_clientes) for _ in range(64)]
+    hoje = date.today().strftime("%Y-%m-%d")
+    return [
+        ("get_cliente", lambda: db.get_cliente(random.choice(ids))),
+        ("get_compras_cliente", lambda: db.get_compras_cliente(random.choice(ids))),
+        ("get_produtos", db.get_produtos),
+        ("get_notificacoes_hoje", db.get_notificacoes_hoje),
+        ("add_notificacao", lambda: db.add_notificacao(("Teste", "Benchmark", hoje, "teste", random.choice(ids)))),
+        ("add_compra", lambda: db.add_compra((random.choice(ids), 1, hoje, 1, 10.0))),
+        ("search_clientes", lambda: db.search_clientes("Cliente 0421")),
+        ("get_clientes", db.get_clientes),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_name = os.path.join(pasta, "bench.db")
+        db = DatabaseManager(db_name)
+        popular(db_name, args.clientes)
+
+        resultados = {}
+        for modo in ("antes", "depois"):
+            if modo == "antes":
+                # Também sem os caches em memória, como no código original
+                originais = db.pool, db.produtos, db.clientes_cache, db.resumos_cache
+                db.pool = ConexaoPorChamada(db_name)
+                db.produtos = CatalogoProdutos(db.pool)
+                db.clientes_cache = db.resumos_cache = CacheLRU(maximo=0)
+            for nome, funcao in cenarios(db, args.clientes):
+                # Consultas que devolvem a tabela inteira são caras demais para muitas repetições
+                repeticoes = 5 if nome == "get_clientes" else args.repeticoes
+                resultados.setdefault(nome, {})[modo] = medir(funcao, repeticoes)
+            if modo == "antes":
+                db.pool, db.produtos, db.clientes_cache, db.resumos_cache = originais
+        db.close()
+
+    print(f"{'método':<24}{'antes (ms)':>12}{'depois (ms)':>13}{'ganho':>9}")
+    for nome, r in resultados.items():
+        print(f"{nome:<24}{r['antes']:>12.3f}{r['depois']:>13.3f}{r['antes'] / r['depois']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
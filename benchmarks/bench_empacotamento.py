@@ -0,0 +1,240 @@
+"""Abertura do app empacotado: tempo até a janela, tamanho e memória por rota.
+
+Uso: python benchmarks/bench_empacotamento.py [ROTA ...] [--construir]
+                                              [--clientes 100000]
+                                              [--repeticoes 5] [--frio]
+
+Rotas: python (código-fonte, para referência), pyinstaller-onefile,
+pyinstaller-onefile-sem-upx, pyinstaller-onedir, pyinstaller-onedir-sem-upx,
+cx_freeze, nuitka e pyoxidizer; sem argumentos, todas as que tiverem
+executável. --construir gera antes os executáveis das rotas pedidas com a
+ferramenta de cada uma (tabacaria_crm.spec, build.py, build_nuitka.sh e
+pyoxidizer.toml).
+
+Todas as rotas abrem o mesmo banco sintético, com a variável
+TABACARIA_SAIR_APOS_PINTURA: o app grava os marcos da abertura e sai na
+primeira pintura da janela. A coluna "até o código" é o tempo gasto antes
+de o Python começar a carregar o pacote tabacaria (bootloader, extração do
+onefile e descompressão UPX, inicialização do interpretador), e
+"importações" é a carga de PyQt5 e do restante do app. A abertura a frio
+(--frio) esvazia o cache de páginas do Linux antes de cada medida e exige
+root; sem ela, a coluna fica vazia. RSS é o pico de memória do processo e
+dos seus filhos (getrusage), indisponível no Windows.
+"""
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from bench_conexoes import popular
+from tabacaria.core import DatabaseManager
+
+EXE = ".exe" if sys.platform == "win32" else ""
+PYINSTALLER = ["pyinstaller", "--noconfirm", "tabacaria_crm.spec"]
+
+# nome: (comando de construção, variáveis de ambiente, padrão do executável,
+#        tamanho medido pela pasta inteira do executável)
+ROTAS = {
+    "python": (None, {}, "tabacaria_crm.py", False),
+    "pyinstaller-onefile": (
+        PYINSTALLER + ["--distpath", "dist/onefile", "--workpath", "build/onefile"], {},
+        "dist/onefile/tabacaria_crm" + EXE, False),
+    "pyinstaller-onefile-sem-upx": (
+        PYINSTALLER + ["--distpath", "dist/onefile-sem-upx", "--workpath", "build/onefile-sem-upx"],
+        {"TABACARIA_SEM_UPX": "1"}, "dist/onefile-sem-upx/tabacaria_crm" + EXE, False),
+    "pyinstaller-onedir": (
+        PYINSTALLER + ["--distpath", "dist/onedir", "--workpath", "build/onedir"],
+        {"TABACARIA_ONEDIR": "1"}, "dist/onedir/tabacaria_crm/tabacaria_crm" + EXE, True),
+    "pyinstaller-onedir-sem-upx": (
+        PYINSTALLER + ["--distpath", "dist/onedir-sem-upx", "--workpath", "build/onedir-sem-upx"],
+        {"TABACARIA_ONEDIR": "1", "TABACARIA_SEM_UPX": "1"},
+        "dist/onedir-sem-upx/tabacaria_crm/tabacaria_crm" + EXE, True),
+    "cx_freeze": ([sys.executable, "build.py", "build"], {}, "build/exe.*/TabacariaCRM" + EXE, True),
+    "nuitka": (["bash", "build_nuitka.sh"], {}, "dist/tabacaria_crm" + (EXE or ".bin"), False),
+    "pyoxidizer": (["pyoxidizer", "build", "--release"], {},
+                   "build/*/release/install/TabacariaCRM" + EXE, True),
+}
+
+
+def ferramenta_disponivel(rota):
+    if rota.startswith("pyinstaller"):
+        return shutil.which("pyinstaller") is not None
+    if rota == "cx_freeze":
+        return importlib.util.find_spec("cx_Freeze") is not None
+    if rota == "nuitka":
+        return importlib.util.find_spec("nuitka") is not None
+    if rota == "pyoxidizer":
+        return shutil.which("pyoxidizer") is not None
+    return True
+
+
+def construir(rota):
+    comando, ambiente, _, _ = ROTAS[rota]
+    if comando is None:
+        return
+    if not ferramenta_disponivel(rota):
+        print(f"{rota}: ferramenta não instalada, construção ignorada", file=sys.stderr)
+        return
+    print(f"{rota}: construindo...", file=sys.stderr)
+    subprocess.run(comando, cwd=RAIZ, env=dict(os.environ, **ambiente), check=True)
+
+
+def executavel(rota):
+    padrao = ROTAS[rota][2]
+    if rota == "python":
+        return [sys.executable, os.path.join(RAIZ, padrao)]
+    encontrados = sorted(glob.glob(os.path.join(RAIZ, padrao)))
+    return [encontrados[-1]] if encontrados else None
+
+
+def tamanho(rota, comando):
+    if rota == "python":
+        return None
+    if not ROTAS[rota][3]:
+        return os.path.getsize(comando[0])
+    total = 0
+    for pasta, _, arquivos in os.walk(os.path.dirname(comando[0])):
+        total += sum(os.path.getsize(os.path.join(pasta, a)) for a in arquivos)
+    return total
+
+
+def esvaziar_cache():
+    # Só no Linux e como root; devolve False quando não é possível
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3")
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
+def abrir(comando, db_name, pasta):
+    marcos = os.path.join(pasta, "marcos.json")
+    if os.path.exists(marcos):
+        os.remove(marcos)
+    ambiente = dict(os.environ, TABACARIA_SAIR_APOS_PINTURA=marcos)
+    if sys.platform.startswith("linux") and not ambiente.get("DISPLAY") and not ambiente.get("WAYLAND_DISPLAY"):
+        ambiente.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    t0 = time.perf_counter()
+    processo = subprocess.Popen(comando + ["--db", db_name], cwd=pasta, env=ambiente,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    limite = threading.Timer(300, processo.kill)
+    limite.start()
+    try:
+        if hasattr(os, "wait4"):
+            _, status, uso = os.wait4(processo.pid, 0)
+            processo.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss vem em KB no Linux e em bytes no macOS
+            rss = uso.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            processo.wait()
+            rss = None
+    finally:
+        limite.cancel()
+
+    if not os.path.exists(marcos):
+        raise RuntimeError(f"{comando[0]} terminou com código {processo.returncode} sem abrir a janela")
+    with open(marcos, encoding="utf-8") as f:
+        m = json.load(f)
+    return {
+        "abertura": m["pintura"] - t0,
+        "ate_codigo": m["inicio"] - t0,
+        "importacoes": m["importacoes"] - m["inicio"],
+        "janela": m["pintura"] - m["importacoes"],
+        "rss": rss,
+    }
+
+
+def medir(rota, comando, template, repeticoes, frio):
+    with tempfile.TemporaryDirectory() as pasta:
+        # Cópia do banco por rota: a primeira abertura grava notificações e
+        # faz o backup automático, e não deve pesar nas outras rotas
+        db_name = os.path.join(pasta, "bench.db")
+        shutil.copy(template, db_name)
+        abrir(comando, db_name, pasta)  # aquecimento
+
+        quentes = [abrir(comando, db_name, pasta) for _ in range(repeticoes)]
+        frias = []
+        if frio:
+            for _ in range(repeticoes):
+                if not esvaziar_cache():
+                    print("--frio exige Linux e root; medidas a frio ignoradas", file=sys.stderr)
+                    frias = []
+                    break
+                frias.append(abrir(comando, db_name, pasta))
+
+    def mediana(medidas, chave):
+        valores = [m[chave] for m in medidas if m[chave] is not None]
+        return statistics.median(valores) if valores else None
+
+    resultado = {chave: mediana(quentes, chave) for chave in quentes[0]}
+    resultado["frio"] = mediana(frias, "abertura") if frias else None
+    resultado["tamanho"] = tamanho(rota, comando)
+    return resultado
+
+
+def formatar(valor, escala, casas=0):
+    return "-" if valor is None else f"{valor * escala:.{casas}f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rotas", nargs="*", metavar="ROTA", help=", ".join(ROTAS))
+    parser.add_argument("--construir", action="store_true",
+                        help="gerar os executáveis das rotas antes de medir")
+    parser.add_argument("--clientes", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--frio", action="store_true",
+                        help="medir também com o cache de páginas vazio (Linux, root)")
+    args = parser.parse_args()
+
+    rotas = args.rotas or list(ROTAS)
+    for rota in rotas:
+        if rota not in ROTAS:
+            parser.error(f"rota desconhecida: {rota}")
+    if args.construir:
+        for rota in rotas:
+            construir(rota)
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as pasta:
+        template = os.path.join(pasta, "template.db")
+        DatabaseManager(template).close()
+        popular(template, args.clientes)
+
+        for rota in rotas:
+            comando = executavel(rota)
+            if comando is None:
+                resultados[rota] = None
+                continue
+            print(f"{rota}: medindo...", file=sys.stderr)
+            resultados[rota] = medir(rota, comando, template, args.repeticoes, args.frio)
+
+    print(f"{args.clientes} clientes, mediana de {args.repeticoes} aberturas (ms, exceto tamanho e RSS)")
+    print(f"{'rota':<30}{'tamanho (MB)':>13}{'frio':>8}{'quente':>8}{'até o código':>14}"
+          f"{'importações':>13}{'janela':>8}{'RSS (MB)':>10}")
+    for rota, r in resultados.items():
+        if r is None:
+            print(f"{rota:<30}{'executável não encontrado':>74}")
+            continue
+        print(f"{rota:<30}{formatar(r['tamanho'], 1 / 2**20, 1):>13}{formatar(r['frio'], 1000):>8}"
+              f"{formatar(r['abertura'], 1000):>8}{formatar(r['ate_codigo'], 1000):>14}"
+              f"{formatar(r['importacoes'], 1000):>13}{formatar(r['janela'], 1000):>8}"
+              f"{formatar(r['rss'], 1 / 2**20, 0):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Tempo de importação (python -X importtime) de cada ponto de entrada.
+
+Uso: python benchmarks/bench_importacao.py [--repeticoes 5] [--top 8]
+                                           [--comparar REVISAO]
+
+Cada ponto de entrada é importado em um processo novo, várias vezes (vale a
+menor medida, com o cache de disco já quente). --comparar mede também o
+tabacaria_crm.py de uma revisão do git, por exemplo a anterior à divisão em
+pacotes, que carregava PyQt5, matplotlib e plyer em qualquer caso.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRADAS = (
+    ("core", "import tabacaria.core"),
+    ("tabacaria_crm (CLI)", "import tabacaria_crm"),
+    ("servidor (--servir)", "import tabacaria.cli, tabacaria.core.servidor"),
+    ("gui", "import tabacaria.cli, tabacaria.gui"),
+    ("gui + gráfico", "import tabacaria.cli, tabacaria.gui, matplotlib.figure, "
+                      "matplotlib.backends.backend_qt5agg"),
+)
+
+
+def importar(codigo, caminho):
+    # Retorna {módulo: (próprio, acumulado)} em microssegundos
+    resultado = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                               cwd=caminho, capture_output=True, text=True,
+                               env=dict(os.environ, PYTHONPATH=caminho))
+    if resultado.returncode:
+        sys.exit(resultado.stderr)
+    modulos = {}
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "[us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        modulos[nome.strip()] = (int(proprio), int(acumulado))
+    return modulos
+
+
+def medir(codigo, caminho, repeticoes):
+    execucoes = [importar(codigo, caminho) for _ in range(repeticoes)]
+    return min(execucoes, key=lambda m: sum(p for p, _ in m.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8,
+                        help="pacotes mais pesados a listar por ponto de entrada")
+    parser.add_argument("--comparar", metavar="REVISAO",
+                        help="medir também o tabacaria_crm.py desta revisão do git")
+    args = parser.parse_args()
+
+    entradas = [(nome, codigo, RAIZ) for nome, codigo in ENTRADAS]
+    with tempfile.TemporaryDirectory() as pasta:
+        if args.comparar:
+            codigo = subprocess.run(["git", "show", f"{args.comparar}:tabacaria_crm.py"],
+                                    cwd=RAIZ, capture_output=True, text=True, check=True).stdout
+            with open(os.path.join(pasta, "tabacaria_crm.py"), "w", encoding="utf-8") as f:
+                f.write(codigo)
+            entradas.append((f"tabacaria_crm ({args.comparar})", "import tabacaria_crm", pasta))
+
+        base = sum(p for p, _ in medir("pass", RAIZ, args.repeticoes).values())
+        medidas = [(nome, medir(codigo, caminho, args.repeticoes))
+                   for nome, codigo, caminho in entradas]
+
+    print(f"interpretador vazio: {base / 1000:.1f} ms (descontado abaixo)\n")
+    print(f"{'ponto de entrada':<28}{'módulos':>9}{'importação (ms)':>17}"
+          f"{'PyQt5':>7}{'matplotlib':>12}{'plyer':>7}")
+    for nome, modulos in medidas:
+        total = sum(p for p, _ in modulos.values()) - base
+        pesados = ["sim" if pacote in modulos else "-" for pacote in ("PyQt5", "matplotlib", "plyer")]
+        print(f"{nome:<28}{len(modulos):>9}{total / 1000:>17.1f}"
+              f"{pesados[0]:>7}{pesados[1]:>12}{pesados[2]:>7}")
+
+    for nome, modulos in medidas:
+        pacotes = {}
+        for modulo, (proprio, _) in modulos.items():
+            pacote = modulo.split(".")[0]
+            pacotes[pacote] = pacotes.get(pacote, 0) + proprio
+        print(f"\n{nome}: pacotes que mais pesam (ms, soma do tempo próprio dos módulos)")
+        for pacote, proprio in sorted(pacotes.items(), key=lambda p: -p[1])[:args.top]:
+            print(f"  {pacote:<40}{proprio / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Tuplas de SELECT * x linhas tipadas com só as colunas usadas: tempo e memória.
+
+Uso: python benchmarks/bench_linhas.py [--clientes 100000] [--repeticoes 5]
+
+Para cada ponto da interface que lê clientes, compara a consulta original
+(SELECT * devolvendo tuplas) com a atual (classe de linha com __slots__ e
+só as colunas que a tela usa). Tempo: mediana das leituras completas, com o
+cache do SQLite já quente. Memória: o que a lista de resultados ocupa,
+medido com tracemalloc em uma leitura separada.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conexoes import popular
+from tabacaria.core import DatabaseManager, Cliente, CartaoCliente, ClienteNome
+
+# Consultas como eram antes das linhas tipadas
+SQL_ANTES = 'SELECT * FROM clientes ORDER BY nome COLLATE NOCASE, id'
+SQL_ANTES_PAGINA = SQL_ANTES + ' LIMIT 200'
+
+
+def cenarios(db):
+    def antes(sql):
+        def ler():
+            with db.pool.read() as conn:
+                return conn.execute(sql).fetchall()
+        return ler
+
+    # (nome, leitura original, leitura atual)
+    return [
+        ("só id e nome", antes(SQL_ANTES), lambda: db.get_clientes(tipo=ClienteNome)),
+        ("lista de clientes (todos)", antes(SQL_ANTES), lambda: db.get_clientes(tipo=CartaoCliente)),
+        ("lista de clientes (página)", antes(SQL_ANTES_PAGINA),
+         lambda: db.get_clientes(limit=200, tipo=CartaoCliente)),
+        ("todas as colunas (API)", antes(SQL_ANTES), lambda: db.get_clientes(tipo=Cliente)),
+    ]
+
+
+def medir_tempo(ler, repeticoes):
+    ler()  # aquece o cache de páginas
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        linhas = ler()
+        tempos.append(time.perf_counter() - t0)
+        del linhas
+    return statistics.median(tempos) * 1000
+
+
+def medir_memoria(ler):
+    tracemalloc.start()
+    try:
+        linhas = ler()
+        memoria = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return memoria / 2**20, len(linhas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_name = os.path.join(pasta, "bench.db")
+        DatabaseManager(db_name).close()
+        popular(db_name, args.clientes)
+        db = DatabaseManager(db_name)
+
+        resultados = []
+        for nome, antes, depois in cenarios(db):
+            memoria_antes, n = medir_memoria(antes)
+            memoria_depois, _ = medir_memoria(depois)
+            resultados.append((nome, n, medir_tempo(antes, args.repeticoes),
+                               medir_tempo(depois, args.repeticoes), memoria_antes, memoria_depois))
+        db.close()
+
+    print(f"{args.clientes} clientes, mediana de {args.repeticoes} leituras")
+    print(f"{'leitura':<30}{'linhas':>8}{'antes (ms)':>12}{'depois (ms)':>13}"
+          f"{'antes (MB)':>12}{'depois (MB)':>13}")
+    for nome, n, tempo_antes, tempo_depois, memoria_antes, memoria_depois in resultados:
+        print(f"{nome:<30}{n:>8}{tempo_antes:>12.1f}{tempo_depois:>13.1f}"
+              f"{memoria_antes:>12.2f}{memoria_depois:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Tempo até a primeira pintura da janela principal sobre um banco grande.
+
+Uso: python benchmarks/bench_primeira_pintura.py [--clientes 100000]
+                                                  [--repeticoes 5]
+                                                  [--orcamento 1000]
+                                                  [--comparar REVISAO]
+
+Cada medida abre a interface em um processo novo (QT_QPA_PLATFORM=offscreen
+se não houver display) e mede do início do processo até o primeiro evento de
+pintura da MainWindow, e até os dados carregados em segundo plano (números e
+gráfico do dashboard, aniversariantes) aparecerem. Termina com erro se a
+mediana da primeira pintura passar do orçamento, em milissegundos.
+--comparar mede também o código de uma revisão do git.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from bench_conexoes import popular
+from tabacaria.core import DatabaseManager
+
+# Roda no processo filho; imprime os instantes (perf_counter, o mesmo relógio
+# do processo pai) da primeira pintura e da chegada dos dados adiados
+CODIGO_FILHO = '''
+import sys, time
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication, QDialog, QMainWindow
+from tabacaria_crm import main
+
+# Um diálogo modal (as notificações do dia) prenderia o processo sem usuário
+QDialog.exec_ = lambda self: 0
+
+pintura = []
+
+class Observador(QObject):
+    def eventFilter(self, objeto, evento):
+        if evento.type() == QEvent.Paint and not pintura and isinstance(objeto, QMainWindow):
+            pintura.append(time.perf_counter())
+            QTimer.singleShot(0, esperar_dados)
+        return False
+
+def esperar_dados():
+    janela = next(w for w in QApplication.topLevelWidgets() if hasattr(w, "birthday_widget"))
+    # Versões sem carregamento adiado não têm dashboard_canvas: já estão prontas
+    if (getattr(janela, "dashboard_canvas", True) is None
+            or getattr(janela.birthday_widget, "aniversariantes", True) is None):
+        QTimer.singleShot(5, esperar_dados)
+        return
+    print(pintura[0], time.perf_counter(), flush=True)
+    QApplication.quit()
+
+def exec_com_observador(app, exec_original=QApplication.exec_):
+    app.installEventFilter(Observador(app))
+    return exec_original()
+
+QApplication.exec_ = exec_com_observador
+sys.argv = ["tabacaria_crm.py", "--db", sys.argv[1]]
+main()
+'''
+
+
+def abrir(caminho, db_name):
+    ambiente = dict(os.environ, PYTHONPATH=caminho)
+    if not ambiente.get("DISPLAY") and not ambiente.get("WAYLAND_DISPLAY"):
+        ambiente.setdefault("QT_QPA_PLATFORM", "offscreen")
+    t0 = time.perf_counter()
+    resultado = subprocess.run([sys.executable, "-c", CODIGO_FILHO, db_name], cwd=caminho,
+                               env=ambiente, capture_output=True, text=True, timeout=300)
+    linhas = resultado.stdout.split()
+    if len(linhas) < 2:
+        sys.exit(resultado.stderr)
+    pintura, dados = (float(x) for x in linhas[-2:])
+    return (pintura - t0) * 1000, (dados - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--orcamento", type=float, default=1000,
+                        help="mediana máxima da primeira pintura, em ms (padrão: 1000)")
+    parser.add_argument("--comparar", metavar="REVISAO",
+                        help="medir também o código desta revisão do git")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_name = os.path.join(pasta, "bench.db")
+        DatabaseManager(db_name).close()
+        popular(db_name, args.clientes)
+
+        versoes = [("atual", RAIZ)]
+        if args.comparar:
+            arquivo = os.path.join(pasta, "revisao.tar")
+            subprocess.run(["git", "archive", "-o", arquivo, args.comparar], cwd=RAIZ, check=True)
+            destino = os.path.join(pasta, "revisao")
+            with tarfile.open(arquivo) as tar:
+                tar.extractall(destino)
+            versoes.append((args.comparar, destino))
+
+        resultados = {}
+        for nome, caminho in versoes:
+            abrir(caminho, db_name)  # aquece o cache de disco e os .pyc
+            medidas = [abrir(caminho, db_name) for _ in range(args.repeticoes)]
+            resultados[nome] = (statistics.median(m[0] for m in medidas),
+                                statistics.median(m[1] for m in medidas))
+
+    print(f"{args.clientes} clientes, mediana de {args.repeticoes} aberturas")
+    print(f"{'versão':<12}{'primeira pintura (ms)':>23}{'dados carregados (ms)':>24}")
+    for nome, (pintura, dados) in resultados.items():
+        print(f"{nome:<12}{pintura:>23.0f}{dados:>24.0f}")
+
+    pintura = resultados["atual"][0]
+    if pintura > args.orcamento:
+        sys.exit(f"primeira pintura em {pintura:.0f} ms, acima do orçamento de {args.orcamento:.0f} ms")
+    print(f"dentro do orçamento de {args.orcamento:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
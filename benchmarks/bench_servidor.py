@@ -0,0 +1,134 @@
+"""Carga na API HTTP (--servir): vendas por segundo com vários caixas simultâneos.
+
+Uso: python benchmarks/bench_servidor.py [--clientes 10000] [--caixas 8]
+                                         [--consultas 2] [--duracao 10]
+
+Sobe o servidor em um processo separado sobre um banco sintético, abre uma
+conexão keep-alive por caixa registrando vendas sem parar (e, opcionalmente,
+conexões fazendo buscas de clientes ao mesmo tempo) e no fim confere se todas
+as vendas confirmadas estão no banco.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from bench_conexoes import popular
+from tabacaria.core import DatabaseManager
+
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def requisitar(reader, writer, metodo, caminho, corpo=None):
+    dados = json.dumps(corpo).encode() if corpo is not None else b""
+    writer.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: localhost\r\n"
+                 f"Content-Length: {len(dados)}\r\n\r\n".encode() + dados)
+    await writer.drain()
+    cabecalho = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status = int(cabecalho.split(" ", 2)[1])
+    tamanho = next(int(linha.split(":", 1)[1]) for linha in cabecalho.split("\r\n")
+                   if linha.lower().startswith("content-length:"))
+    return status, json.loads(await reader.readexactly(tamanho))
+
+
+async def caixa(porta, n_clientes, fim, latencias, erros):
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    ids = []
+    while time.perf_counter() < fim:
+        venda = {"cliente_id": random.randint(1, n_clientes), "produto_id": random.randint(1, 7),
+                 "quantidade": random.randint(1, 3)}
+        t0 = time.perf_counter()
+        status, resposta = await requisitar(reader, writer, "POST", "/vendas", venda)
+        latencias.append(time.perf_counter() - t0)
+        if status == 201:
+            ids.append(resposta["id"])
+        else:
+            erros.append(resposta)
+    writer.close()
+    return ids
+
+
+async def consultor(porta, fim, latencias):
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    while time.perf_counter() < fim:
+        t0 = time.perf_counter()
+        await requisitar(reader, writer, "GET", f"/clientes?busca=Cliente%20{random.randint(0, 999):03d}&limite=20")
+        latencias.append(time.perf_counter() - t0)
+    writer.close()
+
+
+async def carga(porta, args):
+    fim = time.perf_counter() + args.duracao
+    latencias, latencias_consulta, erros = [], [], []
+    tarefas = [caixa(porta, args.clientes, fim, latencias, erros) for _ in range(args.caixas)]
+    tarefas += [consultor(porta, fim, latencias_consulta) for _ in range(args.consultas)]
+    resultados = await asyncio.gather(*tarefas)
+    ids = [i for r in resultados[:args.caixas] for i in r]
+    return ids, latencias, latencias_consulta, erros
+
+
+def percentil(valores, p):
+    return sorted(valores)[min(len(valores) - 1, int(len(valores) * p))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=10000)
+    parser.add_argument("--caixas", type=int, default=8)
+    parser.add_argument("--consultas", type=int, default=2)
+    parser.add_argument("--duracao", type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_name = os.path.join(pasta, "bench.db")
+        DatabaseManager(db_name).close()
+        popular(db_name, args.clientes)
+        with sqlite3.connect(db_name) as conn:
+            antes = conn.execute("SELECT count(*) FROM compras").fetchone()[0]
+
+        porta = porta_livre()
+        servidor = subprocess.Popen(
+            [sys.executable, os.path.join(RAIZ, "tabacaria_crm.py"), "--db", db_name,
+             "--servir", "--porta", str(porta)], stdout=subprocess.PIPE, text=True)
+        try:
+            servidor.stdout.readline()  # "Servindo em ..."
+            t0 = time.perf_counter()
+            ids, latencias, latencias_consulta, erros = asyncio.run(carga(porta, args))
+            decorrido = time.perf_counter() - t0
+        finally:
+            servidor.terminate()
+            servidor.wait()
+
+        with sqlite3.connect(db_name) as conn:
+            gravadas = conn.execute("SELECT count(*) FROM compras").fetchone()[0] - antes
+
+    print(f"caixas: {args.caixas}  consultas simultâneas: {args.consultas}  duração: {decorrido:.1f}s")
+    print(f"vendas confirmadas: {len(ids)}  gravadas no banco: {gravadas}  erros: {len(erros)}")
+    print(f"vendas/s: {len(ids) / decorrido:.0f}")
+    print(f"latência da venda (ms): p50 {percentil(latencias, .5):.1f}  "
+          f"p95 {percentil(latencias, .95):.1f}  p99 {percentil(latencias, .99):.1f}  "
+          f"média {statistics.mean(latencias) * 1000:.1f}")
+    if latencias_consulta:
+        print(f"buscas/s: {len(latencias_consulta) / decorrido:.0f}  "
+              f"p95 {percentil(latencias_consulta, .95):.1f} ms")
+    if gravadas != len(ids):
+        sys.exit("vendas confirmadas e gravadas não conferem")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Vendas por segundo no balcão: sequência antiga x registrar_venda.
+
+Uso: python benchmarks/bench_vendas.py [--clientes 100000] [--segundos 5]
+
+"antes" repete o que a tela de vendas fazia por venda: get_produto,
+add_compra (transação própria), get_cliente (releitura após a invalidação)
+e add_notificacao (segunda transação). "depois" chama registrar_venda, que
+faz tudo em uma transação da conexão principal. Cada modo registra vendas
+sem pausa durante --segundos, para clientes e produtos sorteados, em um
+banco próprio; são mostradas a vazão e as latências por venda.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conexoes import popular
+from tabacaria.core import DatabaseManager
+
+
+def venda_antes(db, cliente_id, produto_id, quantidade, data_compra):
+    produto = db.get_produto(produto_id)
+    valor_total = produto.preco * quantidade
+    db.add_compra((cliente_id, produto_id, data_compra, quantidade, valor_total))
+    cliente = db.get_cliente(cliente_id)
+    mensagem = f"Venda de {quantidade}x {produto.nome} para {cliente.nome} no valor de R$ {valor_total:.2f}"
+    db.add_notificacao(("Nova venda registrada", mensagem, date.today().strftime("%Y-%m-%d"),
+                        "venda", cliente_id))
+
+
+def venda_depois(db, cliente_id, produto_id, quantidade, data_compra):
+    db.registrar_venda(cliente_id, produto_id, quantidade, data_compra)
+
+
+def medir(db, vender, n_clientes, segundos):
+    produtos = [produto.id for produto in db.get_produtos()]
+    hoje = date.today().isoformat()
+    sorteio = random.Random(1)
+    tempos = []
+    fim = time.perf_counter() + segundos
+    while True:
+        t0 = time.perf_counter()
+        if t0 >= fim:
+            break
+        vender(db, sorteio.randint(1, n_clientes), sorteio.choice(produtos),
+               sorteio.randint(1, 3), hoje)
+        tempos.append(time.perf_counter() - t0)
+    return tempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=100000)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    args = parser.parse_args()
+
+    resultados = []
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome, vender in (("antes", venda_antes), ("depois", venda_depois)):
+            db_name = os.path.join(pasta, f"{nome}.db")
+            DatabaseManager(db_name).close()
+            popular(db_name, args.clientes)
+            db = DatabaseManager(db_name)
+            tempos = medir(db, vender, args.clientes, args.segundos)
+            db.close()
+            resultados.append((nome, tempos))
+
+    print(f"{args.clientes} clientes, {args.segundos:g} s por modo")
+    print(f"{'modo':<8}{'vendas':>8}{'vendas/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for nome, tempos in resultados:
+        ms = sorted(t * 1000 for t in tempos)
+        p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+        print(f"{nome:<8}{len(ms):>8}{len(ms) / sum(tempos):>10.0f}"
+              f"{statistics.median(ms):>10.3f}{p99:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
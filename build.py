@@ -4,8 +4,10 @@ from cx_Freeze import setup, Executable
 
 # Dependências automaticamente detectadas
 build_exe_options = {
-    "packages": ["os", "sys", "sqlite3", "datetime", "json", "PyQt5", "matplotlib", "numpy"],
-    "excludes": ["tkinter", "unittest", "email", "http", "urllib", "xml", "pydoc"],
+    # tabacaria.gui e tabacaria.core.servidor são importados sob demanda pelo cli
+    "packages": ["os", "sys", "sqlite3", "datetime", "json", "tabacaria", "PyQt5", "matplotlib",
+                 "numpy"],
+    "excludes": ["tkinter", "unittest", "email", "http", "xml", "pydoc"],
     "include_files": [],
     "optimize": 2
 }
@@ -12,6 +12,7 @@ python -m nuitka \
     --standalone \
     --onefile \
     --enable-plugin=pyqt5 \
+    --include-package=tabacaria \
     --include-package=PyQt5 \
     --include-package=matplotlib \
     --include-package=numpy \
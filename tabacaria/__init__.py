@@ -0,0 +1,8 @@
+# Tabacaria CRM. tabacaria.core (banco, relatórios, agendadores, importação,
+# exportação e API) não depende de PyQt5, matplotlib nem plyer; a interface
+# fica em tabacaria.gui.
+import time
+
+# Instante (time.perf_counter) em que o pacote começou a ser carregado: o
+# primeiro marco da abertura medida por benchmarks/bench_empacotamento.py
+INICIO = time.perf_counter()
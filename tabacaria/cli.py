@@ -0,0 +1,182 @@
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, date
+
+from .core import DatabaseManager, Importador, Exportador, AGRUPAMENTOS, resumo_importacao
+
+def verificar_planos(db_name):
+    db = DatabaseManager(db_name)
+    try:
+        problemas = db.verificar_planos_consulta()
+    finally:
+        db.close()
+    
+    for nome, detalhe in problemas:
+        print(f"{nome}: {detalhe}")
+    if problemas:
+        print(f"{len(problemas)} consulta(s) sem uso de índice")
+        return 1
+    print("Todas as consultas críticas usam índices")
+    return 0
+
+def manter_resumos(db_name, reconstruir):
+    db = DatabaseManager(db_name)
+    try:
+        if reconstruir:
+            db.reconstruir_resumos()
+            print("Resumos de vendas reconstruídos")
+        divergencias = db.verificar_resumos()
+    finally:
+        db.close()
+    
+    for tabela, linhas in divergencias.items():
+        print(f"{tabela}: {linhas} linha(s) divergente(s)")
+    if divergencias:
+        print("Execute com --reconstruir-resumos para corrigir")
+        return 1
+    print("Resumos de vendas conferem com a tabela de compras")
+    return 0
+
+def importar_arquivo(db_name, tipo, caminho):
+    def progresso(lidos, total, resultado):
+        print(f"\r{lidos * 100 // max(total, 1):3d}%  {resultado['importados']} importado(s)",
+              end="", file=sys.stderr, flush=True)
+    
+    db = DatabaseManager(db_name)
+    try:
+        resultado = Importador(db).importar(tipo, caminho, progresso)
+    finally:
+        db.close()
+    print(file=sys.stderr)
+    
+    for numero, erro in resultado["erros"]:
+        print(f"linha {numero}: {erro}")
+    print(resumo_importacao(resultado))
+    return 1 if resultado["invalidos"] else 0
+
+def exportar_arquivo(db_name, conjunto, caminho, ano, mes, agrupamento="dia"):
+    def progresso(linhas, total):
+        print(f"\r{linhas} de {total} linha(s)", end="", file=sys.stderr, flush=True)
+    
+    db = DatabaseManager(db_name)
+    try:
+        resultado = Exportador(db).exportar(conjunto, caminho, progresso=progresso,
+                                            ano=ano, mes=mes, agrupamento=agrupamento)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    print(file=sys.stderr)
+    
+    print(f"{resultado['linhas']} linha(s) exportada(s) para {caminho}")
+    return 0
+
+def copiar_banco(db_name, backup=None, restaurar=None):
+    def progresso(percentual):
+        print(f"\r{percentual:3d}%", end="", file=sys.stderr, flush=True)
+    
+    db = DatabaseManager(db_name)
+    try:
+        if backup:
+            db.fazer_backup(backup, progresso)
+        else:
+            db.restaurar_backup(restaurar, progresso)
+    except ValueError as e:
+        print(file=sys.stderr)
+        print(e)
+        return 1
+    finally:
+        db.close()
+    print(file=sys.stderr)
+    
+    print(f"Backup criado: {backup}" if backup else f"Backup restaurado: {restaurar}")
+    return 0
+
+def servir(db_name, host, porta):
+    from .core.servidor import ApiServer
+    
+    db = DatabaseManager(db_name)
+    try:
+        ApiServer(db, host, porta).executar()
+    finally:
+        db.close()
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Tabacaria CRM - Sistema de Fidelização")
+    parser.add_argument("--db", default="tabacaria_crm.db", help="arquivo do banco de dados")
+    parser.add_argument("--verificar-planos", action="store_true",
+                        help="verificar com EXPLAIN QUERY PLAN se as consultas críticas usam índices")
+    parser.add_argument("--verificar-resumos", action="store_true",
+                        help="conferir as tabelas de resumo de vendas com a tabela de compras")
+    parser.add_argument("--reconstruir-resumos", action="store_true",
+                        help="reconstruir as tabelas de resumo de vendas a partir das compras")
+    parser.add_argument("--importar", nargs=2, metavar=("TIPO", "ARQUIVO"),
+                        help="importar um CSV/JSONL de " + ", ".join(Importador.TIPOS))
+    parser.add_argument("--exportar", nargs=2, metavar=("CONJUNTO", "ARQUIVO"),
+                        help="exportar " + ", ".join(Exportador.CONJUNTOS)
+                             + " para .csv, .jsonl ou .parquet")
+    parser.add_argument("--mes", metavar="AAAA-MM",
+                        help="mês dos relatórios exportados (padrão: mês atual)")
+    parser.add_argument("--agrupamento", choices=tuple(AGRUPAMENTOS), default="dia",
+                        help="agrupamento do relatório por período")
+    parser.add_argument("--backup", metavar="ARQUIVO",
+                        help="copiar o banco para ARQUIVO (compactado se terminar em .gz)")
+    parser.add_argument("--restaurar", metavar="ARQUIVO",
+                        help="substituir o banco pelo backup ARQUIVO, depois de verificá-lo")
+    parser.add_argument("--servir", "--serve", action="store_true",
+                        help="rodar sem interface, servindo a API HTTP/JSON para caixas e scripts")
+    parser.add_argument("--host", default="127.0.0.1", help="endereço da API (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8765, help="porta da API (padrão: 8765)")
+    args, argv_qt = parser.parse_known_args()
+    
+    if args.servir:
+        sys.exit(servir(args.db, args.host, args.porta))
+    if args.backup or args.restaurar:
+        sys.exit(copiar_banco(args.db, args.backup, args.restaurar))
+    if args.importar:
+        tipo, caminho = args.importar
+        if tipo not in Importador.TIPOS:
+            parser.error(f"tipo de importação inválido: {tipo}")
+        sys.exit(importar_arquivo(args.db, tipo, caminho))
+    if args.exportar:
+        conjunto, caminho = args.exportar
+        if conjunto not in Exportador.CONJUNTOS:
+            parser.error(f"conjunto de exportação inválido: {conjunto}")
+        try:
+            Exportador.formato_do_arquivo(caminho)
+            referencia = datetime.strptime(args.mes, "%Y-%m") if args.mes else date.today()
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(exportar_arquivo(args.db, conjunto, caminho, referencia.year, referencia.month,
+                                  args.agrupamento))
+    if args.verificar_planos:
+        sys.exit(verificar_planos(args.db))
+    if args.verificar_resumos or args.reconstruir_resumos:
+        sys.exit(manter_resumos(args.db, args.reconstruir_resumos))
+    
+    # PyQt5 só é carregado quando a interface gráfica vai mesmo abrir
+    from PyQt5.QtWidgets import QApplication
+    from .gui import MainWindow
+    from .gui.marcos import MarcosAbertura, VARIAVEL_MARCOS
+    from . import INICIO
+    importacoes = time.perf_counter()
+    
+    app = QApplication(sys.argv[:1] + argv_qt)
+    
+    # Definir estilo da aplicação
+    app.setStyle('Fusion')
+    
+    window = MainWindow(args.db)
+    if os.environ.get(VARIAVEL_MARCOS):
+        window.installEventFilter(MarcosAbertura(
+            os.environ[VARIAVEL_MARCOS],
+            {"inicio": INICIO, "importacoes": importacoes, "janela": time.perf_counter()}, window))
+    window.show()
+    
+    codigo = app.exec_()
+    window.encerrar()
+    sys.exit(codigo)
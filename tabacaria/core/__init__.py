@@ -0,0 +1,12 @@
+from .pool import ConnectionPool, PoolEsgotado
+from .database import DatabaseManager
+from .linhas import (Linha, Cliente, CartaoCliente, ClienteNome, CompraCliente, Venda,
+                     ResumoCliente, TopCliente, VendasPeriodo, VendasMes, VendasProduto,
+                     VendasCategoria, Produto, Notificacao, Aniversariante)
+from .consultas import AGRUPAMENTOS
+from .migracoes import MIGRACOES, VERSAO_SCHEMA, sem_acentos
+from .agendadores import Scheduler, NotificationScheduler, BackupScheduler
+from .importacao import Importador, resumo_importacao
+from .exportacao import Exportador
+
+# ApiServer fica em tabacaria.core.servidor, importado só por --servir (asyncio)
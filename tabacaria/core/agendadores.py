@@ -0,0 +1,146 @@
+import os
+import sys
+import threading
+from datetime import datetime, date, time, timedelta
+
+class Scheduler(threading.Thread):
+    # Thread de fundo que chama executar() logo ao iniciar e depois no horário
+    # devolvido por proximo_disparo(agora). acordar() antecipa a próxima
+    # execução e parar() encerra a thread sem esperar o próximo disparo.
+    # Enquanto `ativo` for falso os disparos acontecem, mas não executam nada.
+    def __init__(self, nome):
+        super().__init__(name=nome, daemon=True)
+        self.ativo = True
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+    
+    def proximo_disparo(self, agora):
+        raise NotImplementedError
+    
+    def executar(self):
+        raise NotImplementedError
+    
+    def acordar(self):
+        self._acordar.set()
+    
+    def parar(self, timeout=5.0):
+        self._parar.set()
+        self._acordar.set()
+        if self.is_alive():
+            self.join(timeout)
+    
+    def run(self):
+        while not self._parar.is_set():
+            if self.ativo:
+                try:
+                    self.executar()
+                except Exception as e:
+                    # Uma falha não pode matar o agendador; tenta de novo no próximo disparo
+                    print(f"{self.name}: {e}", file=sys.stderr)
+            
+            agora = datetime.now()
+            espera = (self.proximo_disparo(agora) - agora).total_seconds()
+            self._acordar.wait(max(espera, 0))
+            self._acordar.clear()
+
+class NotificationScheduler(Scheduler):
+    # Gera as notificações de aniversário do dia, mostra a notificação do
+    # sistema (plyer bloqueia, por isso fica nesta thread) e entrega as
+    # notificações não lidas de hoje a ao_notificar(notificacoes), que é
+    # chamada nesta thread: quem for GUI deve repassar por um sinal Qt.
+    INTERVALO = 300  # segundos entre verificações
+    
+    def __init__(self, db, ao_notificar, intervalo=INTERVALO):
+        super().__init__("notificacoes")
+        self.db = db
+        self.ao_notificar = ao_notificar
+        self.intervalo = intervalo
+    
+    def proximo_disparo(self, agora):
+        # Também dispara na virada do dia, quando surgem novos aniversariantes
+        meia_noite = datetime.combine(agora.date() + timedelta(days=1), time())
+        return min(agora + timedelta(seconds=self.intervalo), meia_noite)
+    
+    def executar(self):
+        hoje = date.today()
+        titulo = "Aniversário do Cliente"
+        
+        novas = [(
+            titulo, 
+            f"Hoje é aniversário de {cliente.nome}. Que tal enviar uma mensagem de parabéns?", 
+            hoje.strftime("%Y-%m-%d"), 
+            "aniversario", 
+            cliente.id
+        ) for cliente in self.db.get_aniversariantes_sem_aviso(hoje)]
+        
+        # Todas as notificações do dia em um só commit
+        if novas:
+            self.db.add_notificacoes_many(novas)
+        
+        for _, mensagem, _, _, _ in novas:
+            # Mostrar notificação do sistema (o plyer só é carregado aqui)
+            try:
+                from plyer import notification
+                notification.notify(
+                    title=titulo,
+                    message=mensagem,
+                    app_name="Tabacaria CRM",
+                    timeout=10
+                )
+            except:
+                pass  # Ignora erros se notificação do sistema não funcionar
+        
+        notificacoes = self.db.get_notificacoes_hoje()
+        if notificacoes:
+            self.ao_notificar(notificacoes)
+
+class BackupScheduler(Scheduler):
+    # Backup automático compactado em `pasta` conforme a frequência gravada na
+    # configuração "backup_frequencia", contada a partir de "ultimo_backup".
+    # Mantém os MANTER backups automáticos mais recentes e chama
+    # ao_concluir(caminho) nesta thread depois de cada um.
+    FREQUENCIAS = {"diario": 1, "semanal": 7, "mensal": 30}  # dias
+    FREQUENCIA_PADRAO = "diario"
+    MANTER = 10
+    RETENTATIVA = timedelta(hours=1)  # espera depois de um backup que falhou
+    PREFIXO = "tabacaria_crm_"
+    
+    def __init__(self, db, pasta, ao_concluir=None):
+        super().__init__("backup")
+        self.db = db
+        self.pasta = pasta
+        self.ao_concluir = ao_concluir
+    
+    def _vencimento(self):
+        ultimo = self.db.get_configuracao("ultimo_backup")
+        if ultimo is None:
+            return None
+        frequencia = self.db.get_configuracao("backup_frequencia", self.FREQUENCIA_PADRAO)
+        dias = self.FREQUENCIAS.get(frequencia, self.FREQUENCIAS[self.FREQUENCIA_PADRAO])
+        return datetime.fromisoformat(ultimo) + timedelta(days=dias)
+    
+    def proximo_disparo(self, agora):
+        vencimento = self._vencimento()
+        if vencimento is None or vencimento <= agora:
+            return agora + self.RETENTATIVA
+        return vencimento
+    
+    def executar(self):
+        agora = datetime.now()
+        vencimento = self._vencimento()
+        if vencimento is not None and vencimento > agora:
+            return
+        
+        os.makedirs(self.pasta, exist_ok=True)
+        caminho = os.path.join(self.pasta, f"{self.PREFIXO}{agora:%Y%m%d_%H%M%S}.db.gz")
+        self.db.fazer_backup(caminho)
+        self.db.set_configuracao("ultimo_backup", agora.isoformat(timespec="seconds"))
+        
+        # O nome tem a data, então a ordem alfabética é a cronológica
+        antigos = sorted(nome for nome in os.listdir(self.pasta)
+                         if nome.startswith(self.PREFIXO) and nome.endswith(".db.gz"))
+        for nome in antigos[:-self.MANTER]:
+            os.remove(os.path.join(self.pasta, nome))
+        
+        if self.ao_concluir:
+            self.ao_concluir(caminho)
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .linhas import Produto
+
+class CatalogoProdutos:
+    # Produtos em memória, por id. A tabela é pequena e muda pouco: é lida
+    # inteira e só é lida de novo quando a geração muda (escrita de produtos
+    # por esta instância) ou quando PRAGMA data_version indica que outro
+    # processo gravou no banco. Consultas não bloqueiam: o estado é trocado
+    # de uma vez e duas recargas simultâneas apenas repetem o trabalho.
+    def __init__(self, pool):
+        self.pool = pool
+        self.geracao = 0
+        self._lock_geracao = threading.Lock()
+        # (geracao, data_version, {id: produto}, produtos ordenados por nome)
+        self._estado = None
+        self.acertos = 0
+        self.faltas = 0
+
+    def invalidar(self):
+        # Chamar depois do commit: uma recarga que leu o estado antigo fica
+        # marcada com a geração anterior e é descartada na próxima consulta
+        with self._lock_geracao:
+            self.geracao += 1
+
+    def _atual(self, validar=True):
+        estado = self._estado
+        if estado is not None and not validar:
+            self.acertos += 1
+            return estado
+
+        geracao = self.geracao
+        # None: a conexão principal está ocupada com uma escrita desta
+        # instância; as de outros processos aparecem na próxima verificação
+        versao = self.pool.versao_dados()
+        if estado is not None and estado[0] == geracao and versao in (None, estado[1]):
+            self.acertos += 1
+            return estado
+
+        self.faltas += 1
+        with self.pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Produto.fabrica
+            produtos = cursor.execute(f'SELECT {Produto.colunas()} FROM produtos ORDER BY nome').fetchall()
+        if versao is None and estado is not None:
+            versao = estado[1]
+        estado = (geracao, versao, {p.id: p for p in produtos}, produtos)
+        self._estado = estado
+        return estado
+
+    def listar(self):
+        return list(self._atual()[3])
+
+    def obter(self, produto_id, validar=True):
+        # validar=False não consulta o banco (a não ser na primeira carga):
+        # para o cálculo do valor enquanto o caixa digita
+        return self._atual(validar)[2].get(produto_id)
+
+    def estatisticas(self):
+        total = self.acertos + self.faltas
+        return {"acertos": self.acertos, "faltas": self.faltas,
+                "taxa_acerto": self.acertos / total if total else None,
+                "geracao": self.geracao}
+
+class CacheLRU:
+    # Cache de leitura limitado a `maximo` itens (sai o usado há mais tempo)
+    # e a `validade` segundos por item, que limita o atraso em ver escritas
+    # de outros processos; as desta instância invalidam a chave na hora.
+    def __init__(self, maximo=1000, validade=300.0):
+        self.maximo = maximo
+        self.validade = validade
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        # Muda a cada invalidação: um valor lido do banco antes dela não é
+        # guardado, mesmo que a leitura termine depois
+        self._geracao = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def obter(self, chave, carregar):
+        # Devolve o valor em cache ou carregar(chave); None não é guardado
+        agora = time.monotonic()
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None and agora - item[0] < self.validade:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[1]
+            self.faltas += 1
+            geracao = self._geracao
+
+        valor = carregar(chave)
+        if valor is None:
+            return None
+
+        with self._lock:
+            if geracao == self._geracao:
+                self._itens[chave] = (agora, valor)
+                self._itens.move_to_end(chave)
+                while len(self._itens) > self.maximo:
+                    self._itens.popitem(last=False)
+                    self.descartes += 1
+        return valor
+
+    def invalidar(self, *chaves):
+        with self._lock:
+            self._geracao += 1
+            for chave in chaves:
+                self._itens.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._geracao += 1
+            self._itens.clear()
+
+    def estatisticas(self):
+        with self._lock:
+            total = self.acertos + self.faltas
+            return {"acertos": self.acertos, "faltas": self.faltas,
+                    "taxa_acerto": self.acertos / total if total else None,
+                    "itens": len(self._itens), "maximo": self.maximo,
+                    "descartes": self.descartes}
@@ -0,0 +1,281 @@
+from .migracoes import sem_acentos
+from .linhas import Cliente, Notificacao
+
+# Consultas executadas a cada ação da interface; verificar_planos_consulta
+# garante que nenhuma delas volte a fazer varredura completa de tabela.
+# {colunas} recebe as colunas da classe de linha pedida (linhas.py).
+SQL_GET_CLIENTES = 'SELECT {colunas} FROM clientes ORDER BY nome COLLATE NOCASE, id'
+
+# Paginação por chave (nome, id): cada página começa logo após a última
+# linha da anterior, sem OFFSET, usando a faixa de idx_clientes_nome
+SQL_GET_CLIENTES_APOS = '''
+    SELECT {colunas} FROM clientes
+    WHERE nome >= :nome COLLATE NOCASE
+      AND (nome > :nome COLLATE NOCASE OR id > :id)
+    ORDER BY nome COLLATE NOCASE, id
+    LIMIT :limite
+'''
+
+# O id da compra vem por último e serve de chave de paginação junto com a data
+SQL_COMPRAS_CLIENTE = '''
+    SELECT c.data_compra, p.nome, c.quantidade, c.valor_total, c.id
+    FROM compras c
+    JOIN produtos p ON c.produto_id = p.id
+    WHERE c.cliente_id = :cliente_id{filtros}
+    ORDER BY c.data_compra DESC, c.id DESC
+    LIMIT :limite
+'''
+
+FILTRO_COMPRAS_APOS = '''
+      AND (c.data_compra, c.id) < (:data, :id)'''
+
+SQL_RESUMO_CLIENTE = '''
+    SELECT COUNT(*), coalesce(SUM(quantidade), 0), coalesce(SUM(valor_total), 0),
+           MIN(data_compra), MAX(data_compra)
+    FROM compras
+    WHERE cliente_id = ?
+'''
+
+SQL_INSERIR_CLIENTE = '''
+    INSERT INTO clientes 
+    (nome, telefone, email, data_nascimento, data_cadastro, preferencias, observacoes, fumante_ativo)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERIR_COMPRA = '''
+    INSERT INTO compras 
+    (cliente_id, produto_id, data_compra, quantidade, valor_total)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+SQL_SOMAR_GASTO = '''
+    UPDATE clientes 
+    SET total_gasto = total_gasto + ?
+    WHERE id = ?
+'''
+
+# Leituras da venda do balcão, feitas dentro da transação da venda
+SQL_PRODUTO_VENDA = 'SELECT nome, preco FROM produtos WHERE id = ?'
+SQL_CLIENTE_VENDA = 'SELECT nome, total_gasto FROM clientes WHERE id = ?'
+
+SQL_ESTATISTICAS = '''
+    SELECT COUNT(*), COALESCE(SUM(fumante_ativo = 1), 0), COALESCE(SUM(total_gasto), 0)
+    FROM clientes
+'''
+
+SQL_TOP_CLIENTES = '''
+    SELECT id, nome, COALESCE(total_gasto, 0) FROM clientes
+    ORDER BY total_gasto DESC
+    LIMIT ?
+'''
+
+# Relatórios de vendas sobre um intervalo [inicio, fim) de datas ISO; a
+# comparação direta com data_compra permite a busca por faixa no índice
+SQL_RELATORIO_CLIENTES = '''
+    SELECT COUNT(DISTINCT cliente_id)
+    FROM compras
+    WHERE data_compra >= :inicio AND data_compra < :fim
+'''
+
+# Por período a partir do resumo diário (uma linha por dia com vendas)
+SQL_RELATORIO_PERIODO = '''
+    SELECT {periodo} AS periodo, SUM(vendas), SUM(quantidade), SUM(valor)
+    FROM resumo_vendas_dia
+    WHERE data >= :inicio AND data < :fim
+    GROUP BY periodo
+    ORDER BY periodo
+'''
+
+AGRUPAMENTOS = {
+    "dia": "data",
+    "semana": "strftime('%Y-S%W', data)",
+    "mes": "substr(data, 1, 7)",
+}
+
+# Intervalos de meses inteiros usam os resumos mensais; os demais leem compras
+SQL_RESUMO_PRODUTOS = '''
+    SELECT v.produto_id, p.nome, p.categoria, v.vendas, v.quantidade, v.valor
+    FROM (
+        SELECT produto_id, SUM(vendas) AS vendas, SUM(quantidade) AS quantidade,
+               SUM(valor) AS valor
+        FROM resumo_vendas_produto_mes
+        WHERE mes >= :mes_inicio AND mes < :mes_fim
+        GROUP BY produto_id
+    ) v
+    LEFT JOIN produtos p ON p.id = v.produto_id
+    ORDER BY v.valor DESC
+'''
+
+SQL_RESUMO_CLIENTES = '''
+    SELECT COUNT(DISTINCT cliente_id)
+    FROM resumo_vendas_cliente_mes
+    WHERE mes >= :mes_inicio AND mes < :mes_fim
+'''
+
+SQL_VENDAS_MENSAIS = '''
+    SELECT mes, vendas, quantidade, valor
+    FROM resumo_vendas_mes
+    WHERE mes >= ?
+    ORDER BY mes
+'''
+
+# Exportação da tabela inteira de compras, na ordem física (rowid)
+SQL_EXPORTAR_COMPRAS = '''
+    SELECT c.id, c.cliente_id, c.produto_id, p.nome, c.data_compra, c.quantidade, c.valor_total
+    FROM compras c
+    LEFT JOIN produtos p ON p.id = c.produto_id
+    ORDER BY c.id
+'''
+
+SQL_RELATORIO_PRODUTOS = '''
+    SELECT v.produto_id, p.nome, p.categoria, v.vendas, v.quantidade, v.valor
+    FROM (
+        SELECT produto_id, COUNT(*) AS vendas, SUM(quantidade) AS quantidade,
+               SUM(valor_total) AS valor
+        FROM compras
+        WHERE data_compra >= :inicio AND data_compra < :fim
+        GROUP BY produto_id
+    ) v
+    LEFT JOIN produtos p ON p.id = v.produto_id
+    ORDER BY v.valor DESC
+'''
+
+SQL_INSERIR_NOTIFICACAO = '''
+    INSERT INTO notificacoes 
+    (titulo, mensagem, data_notificacao, tipo, cliente_id)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+SQL_NOTIFICACOES_HOJE = f'''
+    SELECT {Notificacao.colunas()} FROM notificacoes
+    WHERE data_notificacao = ? AND lida = 0
+    ORDER BY id DESC
+'''
+
+# O mês-dia do nascimento ("MM-DD") é a expressão de idx_clientes_aniversario;
+# as consultas precisam usar exatamente a mesma expressão para usar o índice
+SQL_ANIVERSARIANTES_MES = '''
+    SELECT id, nome, data_nascimento
+    FROM clientes
+    WHERE substr(data_nascimento, 6, 5) BETWEEN :inicio AND :fim
+    ORDER BY substr(data_nascimento, 6, 5)
+'''
+
+# Aniversariantes do dia que ainda não têm notificação de aniversário hoje
+# (lida ou não), para que a verificação periódica não repita o aviso
+SQL_ANIVERSARIANTES_SEM_AVISO = '''
+    SELECT c.id, c.nome FROM clientes c
+    WHERE substr(c.data_nascimento, 6, 5) = :dia
+      AND NOT EXISTS (
+          SELECT 1 FROM notificacoes n
+          WHERE n.cliente_id = c.id AND n.data_notificacao = :hoje
+            AND n.tipo = 'aniversario'
+      )
+'''
+
+# Busca no índice FTS5; os filtros e a ordenação são montados por
+# _consulta_busca_clientes conforme o modo (prefixo, paginação, ordem)
+SQL_BUSCA_CLIENTES = '''
+    SELECT {colunas} FROM clientes_fts f
+    JOIN clientes c ON c.id = f.rowid
+    WHERE f.clientes_fts MATCH :consulta{filtros}
+    ORDER BY {ordem}
+    LIMIT :limite
+'''
+
+# Só palavras curtas demais para o trigram: sem MATCH, os clientes são
+# percorridos em ordem de nome (idx_clientes_nome; o CROSS JOIN impede o
+# planejador de inverter a junção) e filtrados por FILTRO_BUSCA_TRECHO,
+# então o LIMIT encerra a leitura cedo
+SQL_BUSCA_CLIENTES_CURTA = '''
+    SELECT {colunas} FROM clientes c
+    CROSS JOIN clientes_fts f ON f.rowid = c.id
+    WHERE 1{filtros}
+    ORDER BY c.nome COLLATE NOCASE, c.id
+    LIMIT :limite
+'''
+
+# Palavra de 1 ou 2 caracteres: trecho em qualquer ponto do nome, telefone
+# ou email (colunas do índice, já sem acentos)
+FILTRO_BUSCA_TRECHO = '''
+      AND (f.nome LIKE :{nome} ESCAPE '\\' OR f.telefone LIKE :{nome} ESCAPE '\\'
+           OR f.email LIKE :{nome} ESCAPE '\\')'''
+
+FILTRO_BUSCA_PREFIXO = '''
+      AND (f.nome LIKE :prefixo ESCAPE '\\' OR f.telefone LIKE :prefixo ESCAPE '\\'
+           OR f.email LIKE :prefixo ESCAPE '\\')'''
+
+FILTRO_BUSCA_APOS = '''
+      AND c.nome >= :nome COLLATE NOCASE
+      AND (c.nome > :nome COLLATE NOCASE OR c.id > :id)'''
+
+def _escapar_like(texto):
+    return texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _consulta_busca_clientes(termo, prefixo=False, ordem="relevancia", after=None, limit=None,
+                             tipo=Cliente):
+    # Retorna (sql, parâmetros) da busca de clientes por um termo não vazio
+    colunas = tipo.colunas("c")
+    if ordem not in ("relevancia", "nome"):
+        raise ValueError(f"Ordem de busca inválida: {ordem}")
+    if after is not None and ordem != "nome":
+        raise ValueError("A paginação com after exige ordem='nome'")
+    
+    normalizado = sem_acentos(termo)
+    # O trigram só casa trechos de 3+ caracteres: as palavras longas vão para
+    # o MATCH e as curtas viram filtros LIKE sobre as linhas encontradas
+    palavras = [p for p in normalizado.split() if len(p) >= 3]
+    curtas = [p for p in normalizado.split() if len(p) < 3]
+    
+    params = {"limite": -1 if limit is None else limit}
+    filtros = ""
+    for i, curta in enumerate(curtas):
+        filtros += FILTRO_BUSCA_TRECHO.format(nome=f"trecho{i}")
+        params[f"trecho{i}"] = "%" + _escapar_like(curta) + "%"
+    if prefixo:
+        filtros += FILTRO_BUSCA_PREFIXO
+        params["prefixo"] = _escapar_like(normalizado) + "%"
+    if after is not None:
+        filtros += FILTRO_BUSCA_APOS
+        params["nome"], params["id"] = after
+    
+    if not palavras:
+        return SQL_BUSCA_CLIENTES_CURTA.format(colunas=colunas, filtros=filtros), params
+    
+    params["consulta"] = " AND ".join('"{}"'.format(p.replace('"', '""')) for p in palavras)
+    ordem_sql = "c.nome COLLATE NOCASE, c.id" if ordem == "nome" else "f.rank"
+    return SQL_BUSCA_CLIENTES.format(colunas=colunas, filtros=filtros, ordem=ordem_sql), params
+
+CONSULTAS_CRITICAS = {
+    "get_clientes": (SQL_GET_CLIENTES.format(colunas=Cliente.colunas()), ()),
+    "get_clientes (página)": (SQL_GET_CLIENTES_APOS.format(colunas=Cliente.colunas()),
+                              {"nome": "a", "id": 0, "limite": 200}),
+    "search_clientes": _consulta_busca_clientes("abc"),
+    "search_clientes (prefixo)": _consulta_busca_clientes("abc", prefixo=True),
+    "search_clientes (página)": _consulta_busca_clientes("abc", ordem="nome", after=("a", 0), limit=200),
+    "search_clientes (termo curto)": _consulta_busca_clientes("ab"),
+    "get_compras_cliente": (SQL_COMPRAS_CLIENTE.format(filtros=""), {"cliente_id": 1, "limite": -1}),
+    "get_compras_cliente (página)": (SQL_COMPRAS_CLIENTE.format(filtros=FILTRO_COMPRAS_APOS),
+                                     {"cliente_id": 1, "data": "2000-01-01", "id": 0, "limite": 200}),
+    "get_resumo_cliente": (SQL_RESUMO_CLIENTE, (1,)),
+    "get_notificacoes_hoje": (SQL_NOTIFICACOES_HOJE, ("2000-01-01",)),
+    "get_estatisticas": (SQL_ESTATISTICAS, ()),
+    "get_top_clientes": (SQL_TOP_CLIENTES, (5,)),
+    "relatório (clientes)": (SQL_RELATORIO_CLIENTES, {"inicio": "2000-01-01", "fim": "2000-02-01"}),
+    "relatório (por dia)": (SQL_RELATORIO_PERIODO.format(periodo=AGRUPAMENTOS["dia"]),
+                            {"inicio": "2000-01-01", "fim": "2000-02-01"}),
+    "relatório (por produto)": (SQL_RELATORIO_PRODUTOS, {"inicio": "2000-01-01", "fim": "2000-02-01"}),
+    "relatório mensal (por produto)": (SQL_RESUMO_PRODUTOS, {"mes_inicio": "2000-01", "mes_fim": "2000-02"}),
+    "relatório mensal (clientes)": (SQL_RESUMO_CLIENTES, {"mes_inicio": "2000-01", "mes_fim": "2000-02"}),
+    "get_vendas_mensais": (SQL_VENDAS_MENSAIS, ("2000-01",)),
+    "get_aniversariantes_mes": (SQL_ANIVERSARIANTES_MES, {"inicio": "01-01", "fim": "01-31"}),
+    "get_aniversariantes_sem_aviso": (SQL_ANIVERSARIANTES_SEM_AVISO,
+                                      {"dia": "01-01", "hoje": "2000-01-01"}),
+}
+
+# Consultas em que ordenar em memória é esperado: a busca paginada por nome
+# ordena apenas os clientes encontrados pelo FTS, nunca a tabela inteira
+# (idem para os relatórios, que agrupam só as compras do período)
+ORDENACAO_ACEITA = {"search_clientes (página)", "relatório (clientes)",
+                    "relatório (por produto)", "relatório mensal (por produto)",
+                    "relatório mensal (clientes)"}
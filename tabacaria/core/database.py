@@ -0,0 +1,605 @@
+import os
+import gzip
+import shutil
+import sqlite3
+from functools import partial
+from datetime import date
+
+from .consultas import (SQL_GET_CLIENTES, SQL_GET_CLIENTES_APOS, SQL_COMPRAS_CLIENTE,
+                        FILTRO_COMPRAS_APOS, SQL_INSERIR_CLIENTE, SQL_INSERIR_COMPRA,
+                        SQL_SOMAR_GASTO, SQL_PRODUTO_VENDA, SQL_CLIENTE_VENDA, SQL_ESTATISTICAS, SQL_TOP_CLIENTES,
+                        SQL_RELATORIO_CLIENTES, SQL_RELATORIO_PERIODO, AGRUPAMENTOS,
+                        SQL_RESUMO_PRODUTOS, SQL_RESUMO_CLIENTES, SQL_VENDAS_MENSAIS,
+                        SQL_EXPORTAR_COMPRAS, SQL_RELATORIO_PRODUTOS, SQL_INSERIR_NOTIFICACAO,
+                        SQL_NOTIFICACOES_HOJE, SQL_ANIVERSARIANTES_MES,
+                        SQL_ANIVERSARIANTES_SEM_AVISO, SQL_RESUMO_CLIENTE, CONSULTAS_CRITICAS,
+                        ORDENACAO_ACEITA,
+                        _consulta_busca_clientes)
+from .migracoes import MIGRACOES, RESUMOS_VENDAS, RECONSTRUCOES_ADIADAS, _reconstruir_resumos
+from .pool import ConnectionPool
+from .linhas import (Cliente, ClienteNome, CompraCliente, Venda, ResumoCliente, TopCliente,
+                     VendasPeriodo, VendasMes, VendasProduto, VendasCategoria, Notificacao,
+                     Aniversariante)
+from .cache import CatalogoProdutos, CacheLRU
+
+def _consultar(conn, tipo, sql, params=()):
+    # Cursor que entrega objetos `tipo` (linhas.py); tipo=None mantém tuplas.
+    # A fábrica fica no cursor: a conexão do pool é compartilhada.
+    cursor = conn.cursor()
+    if tipo is not None:
+        cursor.row_factory = tipo.fabrica
+    return cursor.execute(sql, params)
+
+class DatabaseManager:
+    PAGINAS_BACKUP = 4096  # páginas copiadas por passo do backup (16 MB com páginas de 4 KB)
+    # Nível 1: ~3x mais rápido que o padrão (9) e arquivo só ~10% maior
+    COMPRESSAO_BACKUP = 1
+    # Clientes frequentes no balcão: linhas e resumos de compras em memória
+    MAX_CLIENTES_CACHE = 2000
+    VALIDADE_CACHE = 300.0  # segundos; limita o atraso para ver escritas de outros processos
+    
+    def __init__(self, db_name="tabacaria_crm.db", max_leitores=ConnectionPool.MAX_LEITORES):
+        self.db_name = db_name
+        self.pool = ConnectionPool(db_name, max_leitores=max_leitores)
+        self.produtos = CatalogoProdutos(self.pool)
+        self.clientes_cache = CacheLRU(self.MAX_CLIENTES_CACHE, self.VALIDADE_CACHE)
+        self.resumos_cache = CacheLRU(self.MAX_CLIENTES_CACHE, self.VALIDADE_CACHE)
+        self.init_db()
+    
+    def transaction(self):
+        return self.pool.transaction()
+    
+    def close(self):
+        self.pool.close()
+    
+    def init_db(self):
+        # Caminho rápido: com o banco na versão atual a inicialização custa
+        # apenas a leitura de PRAGMA user_version e de objetos_adiados
+        with self.pool.read() as conn:
+            versao = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        for numero, descricao, migracao in MIGRACOES:
+            if numero <= versao:
+                continue
+            
+            # Cada migração roda em sua própria transação junto com a troca
+            # de versão; uma falha desfaz a etapa inteira
+            with self.pool.transaction() as conn:
+                # Outra instância do aplicativo pode ter migrado antes de nós
+                if conn.execute("PRAGMA user_version").fetchone()[0] >= numero:
+                    continue
+                migracao(conn.cursor())
+                conn.execute(f"PRAGMA user_version = {numero}")
+        
+        # Uma importação em lote interrompida deixa índices e triggers para trás
+        self.restaurar_indices()
+    
+    def verificar_planos_consulta(self):
+        # Retorna (consulta, detalhe) para cada passo do plano que varre a
+        # tabela inteira sem índice ou precisa ordenar em árvore temporária
+        problemas = []
+        with self.pool.read() as conn:
+            for nome, (sql, params) in CONSULTAS_CRITICAS.items():
+                subconsultas = set()
+                for _, _, _, detalhe in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+                    # Percorrer o resultado (pequeno) de uma subconsulta não é varredura de tabela
+                    if detalhe.startswith(("MATERIALIZE ", "CO-ROUTINE ")):
+                        subconsultas.add(detalhe.split()[1])
+                    # Tabelas virtuais (FTS5) escolhem o próprio plano via xBestIndex
+                    varredura = (detalhe.startswith("SCAN ") and " USING " not in detalhe
+                                 and "VIRTUAL TABLE" not in detalhe
+                                 and detalhe.split()[1] not in subconsultas)
+                    ordenacao = "USE TEMP B-TREE" in detalhe and nome not in ORDENACAO_ACEITA
+                    if varredura or ordenacao:
+                        problemas.append((nome, detalhe))
+        return problemas
+    
+    def add_cliente(self, cliente_data):
+        with self.pool.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_INSERIR_CLIENTE, cliente_data)
+            self.pool.apos_commit(partial(self.clientes_cache.invalidar, cursor.lastrowid))
+        
+        return cursor.lastrowid
+    
+    def add_clientes_many(self, clientes):
+        # Vários clientes em uma única transação; devolve quantos foram gravados
+        with self.pool.transaction() as conn:
+            cursor = conn.executemany(SQL_INSERIR_CLIENTE, clientes)
+        
+        return cursor.rowcount
+    
+    def iter_contatos_clientes(self, tamanho_lote=5000, cancelar=None):
+        # (id, telefone, email) de todos os clientes, para deduplicação
+        return self._iterar('SELECT id, telefone, email FROM clientes', (), tamanho_lote, cancelar)
+    
+    def update_cliente(self, cliente_id, cliente_data):
+        with self.pool.transaction() as conn:
+            conn.execute('''
+                UPDATE clientes 
+                SET nome=?, telefone=?, email=?, data_nascimento=?, preferencias=?, observacoes=?, fumante_ativo=?
+                WHERE id=?
+            ''', (*cliente_data, cliente_id))
+            self.pool.apos_commit(partial(self.clientes_cache.invalidar, cliente_id))
+    
+    def get_clientes(self, cancelar=None, after=None, limit=None, tipo=Cliente):
+        # after=(nome, id) da última linha recebida e limit=N retornam a
+        # próxima página em ordem alfabética. tipo: classe de linha com as
+        # colunas que o chamador usa (CartaoCliente, ClienteNome...)
+        with self.pool.read(cancelar) as conn:
+            if after is None and limit is None:
+                return _consultar(conn, tipo, SQL_GET_CLIENTES.format(colunas=tipo.colunas())).fetchall()
+            
+            nome, cliente_id = after if after is not None else ("", 0)
+            params = {"nome": nome, "id": cliente_id, "limite": -1 if limit is None else limit}
+            return _consultar(conn, tipo, SQL_GET_CLIENTES_APOS.format(colunas=tipo.colunas()),
+                              params).fetchall()
+    
+    def _iterar(self, sql, params, tamanho_lote, cancelar, tipo=None):
+        # Gerador que entrega as linhas em lotes de fetchmany. A conexão de
+        # leitura (e o snapshot do WAL) fica reservada até o gerador terminar
+        # ou ser fechado, então não guarde geradores parcialmente consumidos.
+        with self.pool.read(cancelar) as conn:
+            cursor = _consultar(conn, tipo, sql, params)
+            while True:
+                linhas = cursor.fetchmany(tamanho_lote)
+                if not linhas:
+                    return
+                yield from linhas
+    
+    def get_cliente(self, cliente_id):
+        return self.clientes_cache.obter(cliente_id, self._ler_cliente)
+    
+    def _ler_cliente(self, cliente_id):
+        with self.pool.read() as conn:
+            cursor = _consultar(conn, Cliente, f'SELECT {Cliente.colunas()} FROM clientes WHERE id = ?',
+                                (cliente_id,))
+            return cursor.fetchone()
+    
+    def iter_clientes(self, tamanho_lote=500, cancelar=None, tipo=Cliente):
+        # tipo=None: tuplas com as colunas de Cliente, sem o custo de criar
+        # um objeto por linha (exportação)
+        return self._iterar(SQL_GET_CLIENTES.format(colunas=(tipo or Cliente).colunas()), (),
+                            tamanho_lote, cancelar, tipo)
+    
+    def search_clientes(self, termo, prefixo=False, cancelar=None, ordem="relevancia",
+                        after=None, limit=None, tipo=Cliente):
+        # Busca sem acentos e sem diferenciar maiúsculas no índice FTS5 trigram.
+        # Com prefixo=True o nome, telefone ou email precisa começar pelo termo.
+        # ordem="relevancia" (bm25) ou "nome"; after=(nome, id) pagina por nome.
+        termo = termo.strip()
+        if not termo:
+            return self.get_clientes(cancelar, after=after, limit=limit, tipo=tipo)
+        
+        sql, params = _consulta_busca_clientes(termo, prefixo, ordem, after, limit, tipo)
+        with self.pool.read(cancelar) as conn:
+            return _consultar(conn, tipo, sql, params).fetchall()
+    
+    def iter_search_clientes(self, termo, prefixo=False, ordem="relevancia",
+                             tamanho_lote=500, cancelar=None, tipo=Cliente):
+        termo = termo.strip()
+        if not termo:
+            return self.iter_clientes(tamanho_lote, cancelar, tipo)
+        
+        sql, params = _consulta_busca_clientes(termo, prefixo, ordem, tipo=tipo)
+        return self._iterar(sql, params, tamanho_lote, cancelar, tipo)
+    
+    def add_compra(self, compra_data):
+        with self.pool.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_INSERIR_COMPRA, compra_data)
+            compra_id = cursor.lastrowid
+            
+            # Atualizar o total gasto pelo cliente
+            cursor.execute(SQL_SOMAR_GASTO, (compra_data[4], compra_data[0]))
+            self.pool.apos_commit(partial(self._invalidar_compras, compra_data[0]))
+        
+        return compra_id
+    
+    def add_compras_many(self, compras):
+        # Todas as compras em uma única transação (um commit); o total_gasto
+        # é somado em memória e atualizado uma vez por cliente. Aceita
+        # qualquer iterável, sem precisar materializá-lo.
+        totais = {}
+        
+        def linhas():
+            for compra in compras:
+                totais[compra[0]] = totais.get(compra[0], 0) + compra[4]
+                yield compra
+        
+        with self.pool.transaction() as conn:
+            cursor = conn.executemany(SQL_INSERIR_COMPRA, linhas())
+            conn.executemany(SQL_SOMAR_GASTO,
+                             ((total, cliente_id) for cliente_id, total in totais.items()))
+            self.pool.apos_commit(partial(self._invalidar_compras, *totais))
+        
+        return cursor.rowcount
+    
+    def registrar_venda(self, cliente_id, produto_id, quantidade, data_compra=None,
+                        valor_total=None):
+        # Venda (balcão ou API) em uma única transação da conexão principal:
+        # compra, total_gasto e notificação são gravados juntos ou nenhum é.
+        # Preço e nomes são lidos dentro dela, e as instruções são sempre as
+        # mesmas strings, reaproveitadas do cache de instruções preparadas do
+        # sqlite3. Sem valor_total, cobra o preço de tabela.
+        hoje = date.today().isoformat()
+        data_compra = data_compra or hoje
+        
+        with self.pool.transaction() as conn:
+            produto = conn.execute(SQL_PRODUTO_VENDA, (produto_id,)).fetchone()
+            if produto is None:
+                raise ValueError(f"Produto {produto_id} não encontrado")
+            nome_produto, preco = produto
+            if valor_total is None:
+                valor_total = preco * quantidade
+            
+            if conn.execute(SQL_SOMAR_GASTO, (valor_total, cliente_id)).rowcount == 0:
+                raise ValueError(f"Cliente {cliente_id} não encontrado")
+            compra_id = conn.execute(SQL_INSERIR_COMPRA, (cliente_id, produto_id, data_compra,
+                                                          quantidade, valor_total)).lastrowid
+            nome_cliente, total_gasto = conn.execute(SQL_CLIENTE_VENDA, (cliente_id,)).fetchone()
+            
+            mensagem = (f"Venda de {quantidade}x {nome_produto} para {nome_cliente} "
+                        f"no valor de R$ {valor_total:.2f}")
+            notificacao_id = conn.execute(SQL_INSERIR_NOTIFICACAO, (
+                "Nova venda registrada", mensagem, hoje, "venda", cliente_id)).lastrowid
+            self.pool.apos_commit(partial(self._invalidar_compras, cliente_id))
+        
+        return Venda(compra_id, cliente_id, produto_id, data_compra, quantidade, valor_total,
+                     nome_cliente, nome_produto, total_gasto, notificacao_id, mensagem)
+    
+    def _invalidar_compras(self, *clientes):
+        # Compras novas mudam o total_gasto da linha do cliente e o resumo
+        self.clientes_cache.invalidar(*clientes)
+        self.resumos_cache.invalidar(*clientes)
+    
+    def get_resumo_cliente(self, cliente_id):
+        return self.resumos_cache.obter(cliente_id, self._ler_resumo_cliente)
+    
+    def _ler_resumo_cliente(self, cliente_id):
+        with self.pool.read() as conn:
+            return _consultar(conn, ResumoCliente, SQL_RESUMO_CLIENTE, (cliente_id,)).fetchone()
+    
+    def get_compras_cliente(self, cliente_id, after=None, limit=None):
+        # Mais recentes primeiro; after=(data_compra, id) da última compra recebida
+        params = {"cliente_id": cliente_id, "limite": -1 if limit is None else limit}
+        filtros = ""
+        if after is not None:
+            filtros = FILTRO_COMPRAS_APOS
+            params["data"], params["id"] = after
+        
+        with self.pool.read() as conn:
+            return _consultar(conn, CompraCliente, SQL_COMPRAS_CLIENTE.format(filtros=filtros),
+                              params).fetchall()
+    
+    def iter_compras_cliente(self, cliente_id, tamanho_lote=500, cancelar=None):
+        params = {"cliente_id": cliente_id, "limite": -1}
+        return self._iterar(SQL_COMPRAS_CLIENTE.format(filtros=""), params, tamanho_lote, cancelar,
+                            CompraCliente)
+    
+    def iter_compras(self, tamanho_lote=5000, cancelar=None):
+        # Todas as compras: (id, cliente_id, produto_id, produto, data_compra, quantidade, valor_total)
+        return self._iterar(SQL_EXPORTAR_COMPRAS, (), tamanho_lote, cancelar)
+    
+    def get_total_compras(self):
+        # Contagem pelos resumos mensais, sem percorrer a tabela de compras
+        with self.pool.read() as conn:
+            return conn.execute("SELECT coalesce(sum(vendas), 0) FROM resumo_vendas_mes").fetchone()[0]
+    
+    def get_estatisticas(self):
+        # Totais calculados no SQLite; só uma linha volta para o Python
+        with self.pool.read() as conn:
+            total, ativos, faturamento = conn.execute(SQL_ESTATISTICAS).fetchone()
+        
+        return {
+            "total_clientes": total,
+            "clientes_ativos": ativos,
+            "clientes_inativos": total - ativos,
+            "faturamento_total": faturamento,
+        }
+    
+    def get_top_clientes(self, limite=5):
+        # Os clientes que mais gastaram
+        with self.pool.read() as conn:
+            return _consultar(conn, TopCliente, SQL_TOP_CLIENTES, (limite,)).fetchall()
+    
+    def get_relatorio_vendas(self, inicio, fim, agrupamento="dia"):
+        # Vendas no intervalo [inicio, fim) (datas ISO "AAAA-MM-DD"),
+        # agregadas no SQLite por período e por produto. Totais e categorias
+        # saem das poucas linhas por produto, sem outra leitura do período.
+        if agrupamento not in AGRUPAMENTOS:
+            raise ValueError(f"Agrupamento inválido: {agrupamento}")
+        
+        params = {"inicio": inicio, "fim": fim,
+                  "mes_inicio": inicio[:7], "mes_fim": fim[:7]}
+        sql_periodo = SQL_RELATORIO_PERIODO.format(periodo=AGRUPAMENTOS[agrupamento])
+        # Meses inteiros são lidos dos resumos mensais; outros intervalos
+        # precisam da faixa correspondente de compras
+        meses_inteiros = inicio.endswith("-01") and fim.endswith("-01")
+        
+        with self.pool.read() as conn:
+            por_periodo = _consultar(conn, VendasPeriodo, sql_periodo, params).fetchall()
+            if meses_inteiros:
+                por_produto = _consultar(conn, VendasProduto, SQL_RESUMO_PRODUTOS, params).fetchall()
+                clientes = conn.execute(SQL_RESUMO_CLIENTES, params).fetchone()[0]
+            else:
+                por_produto = _consultar(conn, VendasProduto, SQL_RELATORIO_PRODUTOS, params).fetchall()
+                clientes = conn.execute(SQL_RELATORIO_CLIENTES, params).fetchone()[0]
+        
+        categorias = {}
+        for linha in por_produto:
+            acumulado = categorias.setdefault(linha.categoria or "Sem categoria", [0, 0, 0.0])
+            acumulado[0] += linha.vendas
+            acumulado[1] += linha.quantidade
+            acumulado[2] += linha.valor
+        por_categoria = sorted((VendasCategoria(categoria, *valores)
+                                for categoria, valores in categorias.items()),
+                               key=lambda linha: linha.valor, reverse=True)
+        
+        return {
+            "inicio": inicio,
+            "fim": fim,
+            "num_vendas": sum(linha.vendas for linha in por_produto),
+            "quantidade": sum(linha.quantidade for linha in por_produto),
+            "valor_total": sum(linha.valor for linha in por_produto),
+            "clientes_distintos": clientes,
+            "por_periodo": por_periodo,
+            "por_produto": por_produto,
+            "por_categoria": por_categoria,
+        }
+    
+    def get_vendas_mensais(self, meses=12):
+        # Totais dos últimos meses com vendas (mes no formato "AAAA-MM")
+        hoje = date.today()
+        ano, mes = divmod(hoje.year * 12 + hoje.month - 1 - (meses - 1), 12)
+        with self.pool.read() as conn:
+            return _consultar(conn, VendasMes, SQL_VENDAS_MENSAIS,
+                              (f"{ano:04d}-{mes + 1:02d}",)).fetchall()
+    
+    def get_configuracao(self, chave, padrao=None):
+        with self.pool.read() as conn:
+            linha = conn.execute("SELECT valor FROM configuracoes WHERE chave = ?", (chave,)).fetchone()
+        return padrao if linha is None else linha[0]
+    
+    def set_configuracao(self, chave, valor):
+        with self.pool.transaction() as conn:
+            conn.execute('''
+                INSERT INTO configuracoes (chave, valor) VALUES (?, ?)
+                ON CONFLICT (chave) DO UPDATE SET valor = excluded.valor
+            ''', (chave, valor))
+    
+    def fazer_backup(self, destino, progresso=None):
+        # Cópia online com a API de backup do SQLite, PAGINAS_BACKUP páginas
+        # por passo; destinos terminados em .gz são compactados com gzip.
+        # progresso(percentual) é chamado a cada passo.
+        copia = destino + ".copia"
+        parcial = destino + ".parcial"
+        compactar = destino.endswith(".gz")
+        peso_copia = 50 if compactar else 100
+        
+        def passo(status, restantes, total):
+            if progresso and total:
+                progresso((total - restantes) * peso_copia // total)
+        
+        try:
+            alvo = sqlite3.connect(copia)
+            try:
+                with self.pool.read() as conn:
+                    # Uma transação de leitura fixa o snapshot do WAL: sem ela
+                    # cada escrita de outra conexão recomeçaria a cópia
+                    conn.execute("BEGIN")
+                    conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+                    try:
+                        conn.backup(alvo, pages=self.PAGINAS_BACKUP, progress=passo)
+                    finally:
+                        conn.execute("COMMIT")
+                # A cópia fica em modo rollback: um arquivo só, sem -wal/-shm
+                alvo.execute("PRAGMA journal_mode = DELETE")
+            finally:
+                alvo.close()
+            
+            if compactar:
+                total = os.path.getsize(copia)
+                with open(copia, "rb") as origem, gzip.open(parcial, "wb", self.COMPRESSAO_BACKUP) as saida:
+                    while True:
+                        bloco = origem.read(1 << 20)
+                        if not bloco:
+                            break
+                        saida.write(bloco)
+                        if progresso:
+                            progresso(50 + origem.tell() * 50 // max(total, 1))
+                os.remove(copia)
+            else:
+                os.replace(copia, parcial)
+            os.replace(parcial, destino)
+        finally:
+            for resto in (copia, parcial):
+                if os.path.exists(resto):
+                    os.remove(resto)
+        
+        return os.path.getsize(destino)
+    
+    def restaurar_backup(self, origem, progresso=None):
+        # Substitui todo o conteúdo do banco pelo backup `origem` (.gz ou
+        # não), depois de conferi-lo com PRAGMA integrity_check. Backups de
+        # versões anteriores passam pelas migrações pendentes.
+        pasta = os.path.dirname(os.path.abspath(self.db_name))
+        temporario = os.path.join(pasta, f".restauracao_{os.getpid()}.db")
+        
+        try:
+            abrir = gzip.open if origem.endswith(".gz") else open
+            with abrir(origem, "rb") as entrada, open(temporario, "wb") as saida:
+                shutil.copyfileobj(entrada, saida, 1 << 20)
+            if progresso:
+                progresso(20)
+            
+            backup = sqlite3.connect(temporario)
+            try:
+                try:
+                    problemas = [linha[0] for linha in backup.execute("PRAGMA integrity_check")]
+                    tabelas = {linha[0] for linha in backup.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+                except sqlite3.DatabaseError as e:
+                    raise ValueError(f"O arquivo não é um banco SQLite válido: {e}") from None
+                if problemas != ["ok"]:
+                    raise ValueError("Backup corrompido: " + "; ".join(problemas[:5]))
+                if not {"clientes", "compras", "produtos"} <= tabelas:
+                    raise ValueError("O arquivo não é um backup do Tabacaria CRM")
+                if progresso:
+                    progresso(40)
+                
+                def passo(status, restantes, total):
+                    if progresso and total:
+                        progresso(40 + (total - restantes) * 55 // total)
+                
+                with self.pool.exclusive() as conn:
+                    backup.backup(conn, pages=self.PAGINAS_BACKUP, progress=passo)
+            finally:
+                backup.close()
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        
+        self.init_db()
+        self.produtos.invalidar()
+        self.clientes_cache.limpar()
+        self.resumos_cache.limpar()
+        if progresso:
+            progresso(100)
+    
+    def reconstruir_resumos(self):
+        # Refaz todas as tabelas de resumo a partir de compras
+        with self.pool.transaction() as conn:
+            _reconstruir_resumos(conn.cursor())
+    
+    def verificar_resumos(self):
+        # Retorna {tabela: linhas divergentes} comparando cada resumo com o
+        # agrupamento calculado diretamente de compras
+        divergencias = {}
+        with self.pool.read() as conn:
+            for tabela, chaves, expressoes in RESUMOS_VENDAS:
+                esperado = f"""
+                    SELECT {", ".join(chaves)}, vendas, quantidade, round(valor, 2) FROM (
+                        SELECT {", ".join(f"{e.format(linha='compras')} AS {c}" for c, e in zip(chaves, expressoes))},
+                               COUNT(*) AS vendas, SUM(coalesce(quantidade, 0)) AS quantidade,
+                               SUM(coalesce(valor_total, 0)) AS valor
+                        FROM compras
+                        GROUP BY {", ".join(chaves)}
+                    )
+                """
+                atual = f"SELECT {', '.join(chaves)}, vendas, quantidade, round(valor, 2) FROM {tabela}"
+                faltando = conn.execute(f"SELECT COUNT(*) FROM ({esperado} EXCEPT {atual})").fetchone()[0]
+                sobrando = conn.execute(f"SELECT COUNT(*) FROM ({atual} EXCEPT {esperado})").fetchone()[0]
+                if faltando or sobrando:
+                    divergencias[tabela] = faltando + sobrando
+        return divergencias
+    
+    def get_relatorio_mensal(self, ano, mes, agrupamento="dia"):
+        inicio = date(ano, mes, 1)
+        fim = date(ano + 1, 1, 1) if mes == 12 else date(ano, mes + 1, 1)
+        return self.get_relatorio_vendas(inicio.isoformat(), fim.isoformat(), agrupamento)
+    
+    def get_produtos(self):
+        return self.produtos.listar()
+    
+    def get_produto(self, produto_id, validar=True):
+        # validar=False responde só da memória, sem tocar no banco
+        return self.produtos.obter(produto_id, validar)
+    
+    def add_produtos_many(self, produtos):
+        # (nome, categoria, preco) em uma única transação
+        with self.pool.transaction() as conn:
+            cursor = conn.executemany(
+                'INSERT INTO produtos (nome, categoria, preco) VALUES (?, ?, ?)', produtos)
+            self.pool.apos_commit(self.produtos.invalidar)
+        
+        return cursor.rowcount
+    
+    def get_estatisticas_cache(self):
+        return {"produtos": self.produtos.estatisticas(),
+                "clientes": self.clientes_cache.estatisticas(),
+                "resumos_clientes": self.resumos_cache.estatisticas()}
+    
+    def adiar_indices(self, tabela):
+        # Remove os índices e triggers de `tabela` (guardando o SQL em
+        # objetos_adiados) para acelerar uma carga grande; restaurar_indices()
+        # os recria e refaz o que os triggers manteriam (FTS, resumos)
+        with self.pool.transaction() as conn:
+            objetos = conn.execute('''
+                SELECT type, name, sql FROM sqlite_master
+                WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL
+            ''', (tabela,)).fetchall()
+            
+            for tipo, nome, sql in objetos:
+                conn.execute("INSERT INTO objetos_adiados (nome, tabela, sql) VALUES (?, ?, ?)",
+                             (nome, tabela, sql))
+                conn.execute(f'DROP {tipo.upper()} "{nome}"')
+    
+    def restaurar_indices(self):
+        with self.pool.read() as conn:
+            if conn.execute("SELECT 1 FROM objetos_adiados LIMIT 1").fetchone() is None:
+                return
+        
+        # Recriar e reconstruir na mesma transação: quem ler durante a
+        # restauração vê o estado antigo ou o completo, nunca um meio termo
+        with self.pool.transaction() as conn:
+            cursor = conn.cursor()
+            objetos = cursor.execute("SELECT nome, tabela, sql FROM objetos_adiados").fetchall()
+            
+            for nome, tabela, sql in objetos:
+                cursor.execute(sql)
+            for tabela in sorted({tabela for _, tabela, _ in objetos}):
+                if tabela in RECONSTRUCOES_ADIADAS:
+                    RECONSTRUCOES_ADIADAS[tabela](cursor)
+            
+            cursor.execute("DELETE FROM objetos_adiados")
+    
+    def add_notificacao(self, notificacao_data):
+        with self.pool.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_INSERIR_NOTIFICACAO, notificacao_data)
+        
+        return cursor.lastrowid
+    
+    def add_notificacoes_many(self, notificacoes):
+        # Várias notificações em uma única transação; devolve quantas foram gravadas
+        with self.pool.transaction() as conn:
+            cursor = conn.executemany(SQL_INSERIR_NOTIFICACAO, notificacoes)
+        
+        return cursor.rowcount
+    
+    def get_notificacoes_hoje(self):
+        hoje = date.today().strftime("%Y-%m-%d")
+        
+        with self.pool.read() as conn:
+            return _consultar(conn, Notificacao, SQL_NOTIFICACOES_HOJE, (hoje,)).fetchall()
+    
+    def get_aniversariantes_mes(self):
+        mes_atual = date.today().strftime("%m")
+        
+        with self.pool.read() as conn:
+            cursor = _consultar(conn, Aniversariante, SQL_ANIVERSARIANTES_MES,
+                                {"inicio": f"{mes_atual}-01", "fim": f"{mes_atual}-31"})
+            
+            return cursor.fetchall()
+    
+    def get_aniversariantes_sem_aviso(self, dia=None):
+        # Aniversariantes do dia ainda não notificados nesse dia
+        dia = dia or date.today()
+        
+        with self.pool.read() as conn:
+            return _consultar(conn, ClienteNome, SQL_ANIVERSARIANTES_SEM_AVISO, {
+                "dia": dia.strftime("%m-%d"),
+                "hoje": dia.strftime("%Y-%m-%d"),
+            }).fetchall()
+    
+    def marcar_notificacao_lida(self, notificacao_id):
+        with self.pool.transaction() as conn:
+            conn.execute('''
+                UPDATE notificacoes 
+                SET lida = 1 
+                WHERE id = ?
+            ''', (notificacao_id,))
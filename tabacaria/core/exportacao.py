@@ -0,0 +1,118 @@
+import os
+import csv
+import json
+from itertools import islice
+
+def _escrever_csv(caminho, colunas, lotes):
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(nome for nome, _ in colunas)
+        for lote in lotes:
+            escritor.writerows(lote)
+
+def _escrever_jsonl(caminho, colunas, lotes):
+    nomes = [nome for nome, _ in colunas]
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for lote in lotes:
+            arquivo.writelines(json.dumps(dict(zip(nomes, linha)), ensure_ascii=False) + "\n"
+                               for linha in lote)
+
+def _escrever_parquet(caminho, colunas, lotes):
+    # Um row group por lote; pyarrow é opcional e só é importado aqui
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("A exportação em Parquet requer o pacote pyarrow") from None
+    
+    tipos = {"int": pa.int64(), "float": pa.float64(), "str": pa.string()}
+    schema = pa.schema([(nome, tipos[tipo]) for nome, tipo in colunas])
+    with pq.ParquetWriter(caminho, schema) as escritor:
+        for lote in lotes:
+            escritor.write_table(pa.Table.from_arrays(
+                [pa.array(valores, type=campo.type) for valores, campo in zip(zip(*lote), schema)],
+                schema=schema))
+
+class Exportador:
+    # Exporta clientes, compras ou o relatório de um mês para CSV, JSONL ou
+    # Parquet. As linhas saem do banco em lotes de tamanho_lote e são
+    # gravadas conforme chegam, então a memória usada não depende do tamanho
+    # da tabela. O arquivo é escrito ao lado com o sufixo .parcial e só
+    # substitui o destino quando a exportação termina.
+    FORMATOS = {"csv": _escrever_csv, "jsonl": _escrever_jsonl, "parquet": _escrever_parquet}
+    TAMANHO_LOTE = 10000
+    COLUNAS = {
+        "clientes": (("id", "int"), ("nome", "str"), ("telefone", "str"), ("email", "str"),
+                     ("data_nascimento", "str"), ("data_cadastro", "str"), ("preferencias", "str"),
+                     ("observacoes", "str"), ("fumante_ativo", "int"), ("total_gasto", "float")),
+        "compras": (("id", "int"), ("cliente_id", "int"), ("produto_id", "int"), ("produto", "str"),
+                    ("data_compra", "str"), ("quantidade", "int"), ("valor_total", "float")),
+        "relatorio_periodos": (("periodo", "str"), ("vendas", "int"), ("quantidade", "int"),
+                               ("valor", "float")),
+        "relatorio_produtos": (("produto_id", "int"), ("produto", "str"), ("categoria", "str"),
+                               ("vendas", "int"), ("quantidade", "int"), ("valor", "float")),
+    }
+    CONJUNTOS = tuple(COLUNAS)
+    
+    def __init__(self, db, tamanho_lote=TAMANHO_LOTE):
+        self.db = db
+        self.tamanho_lote = tamanho_lote
+    
+    @classmethod
+    def formato_do_arquivo(cls, caminho):
+        formato = os.path.splitext(caminho)[1].lower().lstrip(".")
+        if formato not in cls.FORMATOS:
+            raise ValueError(f"Formato de exportação não suportado: {caminho}")
+        return formato
+    
+    def _linhas(self, conjunto, ano, mes, agrupamento):
+        # (linhas, total de linhas para o progresso)
+        if conjunto == "clientes":
+            return (self.db.iter_clientes(self.tamanho_lote, tipo=None),
+                    self.db.get_estatisticas()["total_clientes"])
+        if conjunto == "compras":
+            return self.db.iter_compras(self.tamanho_lote), self.db.get_total_compras()
+        
+        if ano is None or mes is None:
+            raise ValueError("Os relatórios exigem ano e mês")
+        relatorio = self.db.get_relatorio_mensal(ano, mes, agrupamento)
+        linhas = relatorio["por_periodo" if conjunto == "relatorio_periodos" else "por_produto"]
+        return iter(linhas), len(linhas)
+    
+    def exportar(self, conjunto, caminho, formato=None, progresso=None, cancelar=None,
+                 ano=None, mes=None, agrupamento="dia"):
+        # progresso(linhas_gravadas, total) a cada lote; com `cancelar`
+        # sinalizado a exportação para e o arquivo parcial é apagado
+        if conjunto not in self.COLUNAS:
+            raise ValueError(f"Conjunto de exportação inválido: {conjunto}")
+        escrever = self.FORMATOS[formato or self.formato_do_arquivo(caminho)]
+        
+        linhas, total = self._linhas(conjunto, ano, mes, agrupamento)
+        resultado = {"conjunto": conjunto, "caminho": caminho, "linhas": 0, "cancelado": False}
+        
+        def lotes():
+            while True:
+                lote = list(islice(linhas, self.tamanho_lote))
+                if not lote:
+                    return
+                yield lote
+                resultado["linhas"] += len(lote)
+                if progresso:
+                    progresso(resultado["linhas"], total)
+                if cancelar is not None and cancelar.is_set():
+                    resultado["cancelado"] = True
+                    return
+        
+        parcial = caminho + ".parcial"
+        try:
+            escrever(parcial, self.COLUNAS[conjunto], lotes())
+            if not resultado["cancelado"]:
+                os.replace(parcial, caminho)
+        finally:
+            # Devolve a conexão de leitura mesmo se a escrita parar no meio
+            if hasattr(linhas, "close"):
+                linhas.close()
+            if os.path.exists(parcial):
+                os.remove(parcial)
+        
+        return resultado
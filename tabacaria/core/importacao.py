@@ -0,0 +1,302 @@
+import os
+import re
+import csv
+import json
+from datetime import datetime, date
+
+def _normalizar_telefone(telefone):
+    return "".join(c for c in telefone if c.isdigit())
+
+def _normalizar_email(email):
+    return email.strip().lower()
+
+def _campo(registro, nome):
+    valor = registro.get(nome)
+    return "" if valor is None else str(valor).strip()
+
+def _data(texto):
+    # Aceita AAAA-MM-DD (também com hora) e DD/MM/AAAA; devolve AAAA-MM-DD
+    try:
+        if len(texto) >= 10 and texto[4] == "-":
+            return date.fromisoformat(texto[:10]).isoformat()
+        return datetime.strptime(texto, "%d/%m/%Y").date().isoformat()
+    except ValueError:
+        raise ValueError(f"data inválida: {texto!r}") from None
+
+def _numero(texto):
+    # Aceita 1234.56, 1,234.56 e o formato brasileiro 1.234,56: o último
+    # separador é o decimal e o outro só pode separar grupos de milhar
+    # (repetido e sozinho, como em 1.234.567, só pode ser milhar). Um único
+    # separador seguido de três dígitos ("1.500", "1,500") pode ser milhar ou
+    # decimal conforme a planilha e é recusado
+    numero = texto
+    posicao = max(texto.rfind(","), texto.rfind("."))
+    if posicao >= 0:
+        separador = texto[posicao]
+        outro = "." if separador == "," else ","
+        if texto.count(separador) > 1 and outro not in texto:
+            inteiro, fracao, milhar = texto, "", separador
+        else:
+            inteiro, fracao, milhar = texto[:posicao], texto[posicao + 1:], outro
+            if (milhar not in inteiro and re.fullmatch(r"\d{3}", fracao)
+                    and re.fullmatch(r"[-+]?[1-9]\d{0,2}", inteiro)):
+                raise ValueError(f"número ambíguo: {texto!r} (use 1.500,00 ou 1500)")
+        if milhar in inteiro and not re.fullmatch(rf"[-+]?\d{{1,3}}(\{milhar}\d{{3}})+", inteiro):
+            raise ValueError(f"número inválido: {texto!r}")
+        numero = f"{inteiro.replace(milhar, '')}.{fracao}"
+    try:
+        return float(numero)
+    except ValueError:
+        raise ValueError(f"número inválido: {texto!r}") from None
+
+def _valor(registro, nome):
+    # Campo numérico opcional (None se vazio). Números do JSON não têm
+    # separador a interpretar; só o texto passa por _numero
+    valor = registro.get(nome)
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return float(valor)
+    texto = _campo(registro, nome)
+    return _numero(texto) if texto else None
+
+def _inteiro(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        raise ValueError(f"número inteiro inválido: {texto!r}") from None
+
+BOOLEANOS = {"1": 1, "true": 1, "sim": 1, "s": 1, "0": 0, "false": 0, "não": 0, "nao": 0, "n": 0}
+
+def _ler_registros(caminho, lidos):
+    # Gera (número da linha, registro) de um CSV com cabeçalho (separado por
+    # vírgula ou ponto e vírgula) ou de um arquivo JSONL, sem carregá-lo
+    # inteiro; registro é None se a linha não for um objeto JSON válido.
+    # lidos[0] acumula os bytes consumidos, para o progresso.
+    def linhas(arquivo):
+        for linha in arquivo:
+            lidos[0] += len(linha)
+            yield linha.decode("utf-8-sig")
+    
+    with open(caminho, "rb") as arquivo:
+        if caminho.lower().endswith((".jsonl", ".ndjson")):
+            for numero, linha in enumerate(linhas(arquivo), 1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    registro = None
+                yield numero, registro if isinstance(registro, dict) else None
+            return
+        
+        texto = linhas(arquivo)
+        cabecalho = next(texto, "")
+        separador = ";" if cabecalho.count(";") > cabecalho.count(",") else ","
+        colunas = [c.strip().lower() for c in next(csv.reader([cabecalho], delimiter=separador), [])]
+        leitor = csv.DictReader(texto, fieldnames=colunas, delimiter=separador)
+        for registro in leitor:
+            yield leitor.line_num + 1, registro
+
+class Importador:
+    # Importa clientes, produtos ou vendas de CSV/JSONL em lotes de
+    # tamanho_lote registros, cada lote em uma transação. Linhas inválidas
+    # são contadas e puladas; clientes já cadastrados (mesmo telefone ou
+    # e-mail) e produtos com o mesmo nome contam como duplicados.
+    #
+    # Colunas: clientes(nome, telefone, email, data_nascimento, data_cadastro,
+    # preferencias, observacoes, fumante_ativo); produtos(nome, categoria,
+    # preco); vendas(cliente_id ou telefone ou email, produto_id ou produto,
+    # data_compra, quantidade, valor_total). Em vendas, quantidade vale 1 e
+    # valor_total vale preço x quantidade quando ausentes.
+    TIPOS = ("clientes", "produtos", "vendas")
+    TAMANHO_LOTE = 5000
+    # Arquivos a partir deste tamanho adiam índices e triggers da tabela
+    # de destino; abaixo disso reconstruí-los custaria mais que a carga
+    LIMIAR_ADIAR_INDICES = 8 * 1024 * 1024
+    MAX_ERROS = 100  # erros guardados no resultado; os demais são só contados
+    TABELAS = {"clientes": "clientes", "produtos": "produtos", "vendas": "compras"}
+    
+    def __init__(self, db, tamanho_lote=TAMANHO_LOTE):
+        self.db = db
+        self.tamanho_lote = tamanho_lote
+    
+    def importar(self, tipo, caminho, progresso=None, cancelar=None, adiar_indices=None):
+        # progresso(bytes_lidos, bytes_total, resultado) é chamado a cada lote;
+        # com `cancelar` sinalizado a importação para após o lote atual
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de importação inválido: {tipo}")
+        
+        total = os.path.getsize(caminho)
+        if adiar_indices is None:
+            adiar_indices = total >= self.LIMIAR_ADIAR_INDICES
+        converter, gravar = getattr(self, f"_preparar_{tipo}")()
+        
+        resultado = {"tipo": tipo, "lidos": 0, "importados": 0, "duplicados": 0,
+                     "invalidos": 0, "erros": [], "cancelado": False}
+        lidos = [0]
+        
+        def gravar_lote(lote):
+            gravar(lote)
+            resultado["importados"] += len(lote)
+            if progresso:
+                progresso(lidos[0], total, resultado)
+        
+        if adiar_indices:
+            self.db.adiar_indices(self.TABELAS[tipo])
+        try:
+            lote = []
+            for numero, registro in _ler_registros(caminho, lidos):
+                resultado["lidos"] += 1
+                try:
+                    if registro is None:
+                        raise ValueError("JSON inválido")
+                    linha = converter(registro)
+                except ValueError as e:
+                    resultado["invalidos"] += 1
+                    if len(resultado["erros"]) < self.MAX_ERROS:
+                        resultado["erros"].append((numero, str(e)))
+                    continue
+                
+                if linha is None:
+                    resultado["duplicados"] += 1
+                    continue
+                
+                lote.append(linha)
+                if len(lote) >= self.tamanho_lote:
+                    gravar_lote(lote)
+                    lote = []
+                    if cancelar is not None and cancelar.is_set():
+                        resultado["cancelado"] = True
+                        break
+            
+            if lote:
+                gravar_lote(lote)
+        finally:
+            if adiar_indices:
+                self.db.restaurar_indices()
+        
+        if progresso and not resultado["cancelado"]:
+            progresso(total, total, resultado)
+        return resultado
+    
+    def _contatos(self, ids=None):
+        # Mapas telefone normalizado -> id e e-mail normalizado -> id dos
+        # clientes cadastrados; se `ids` for um set, recebe todos os ids
+        telefones, emails = {}, {}
+        for cliente_id, telefone, email in self.db.iter_contatos_clientes():
+            if ids is not None:
+                ids.add(cliente_id)
+            telefone = _normalizar_telefone(telefone or "")
+            email = _normalizar_email(email or "")
+            if telefone:
+                telefones.setdefault(telefone, cliente_id)
+            if email:
+                emails.setdefault(email, cliente_id)
+        return telefones, emails
+    
+    def _preparar_clientes(self):
+        telefones, emails = self._contatos()
+        hoje = date.today().isoformat()
+        
+        def converter(registro):
+            nome = _campo(registro, "nome")
+            if not nome:
+                raise ValueError("nome é obrigatório")
+            telefone = _campo(registro, "telefone")
+            email = _campo(registro, "email")
+            
+            chave_telefone = _normalizar_telefone(telefone)
+            chave_email = _normalizar_email(email)
+            if chave_telefone in telefones or chave_email in emails:
+                return None
+            
+            nascimento = _campo(registro, "data_nascimento")
+            cadastro = _campo(registro, "data_cadastro")
+            fumante = _campo(registro, "fumante_ativo").lower()
+            if fumante and fumante not in BOOLEANOS:
+                raise ValueError(f"fumante_ativo inválido: {fumante!r}")
+            
+            linha = (nome, telefone, email,
+                     _data(nascimento) if nascimento else None,
+                     _data(cadastro) if cadastro else hoje,
+                     _campo(registro, "preferencias"), _campo(registro, "observacoes"),
+                     BOOLEANOS.get(fumante, 1))
+            
+            # Duplicados dentro do próprio arquivo também são descartados
+            if chave_telefone:
+                telefones[chave_telefone] = None
+            if chave_email:
+                emails[chave_email] = None
+            return linha
+        
+        return converter, self.db.add_clientes_many
+    
+    def _preparar_produtos(self):
+        nomes = {p.nome.casefold() for p in self.db.get_produtos()}
+        
+        def converter(registro):
+            nome = _campo(registro, "nome")
+            if not nome:
+                raise ValueError("nome é obrigatório")
+            if nome.casefold() in nomes:
+                return None
+            preco = _valor(registro, "preco")
+            if preco is None:
+                raise ValueError("preço é obrigatório")
+            if preco < 0:
+                raise ValueError("preço negativo")
+            nomes.add(nome.casefold())
+            return (nome, _campo(registro, "categoria"), preco)
+        
+        return converter, self.db.add_produtos_many
+    
+    def _preparar_vendas(self):
+        ids = set()
+        telefones, emails = self._contatos(ids)
+        produtos = self.db.get_produtos()
+        precos = {p.id: p.preco for p in produtos}
+        por_nome = {p.nome.casefold(): p.id for p in produtos}
+        
+        def converter(registro):
+            cliente = _campo(registro, "cliente_id")
+            if cliente:
+                cliente_id = _inteiro(cliente)
+                if cliente_id not in ids:
+                    raise ValueError(f"cliente {cliente_id} não existe")
+            else:
+                telefone = _normalizar_telefone(_campo(registro, "telefone"))
+                email = _normalizar_email(_campo(registro, "email"))
+                cliente_id = telefones.get(telefone) if telefone else None
+                if cliente_id is None and email:
+                    cliente_id = emails.get(email)
+                if cliente_id is None:
+                    raise ValueError("cliente não encontrado pelo telefone/e-mail")
+            
+            produto = _campo(registro, "produto_id")
+            if produto:
+                produto_id = _inteiro(produto)
+            else:
+                produto_id = por_nome.get(_campo(registro, "produto").casefold())
+            if produto_id not in precos:
+                raise ValueError("produto não encontrado")
+            
+            data_compra = _campo(registro, "data_compra")
+            if not data_compra:
+                raise ValueError("data_compra é obrigatória")
+            quantidade = _campo(registro, "quantidade")
+            quantidade = _inteiro(quantidade) if quantidade else 1
+            if quantidade <= 0:
+                raise ValueError("quantidade deve ser positiva")
+            valor_total = _valor(registro, "valor_total")
+            if valor_total is None:
+                valor_total = precos[produto_id] * quantidade
+            
+            return (cliente_id, produto_id, _data(data_compra), quantidade, valor_total)
+        
+        return converter, self.db.add_compras_many
+
+def resumo_importacao(resultado):
+    resumo = (f"{resultado['importados']} importado(s), {resultado['duplicados']} duplicado(s), "
+              f"{resultado['invalidos']} inválido(s) de {resultado['lidos']} registro(s) lido(s)")
+    if resultado["cancelado"]:
+        resumo += " (cancelada)"
+    return resumo
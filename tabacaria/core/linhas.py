@@ -0,0 +1,94 @@
+# Linhas tipadas devolvidas pelo DatabaseManager, no lugar de tuplas lidas
+# por posição. Cada classe declara em __slots__ só as colunas que a sua
+# consulta seleciona, na ordem do SELECT: sem __dict__ por objeto, uma lista
+# grande ocupa menos que as tuplas de SELECT *. São iteráveis na ordem das
+# colunas (exportação e API usam zip) e compartilhadas pelos caches: não
+# altere os atributos de uma linha recebida.
+
+class Linha:
+    __slots__ = ()
+
+    def __init_subclass__(cls):
+        # __init__ com uma atribuição por coluna, gerado como o de
+        # namedtuple: bem mais rápido que um laço com setattr por linha
+        campos = cls.__slots__
+        codigo = f"def __init__(self, {', '.join(campos)}):\n"
+        codigo += "".join(f"    self.{campo} = {campo}\n" for campo in campos) or "    pass\n"
+        escopo = {}
+        exec(codigo, escopo)
+        cls.__init__ = escopo["__init__"]
+
+    @classmethod
+    def fabrica(cls, cursor, valores):
+        # Para cursor.row_factory
+        return cls(*valores)
+
+    @classmethod
+    def colunas(cls, tabela=None):
+        # Lista de colunas para o SELECT, opcionalmente qualificadas
+        prefixo = f"{tabela}." if tabela else ""
+        return ", ".join(prefixo + campo for campo in cls.__slots__)
+
+    def __iter__(self):
+        return (getattr(self, campo) for campo in self.__slots__)
+
+    def __eq__(self, outra):
+        return type(outra) is type(self) and tuple(self) == tuple(outra)
+
+    __hash__ = None
+
+    def __repr__(self):
+        valores = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.__slots__)
+        return f"{type(self).__name__}({valores})"
+
+    def como_dict(self):
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+class Cliente(Linha):
+    __slots__ = ("id", "nome", "telefone", "email", "data_nascimento", "data_cadastro",
+                 "preferencias", "observacoes", "fumante_ativo", "total_gasto")
+
+class CartaoCliente(Linha):
+    # O que o cartão da lista de clientes mostra
+    __slots__ = ("id", "nome", "telefone", "email", "data_nascimento", "fumante_ativo",
+                 "total_gasto")
+
+class ClienteNome(Linha):
+    __slots__ = ("id", "nome")
+
+class CompraCliente(Linha):
+    __slots__ = ("data_compra", "produto", "quantidade", "valor_total", "id")
+
+class Venda(Linha):
+    # O que registrar_venda devolve: a compra gravada, os nomes que a tela
+    # mostra, o novo total gasto do cliente e a notificação criada
+    __slots__ = ("id", "cliente_id", "produto_id", "data_compra", "quantidade", "valor_total",
+                 "cliente", "produto", "total_gasto", "notificacao_id", "mensagem")
+
+class ResumoCliente(Linha):
+    __slots__ = ("compras", "quantidade", "valor_total", "primeira_compra", "ultima_compra")
+
+class TopCliente(Linha):
+    __slots__ = ("id", "nome", "total_gasto")
+
+# Linhas dos relatórios de vendas; os nomes são os campos da exportação e da API
+class VendasPeriodo(Linha):
+    __slots__ = ("periodo", "vendas", "quantidade", "valor")
+
+class VendasMes(Linha):
+    __slots__ = ("mes", "vendas", "quantidade", "valor")
+
+class VendasProduto(Linha):
+    __slots__ = ("produto_id", "produto", "categoria", "vendas", "quantidade", "valor")
+
+class VendasCategoria(Linha):
+    __slots__ = ("categoria", "vendas", "quantidade", "valor")
+
+class Produto(Linha):
+    __slots__ = ("id", "nome", "categoria", "preco")
+
+class Notificacao(Linha):
+    __slots__ = ("id", "titulo", "mensagem", "data_notificacao", "tipo", "cliente_id", "lida")
+
+class Aniversariante(Linha):
+    __slots__ = ("id", "nome", "data_nascimento")
@@ -0,0 +1,286 @@
+# Migrações de schema, aplicadas em ordem e uma única vez por banco.
+# O número de cada migração é gravado em PRAGMA user_version; nunca altere
+# uma migração já publicada, acrescente uma nova ao final da lista.
+def _migracao_tabelas_base(cursor):
+    # Tabela de clientes
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS clientes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            telefone TEXT,
+            email TEXT,
+            data_nascimento DATE,
+            data_cadastro DATE,
+            preferencias TEXT,
+            observacoes TEXT,
+            fumante_ativo INTEGER DEFAULT 1,
+            total_gasto REAL DEFAULT 0
+        )
+    ''')
+
+    # Tabela de produtos
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS produtos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            categoria TEXT,
+            preco REAL
+        )
+    ''')
+
+    # Tabela de compras
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS compras (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER,
+            produto_id INTEGER,
+            data_compra DATE,
+            quantidade INTEGER,
+            valor_total REAL,
+            FOREIGN KEY (cliente_id) REFERENCES clientes (id),
+            FOREIGN KEY (produto_id) REFERENCES produtos (id)
+        )
+    ''')
+
+    # Tabela de notificações
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notificacoes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            titulo TEXT NOT NULL,
+            mensagem TEXT,
+            data_notificacao DATE,
+            tipo TEXT,
+            cliente_id INTEGER,
+            lida INTEGER DEFAULT 0,
+            FOREIGN KEY (cliente_id) REFERENCES clientes (id)
+        )
+    ''')
+
+    # Inserir alguns produtos de exemplo
+    cursor.execute("SELECT COUNT(*) FROM produtos")
+    if cursor.fetchone()[0] == 0:
+        produtos_exemplo = [
+            ('Cigarro Marlboro', 'Cigarro', 10.00),
+            ('Cigarro Camel', 'Cigarro', 9.50),
+            ('Charuto Cubano', 'Charuto', 45.00),
+            ('Fumo de Corda', 'Fumo', 8.00),
+            ('Cigarro Parliament', 'Cigarro', 11.00),
+            ('Narguilé', 'Acessório', 120.00),
+            ('Isqueiro Zippo', 'Acessório', 85.00)
+        ]
+        cursor.executemany('INSERT INTO produtos (nome, categoria, preco) VALUES (?, ?, ?)', produtos_exemplo)
+
+def _migracao_indices(cursor):
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_clientes_nome ON clientes (nome COLLATE NOCASE)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_compras_cliente_data ON compras (cliente_id, data_compra)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_notificacoes_data_lida ON notificacoes (data_notificacao, lida)")
+
+# Acentos do português removidos no índice de busca; o tokenizer trigram
+# já ignora maiúsculas/minúsculas, então basta mapear para a letra base
+# (a lista é curta de propósito: replace() aninhado demais estoura a pilha
+# do parser do SQLite)
+ACENTOS = {
+    "a": "áàâãÁÀÂÃ",
+    "e": "éêÉÊ",
+    "i": "íÍ",
+    "o": "óôõÓÔÕ",
+    "u": "úüÚÜ",
+    "c": "çÇ",
+}
+
+# Mesmo mapeamento dos triggers, para que consulta e índice sempre concordem
+_TABELA_ACENTOS = str.maketrans({letra: base for base, acentuadas in ACENTOS.items()
+                                 for letra in acentuadas})
+
+def sem_acentos(texto):
+    return texto.translate(_TABELA_ACENTOS)
+
+def _sql_sem_acentos(expressao):
+    # Feito em SQL puro para que os triggers funcionem em qualquer conexão,
+    # inclusive ferramentas externas que não conhecem funções do Python
+    for base, acentuadas in ACENTOS.items():
+        for letra in acentuadas:
+            expressao = f"replace({expressao}, '{letra}', '{base}')"
+    return expressao
+
+COLUNAS_FTS = ("nome", "telefone", "email", "preferencias", "observacoes")
+
+def _sql_valores_fts(origem):
+    return ", ".join(_sql_sem_acentos(f"coalesce({origem}.{col}, '')") for col in COLUNAS_FTS)
+
+def _popular_fts(cursor):
+    cursor.execute(f'''
+        INSERT INTO clientes_fts (rowid, {", ".join(COLUNAS_FTS)})
+        SELECT id, {_sql_valores_fts("clientes")} FROM clientes
+    ''')
+
+def _reconstruir_fts(cursor):
+    cursor.execute("DELETE FROM clientes_fts")
+    _popular_fts(cursor)
+
+def _migracao_busca_fts(cursor):
+    lista = ", ".join(COLUNAS_FTS)
+    valores = _sql_valores_fts
+    
+    cursor.execute(f"CREATE VIRTUAL TABLE clientes_fts USING fts5({lista}, tokenize='trigram')")
+    
+    cursor.execute(f'''
+        CREATE TRIGGER clientes_fts_ai AFTER INSERT ON clientes BEGIN
+            INSERT INTO clientes_fts (rowid, {lista}) VALUES (new.id, {valores("new")});
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER clientes_fts_ad AFTER DELETE ON clientes BEGIN
+            DELETE FROM clientes_fts WHERE rowid = old.id;
+        END
+    ''')
+    # Somente as colunas indexadas: atualizar total_gasto não mexe no índice
+    cursor.execute(f'''
+        CREATE TRIGGER clientes_fts_au AFTER UPDATE OF {lista} ON clientes BEGIN
+            DELETE FROM clientes_fts WHERE rowid = old.id;
+            INSERT INTO clientes_fts (rowid, {lista}) VALUES (new.id, {valores("new")});
+        END
+    ''')
+    
+    _popular_fts(cursor)
+
+def _migracao_indice_gastos(cursor):
+    # Atende o top N por gasto e, por ser de cobertura, as contagens e somas
+    # de get_estatisticas sem ler as linhas completas de clientes
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_clientes_gasto ON clientes (total_gasto, fumante_ativo)")
+
+def _migracao_indice_compras_data(cursor):
+    # Índice de cobertura: os relatórios de um período leem só a faixa de
+    # datas do índice, sem tocar nas linhas de compras
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_compras_data
+        ON compras (data_compra, produto_id, cliente_id, quantidade, valor_total)
+    ''')
+
+# Tabelas de resumo de vendas: (tabela, colunas da chave, expressão de cada
+# coluna a partir de uma linha de compras). Mantidas pelos triggers de
+# compras na mesma transação da venda; reconstruir_resumos as refaz do zero.
+RESUMOS_VENDAS = (
+    ("resumo_vendas_dia", ("data",), ("{linha}.data_compra",)),
+    ("resumo_vendas_mes", ("mes",), ("substr({linha}.data_compra, 1, 7)",)),
+    ("resumo_vendas_produto_mes", ("mes", "produto_id"),
+     ("substr({linha}.data_compra, 1, 7)", "{linha}.produto_id")),
+    ("resumo_vendas_cliente_mes", ("mes", "cliente_id"),
+     ("substr({linha}.data_compra, 1, 7)", "{linha}.cliente_id")),
+)
+
+def _sql_somar_resumo(tabela, chaves, expressoes, linha):
+    valores = ", ".join(e.format(linha=linha) for e in expressoes)
+    return f'''
+        INSERT INTO {tabela} ({", ".join(chaves)}, vendas, quantidade, valor)
+        VALUES ({valores}, 1, coalesce({linha}.quantidade, 0), coalesce({linha}.valor_total, 0))
+        ON CONFLICT ({", ".join(chaves)}) DO UPDATE SET
+            vendas = vendas + excluded.vendas,
+            quantidade = quantidade + excluded.quantidade,
+            valor = valor + excluded.valor;
+    '''
+
+def _sql_subtrair_resumo(tabela, chaves, expressoes, linha):
+    filtro = " AND ".join(f"{c} = {e.format(linha=linha)}" for c, e in zip(chaves, expressoes))
+    return f'''
+        UPDATE {tabela} SET
+            vendas = vendas - 1,
+            quantidade = quantidade - coalesce({linha}.quantidade, 0),
+            valor = valor - coalesce({linha}.valor_total, 0)
+        WHERE {filtro};
+        DELETE FROM {tabela} WHERE {filtro} AND vendas <= 0;
+    '''
+
+def _migracao_resumos_vendas(cursor):
+    for tabela, chaves, _ in RESUMOS_VENDAS:
+        colunas = ", ".join(f"{c} {'TEXT' if c in ('data', 'mes') else 'INTEGER'}" for c in chaves)
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {tabela} (
+                {colunas},
+                vendas INTEGER NOT NULL DEFAULT 0,
+                quantidade INTEGER NOT NULL DEFAULT 0,
+                valor REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY ({", ".join(chaves)})
+            ) WITHOUT ROWID
+        ''')
+    
+    somar = "".join(_sql_somar_resumo(*r, "new") for r in RESUMOS_VENDAS)
+    subtrair = "".join(_sql_subtrair_resumo(*r, "old") for r in RESUMOS_VENDAS)
+    cursor.execute(f"CREATE TRIGGER compras_resumo_ai AFTER INSERT ON compras BEGIN {somar} END")
+    cursor.execute(f"CREATE TRIGGER compras_resumo_ad AFTER DELETE ON compras BEGIN {subtrair} END")
+    cursor.execute(f'''
+        CREATE TRIGGER compras_resumo_au
+        AFTER UPDATE OF cliente_id, produto_id, data_compra, quantidade, valor_total ON compras
+        BEGIN {subtrair} {somar} END
+    ''')
+    
+    _reconstruir_resumos(cursor)
+
+def _sql_agrupar_compras(chaves, expressoes):
+    colunas = ", ".join(e.format(linha="compras") for e in expressoes)
+    return f'''
+        SELECT {colunas}, COUNT(*), SUM(coalesce(quantidade, 0)), SUM(coalesce(valor_total, 0))
+        FROM compras
+        GROUP BY {colunas}
+    '''
+
+def _reconstruir_resumos(cursor):
+    for tabela, chaves, expressoes in RESUMOS_VENDAS:
+        cursor.execute(f"DELETE FROM {tabela}")
+        cursor.execute(f'''
+            INSERT INTO {tabela} ({", ".join(chaves)}, vendas, quantidade, valor)
+            {_sql_agrupar_compras(chaves, expressoes)}
+        ''')
+
+def _migracao_indices_aniversario(cursor):
+    # Índice de expressão sobre o mês-dia do nascimento: os aniversariantes
+    # do dia/mês viram uma faixa do índice em vez de uma leitura de todos os
+    # clientes. O índice de notificações por cliente atende o NOT EXISTS de
+    # SQL_ANIVERSARIANTES_SEM_AVISO sem ler a tabela.
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_clientes_aniversario
+        ON clientes (substr(data_nascimento, 6, 5))
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_notificacoes_cliente
+        ON notificacoes (cliente_id, data_notificacao, tipo)
+    ''')
+
+def _migracao_objetos_adiados(cursor):
+    # Índices e triggers removidos durante uma importação em lote, guardados
+    # para serem recriados ao final (ou no próximo init_db, se a importação
+    # for interrompida)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS objetos_adiados (
+            nome TEXT PRIMARY KEY,
+            tabela TEXT NOT NULL,
+            sql TEXT NOT NULL
+        )
+    ''')
+
+def _migracao_configuracoes(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS configuracoes (
+            chave TEXT PRIMARY KEY,
+            valor TEXT
+        )
+    ''')
+
+# O que refazer depois de recriar os triggers adiados de cada tabela
+RECONSTRUCOES_ADIADAS = {
+    "clientes": _reconstruir_fts,
+    "compras": _reconstruir_resumos,
+}
+
+MIGRACOES = (
+    (1, "tabelas base e produtos de exemplo", _migracao_tabelas_base),
+    (2, "índices secundários", _migracao_indices),
+    (3, "índice de busca FTS5 trigram", _migracao_busca_fts),
+    (4, "índice de gastos para estatísticas", _migracao_indice_gastos),
+    (5, "índice de compras por data para relatórios", _migracao_indice_compras_data),
+    (6, "resumos de vendas mantidos por triggers", _migracao_resumos_vendas),
+    (7, "índices de aniversário", _migracao_indices_aniversario),
+    (8, "objetos adiados pela importação em lote", _migracao_objetos_adiados),
+    (9, "configurações do aplicativo", _migracao_configuracoes),
+)
+VERSAO_SCHEMA = MIGRACOES[-1][0]
@@ -0,0 +1,203 @@
+import sqlite3
+import threading
+import queue
+from contextlib import contextmanager
+
+class PoolEsgotado(sqlite3.OperationalError):
+    # Nenhuma conexão de leitura ficou livre dentro do timeout do pool
+    pass
+
+def _cancelado(eventos):
+    # Tratador de progresso: interrompe se qualquer um dos eventos for sinalizado
+    if len(eventos) == 1:
+        return eventos[0].is_set
+    return lambda: any(evento.is_set() for evento in eventos)
+
+class ConnectionPool:
+    # Conexão principal (única escritora) + pool pequeno de conexões de leitura.
+    # Cada thread usa no máximo uma conexão de leitura por vez; com WAL os
+    # leitores não bloqueiam a escrita nem uns aos outros.
+    PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -20000",      # ~20 MB de cache de páginas
+        "PRAGMA mmap_size = 268435456",    # 256 MB mapeados em memória
+        "PRAGMA temp_store = MEMORY",
+    )
+    # Instruções da VM do SQLite entre verificações de cancelamento
+    PASSOS_CANCELAMENTO = 1000
+    # Uma por thread que lê na interface: a própria GUI, busca (2), leituras
+    # (2), tarefas (1) e os dois agendadores; exportação e backup seguram a
+    # sua durante toda a execução
+    MAX_LEITORES = 8
+
+    def __init__(self, db_name, max_leitores=MAX_LEITORES, timeout=10.0):
+        self.db_name = db_name
+        self.max_leitores = max_leitores
+        self.timeout = timeout
+        self._memoria = db_name == ":memory:"
+
+        self._lock_escrita = threading.RLock()
+        self._profundidade = 0
+        self._apos_commit = []
+        self.principal = self._conectar()
+        if not self._memoria:
+            self.principal.execute("PRAGMA journal_mode = WAL")
+
+        self._local = threading.local()
+        self._livres = queue.LifoQueue()
+        self._criadas = 0
+        self._lock_pool = threading.Lock()
+        self._todas = []
+        self._fechado = False
+
+    def _conectar(self):
+        # isolation_level=None: as transações são controladas explicitamente
+        conn = sqlite3.connect(self.db_name, timeout=self.timeout,
+                               isolation_level=None, check_same_thread=False)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _obter_leitor(self):
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock_pool:
+            if self._criadas < self.max_leitores:
+                self._criadas += 1
+                conn = self._conectar()
+                conn.execute("PRAGMA query_only = ON")
+                self._todas.append(conn)
+                return conn
+
+        try:
+            return self._livres.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PoolEsgotado(f"As {self.max_leitores} conexões de leitura continuaram "
+                               f"ocupadas por {self.timeout:g} s") from None
+
+    @contextmanager
+    def read(self, cancelar=None):
+        # cancelar: threading.Event opcional; quando sinalizado, a consulta em
+        # andamento é abortada com sqlite3.OperationalError ("interrupted")
+        with self._reservar_leitor() as conn:
+            if cancelar is None:
+                yield conn
+                return
+            
+            # Leituras aninhadas na mesma thread usam a mesma conexão: a
+            # interna também para com o cancelar da externa, e na saída o
+            # tratador da externa é restaurado
+            externos = getattr(self._local, "cancelamentos", [])
+            eventos = externos + [cancelar]
+            self._local.cancelamentos = eventos
+            conn.set_progress_handler(_cancelado(eventos), self.PASSOS_CANCELAMENTO)
+            try:
+                yield conn
+            finally:
+                self._local.cancelamentos = externos
+                if externos:
+                    conn.set_progress_handler(_cancelado(externos), self.PASSOS_CANCELAMENTO)
+                else:
+                    conn.set_progress_handler(None, 0)
+
+    @contextmanager
+    def _reservar_leitor(self):
+        # Banco em memória não pode ser compartilhado entre conexões
+        if self._memoria:
+            with self._lock_escrita:
+                yield self.principal
+            return
+
+        # Reentrante: a mesma thread reaproveita a conexão que já possui
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.uso += 1
+            try:
+                yield conn
+            finally:
+                self._local.uso -= 1
+            return
+
+        conn = self._obter_leitor()
+        self._local.conn = conn
+        self._local.uso = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.uso = 0
+            if conn.in_transaction:
+                conn.rollback()
+            self._livres.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        # Transações aninhadas passam a fazer parte da transação externa
+        with self._lock_escrita:
+            conn = self.principal
+            if self._profundidade:
+                self._profundidade += 1
+                try:
+                    yield conn
+                finally:
+                    self._profundidade -= 1
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            self._profundidade = 1
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+                for funcao in self._apos_commit:
+                    funcao()
+            finally:
+                self._profundidade = 0
+                self._apos_commit = []
+
+    def apos_commit(self, funcao):
+        # Chama funcao() depois do commit da transação externa em andamento
+        # (descartada no rollback), ou na hora fora de transação. Para
+        # invalidar caches só quando as outras threads já podem ler o novo valor.
+        with self._lock_escrita:
+            if self._profundidade:
+                self._apos_commit.append(funcao)
+                return
+        funcao()
+
+    @contextmanager
+    def exclusive(self):
+        # Conexão principal fora de transação, com a escrita bloqueada para as
+        # outras threads (a API de backup não roda dentro de BEGIN)
+        with self._lock_escrita:
+            if self._profundidade:
+                raise RuntimeError("Operação exclusiva dentro de uma transação")
+            yield self.principal
+
+    def versao_dados(self):
+        # PRAGMA data_version da conexão principal: muda quando outra conexão
+        # (outro processo) confirma uma escrita; as da própria principal não
+        # contam. None se ela estiver ocupada com uma escrita de outra thread.
+        if not self._lock_escrita.acquire(blocking=False):
+            return None
+        try:
+            return self.principal.execute("PRAGMA data_version").fetchone()[0]
+        finally:
+            self._lock_escrita.release()
+
+    def close(self):
+        with self._lock_pool:
+            if self._fechado:
+                return
+            self._fechado = True
+            for conn in self._todas:
+                conn.close()
+            self._todas.clear()
+        with self._lock_escrita:
+            self.principal.close()
@@ -0,0 +1,247 @@
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from datetime import date
+from urllib.parse import urlsplit, parse_qs
+
+from .importacao import _campo, _data, _inteiro, _valor
+
+class HttpError(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+class ApiServer:
+    # API HTTP/JSON local para os caixas e scripts, sem a interface gráfica.
+    # Leituras rodam em threads (uma por conexão de leitura do pool); as
+    # vendas entram em uma fila consumida por uma única tarefa escritora, que
+    # grava em um só commit tudo o que chegou durante o commit anterior, com
+    # DatabaseManager.registrar_venda: como no balcão, cada venda atualiza o
+    # total gasto e gera a notificação "Nova venda registrada".
+    #
+    #   GET  /clientes?busca=texto&limite=50    GET /clientes/<id>
+    #   GET  /clientes/<id>/compras?limite=50   GET /produtos
+    #   GET  /estatisticas                      GET /relatorios/mensal?ano=&mes=&agrupamento=
+    #   GET  /cache (acertos e faltas dos caches em memória)
+    #   POST /vendas {"cliente_id", "produto_id", "quantidade", "data_compra", "valor_total"}
+    MAX_LOTE = 500       # vendas por commit
+    MAX_FILA = 10000     # vendas aguardando gravação antes de segurar os clientes
+    MAX_LIMITE = 500
+    MAX_CORPO = 1 << 16
+    STATUS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+              405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+    
+    def __init__(self, db, host="127.0.0.1", porta=8765):
+        self.db = db
+        self.host = host
+        self.porta = porta
+        self.leitores = ThreadPoolExecutor(db.pool.max_leitores, thread_name_prefix="leitor")
+        self.escritor = ThreadPoolExecutor(1, thread_name_prefix="escritor")
+    
+    def executar(self):
+        try:
+            asyncio.run(self._servir())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.leitores.shutdown()
+            self.escritor.shutdown()
+    
+    async def _servir(self):
+        self.fila = asyncio.Queue(self.MAX_FILA)
+        gravacao = asyncio.create_task(self._gravar_vendas())
+        servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        print(f"Servindo em http://{self.host}:{self.porta}", flush=True)
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            gravacao.cancel()
+    
+    async def _ler(self, funcao, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.leitores, partial(funcao, *args, **kwargs))
+    
+    async def _atender(self, reader, writer):
+        # HTTP/1.1 com keep-alive: os caixas reaproveitam a conexão
+        try:
+            while True:
+                try:
+                    cabecalho = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                try:
+                    metodo, alvo, versao = linhas[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for linha in linhas[1:]:
+                    nome, _, valor = linha.partition(":")
+                    headers[nome.strip().lower()] = valor.strip()
+                
+                try:
+                    tamanho = int(headers.get("content-length", "0"))
+                    if tamanho > self.MAX_CORPO:
+                        raise HttpError(413, "Corpo da requisição muito grande")
+                    corpo = await reader.readexactly(tamanho) if tamanho else b""
+                    status, resposta = await self._rotear(metodo, alvo, corpo)
+                except HttpError as e:
+                    status, resposta = e.status, {"erro": str(e)}
+                except ValueError as e:
+                    status, resposta = 400, {"erro": str(e)}
+                except asyncio.IncompleteReadError:
+                    return
+                except Exception as e:
+                    status, resposta = 500, {"erro": str(e)}
+                
+                manter = versao == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                dados = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {self.STATUS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(dados)}\r\n"
+                    f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode("latin-1") + dados)
+                await writer.drain()
+                if not manter:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    def _limite(self, params):
+        limite = _inteiro(params.get("limite", "50"))
+        if not 0 < limite <= self.MAX_LIMITE:
+            raise ValueError(f"limite deve estar entre 1 e {self.MAX_LIMITE}")
+        return limite
+    
+    async def _rotear(self, metodo, alvo, corpo):
+        url = urlsplit(alvo)
+        partes = [parte for parte in url.path.split("/") if parte]
+        params = {nome: valores[-1] for nome, valores in parse_qs(url.query).items()}
+        
+        if metodo == "POST" and partes == ["vendas"]:
+            return 201, await self._registrar_venda(corpo)
+        if metodo != "GET":
+            raise HttpError(405, "Método não permitido")
+        
+        if partes == ["clientes"]:
+            termo = params.get("busca", "").strip()
+            if termo:
+                clientes = await self._ler(self.db.search_clientes, termo, ordem="nome",
+                                           limit=self._limite(params))
+            else:
+                clientes = await self._ler(self.db.get_clientes, limit=self._limite(params))
+            return 200, [c.como_dict() for c in clientes]
+        
+        if len(partes) in (2, 3) and partes[0] == "clientes":
+            cliente_id = _inteiro(partes[1])
+            if len(partes) == 2:
+                cliente = await self._ler(self.db.get_cliente, cliente_id)
+                if cliente is None:
+                    raise HttpError(404, "Cliente não encontrado")
+                return 200, cliente.como_dict()
+            if partes[2] == "compras":
+                compras = await self._ler(self.db.get_compras_cliente, cliente_id,
+                                          limit=self._limite(params))
+                return 200, [c.como_dict() for c in compras]
+        
+        if partes == ["produtos"]:
+            produtos = await self._ler(self.db.get_produtos)
+            return 200, [p.como_dict() for p in produtos]
+        
+        if partes == ["estatisticas"]:
+            return 200, await self._ler(self.db.get_estatisticas)
+        
+        if partes == ["cache"]:
+            return 200, self.db.get_estatisticas_cache()
+        
+        if partes == ["relatorios", "mensal"]:
+            hoje = date.today()
+            relatorio = await self._ler(
+                self.db.get_relatorio_mensal, _inteiro(params.get("ano", str(hoje.year))),
+                _inteiro(params.get("mes", str(hoje.month))), params.get("agrupamento", "dia"))
+            for chave in ("por_periodo", "por_produto", "por_categoria"):
+                relatorio[chave] = [linha.como_dict() for linha in relatorio[chave]]
+            return 200, relatorio
+        
+        raise HttpError(404, "Recurso não encontrado")
+    
+    def _validar_venda(self, dados):
+        # Roda em uma thread leitora: confere cliente e produto e calcula o valor
+        if not isinstance(dados, dict):
+            raise ValueError("o corpo deve ser um objeto JSON")
+        cliente_id = _inteiro(_campo(dados, "cliente_id"))
+        produto_id = _inteiro(_campo(dados, "produto_id"))
+        quantidade = _campo(dados, "quantidade")
+        quantidade = _inteiro(quantidade) if quantidade else 1
+        if quantidade <= 0:
+            raise ValueError("quantidade deve ser positiva")
+        data_compra = _campo(dados, "data_compra")
+        data_compra = _data(data_compra) if data_compra else date.today().isoformat()
+        
+        if self.db.get_cliente(cliente_id) is None:
+            raise HttpError(404, f"Cliente {cliente_id} não encontrado")
+        produto = self.db.get_produto(produto_id)
+        if produto is None:
+            raise HttpError(404, f"Produto {produto_id} não encontrado")
+        
+        valor_total = _valor(dados, "valor_total")
+        if valor_total is None:
+            valor_total = produto.preco * quantidade
+        return (cliente_id, produto_id, data_compra, quantidade, valor_total)
+    
+    async def _registrar_venda(self, corpo):
+        try:
+            dados = json.loads(corpo or b"null")
+        except ValueError:
+            raise ValueError("JSON inválido") from None
+        compra = await self._ler(self._validar_venda, dados)
+        
+        concluida = asyncio.get_running_loop().create_future()
+        await self.fila.put((compra, concluida))
+        compra_id = await concluida
+        return {"id": compra_id, "cliente_id": compra[0], "produto_id": compra[1],
+                "data_compra": compra[2], "quantidade": compra[3], "valor_total": compra[4]}
+    
+    def _gravar_venda(self, compra):
+        cliente_id, produto_id, data_compra, quantidade, valor_total = compra
+        return self.db.registrar_venda(cliente_id, produto_id, quantidade, data_compra,
+                                       valor_total).id
+    
+    def _gravar_lote(self, compras):
+        # Uma transação para o lote inteiro (as de registrar_venda se juntam a ela)
+        with self.db.transaction():
+            return [self._gravar_venda(compra) for compra in compras]
+    
+    async def _gravar_vendas(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.fila.get()]
+            while len(lote) < self.MAX_LOTE and not self.fila.empty():
+                lote.append(self.fila.get_nowait())
+            
+            try:
+                ids = await loop.run_in_executor(self.escritor, self._gravar_lote,
+                                                 [compra for compra, _ in lote])
+            except Exception:
+                # Uma venda com problema desfaz o lote: grava uma a uma para
+                # que só ela falhe
+                for compra, concluida in lote:
+                    try:
+                        compra_id = await loop.run_in_executor(self.escritor, self._gravar_venda, compra)
+                    except Exception as e:
+                        if not concluida.done():
+                            concluida.set_exception(e)
+                    else:
+                        if not concluida.done():
+                            concluida.set_result(compra_id)
+                continue
+            
+            for (_, concluida), compra_id in zip(lote, ids):
+                # O cliente pode ter desconectado e cancelado a espera
+                if not concluida.done():
+                    concluida.set_result(compra_id)
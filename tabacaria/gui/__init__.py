@@ -0,0 +1 @@
+from .janela import MainWindow
@@ -0,0 +1,262 @@
+import threading
+from functools import partial
+from PyQt5.QtWidgets import (QStyledItemDelegate, QStyle, QLineEdit, QCompleter,
+                             QMessageBox)
+from PyQt5.QtCore import (Qt, QSize, QRect, QEvent, QAbstractListModel, QModelIndex,
+                          QTimer, pyqtSignal)
+from PyQt5.QtGui import (QFont, QFontMetrics, QColor, QPainter, QPen, QStandardItemModel,
+                         QStandardItem)
+
+from ..core import CartaoCliente
+from .tarefas import SearchSignals, SearchWorker
+
+class ClientListModel(QAbstractListModel):
+    # Clientes carregados sob demanda, uma página por vez, conforme a view
+    # rola (canFetchMore/fetchMore); nenhum widget é criado por cliente.
+    # A fonte é qualquer função buscar(after=(nome, id), limit=N).
+    ClienteRole = Qt.UserRole + 1
+    TAMANHO_PAGINA = 200
+    
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self._buscar = partial(db.get_clientes, tipo=CartaoCliente)
+        self._clientes = []
+        self._tem_mais = False
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._clientes)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        cliente = self._clientes[index.row()]
+        if role == Qt.DisplayRole:
+            return cliente.nome
+        if role == self.ClienteRole:
+            return cliente
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._tem_mais
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._tem_mais:
+            return
+        
+        after = None
+        if self._clientes:
+            ultimo = self._clientes[-1]
+            after = (ultimo.nome, ultimo.id)
+        
+        pagina = self._buscar(after=after, limit=self.TAMANHO_PAGINA)
+        self._tem_mais = len(pagina) == self.TAMANHO_PAGINA
+        if pagina:
+            inicio = len(self._clientes)
+            self.beginInsertRows(QModelIndex(), inicio, inicio + len(pagina) - 1)
+            self._clientes.extend(pagina)
+            self.endInsertRows()
+    
+    def carregar(self, buscar, primeira_pagina=None):
+        # primeira_pagina permite exibir uma página já buscada em segundo plano
+        self.beginResetModel()
+        self._buscar = buscar
+        self._clientes = list(primeira_pagina or [])
+        self._tem_mais = primeira_pagina is None or len(self._clientes) == self.TAMANHO_PAGINA
+        self.endResetModel()
+        if primeira_pagina is None:
+            self.fetchMore()
+    
+    def carregar_todos(self):
+        # Volta ao modo paginado sobre a tabela inteira
+        self.carregar(partial(self.db.get_clientes, tipo=CartaoCliente))
+
+class ClientCardDelegate(QStyledItemDelegate):
+    # Desenha o card do cliente diretamente com QPainter, incluindo os botões
+    # "Editar" e "Compras", cujos cliques são tratados em editorEvent
+    editar = pyqtSignal(int)
+    ver_compras = pyqtSignal(int)
+    
+    ALTURA = 170
+    MARGEM = 5
+    PADDING = 15
+    ALTURA_BOTAO = 28
+    ALTURA_LINHA = 20
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ALTURA)
+    
+    def _area_card(self, rect):
+        m = self.MARGEM
+        return rect.adjusted(m, m, -m, -m)
+    
+    def _botoes(self, rect):
+        card = self._area_card(rect)
+        y = card.bottom() - self.PADDING - self.ALTURA_BOTAO
+        largura = (card.width() - 2 * self.PADDING - 10) // 2
+        editar = QRect(card.left() + self.PADDING, y, largura, self.ALTURA_BOTAO)
+        compras = QRect(editar.right() + 10, y, largura, self.ALTURA_BOTAO)
+        return editar, compras
+    
+    def paint(self, painter, option, index):
+        cliente = index.data(ClientListModel.ClienteRole)
+        if cliente is None:
+            return
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Fundo do card
+        card = self._area_card(option.rect)
+        if option.state & QStyle.State_MouseOver:
+            painter.setPen(QPen(QColor("#dee2e6")))
+            painter.setBrush(QColor("#f8f9fa"))
+        else:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(card, 8, 8)
+        
+        negrito = QFont(option.font)
+        negrito.setBold(True)
+        titulo = QFont(negrito)
+        titulo.setPixelSize(16)
+        
+        # Nome, contato, nascimento, total gasto e status
+        contato = "   ".join(texto for texto in (
+            f"📞 {cliente.telefone}" if cliente.telefone else "",
+            f"✉️ {cliente.email}" if cliente.email else "",
+        ) if texto)
+        total_gasto = cliente.total_gasto or 0
+        ativo = cliente.fumante_ativo == 1
+        linhas = [
+            (cliente.nome, titulo, "#2c3e50"),
+            (contato, option.font, "#2c3e50"),
+            (f"🎂 {cliente.data_nascimento}" if cliente.data_nascimento else "", option.font, "#2c3e50"),
+            (f"💰 Total gasto: R$ {total_gasto:.2f}", negrito, "#27ae60"),
+            (f"Status: {'Ativo' if ativo else 'Inativo'}", negrito, "#27ae60" if ativo else "#e74c3c"),
+        ]
+        
+        x = card.left() + self.PADDING
+        y = card.top() + 10
+        largura = card.width() - 2 * self.PADDING
+        for texto, fonte, cor in linhas:
+            if not texto:
+                continue
+            altura = self.ALTURA_LINHA + (4 if fonte is titulo else 0)
+            painter.setFont(fonte)
+            painter.setPen(QColor(cor))
+            texto = QFontMetrics(fonte).elidedText(texto, Qt.ElideRight, largura)
+            painter.drawText(QRect(x, y, largura, altura), Qt.AlignLeft | Qt.AlignVCenter, texto)
+            y += altura
+        
+        # Botões de ação
+        painter.setFont(option.font)
+        for rect, texto, cor in zip(self._botoes(option.rect), ("Editar", "Compras"),
+                                    ("#3498db", "#2ecc71")):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(cor))
+            painter.drawRoundedRect(rect, 3, 3)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignCenter, texto)
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            cliente = index.data(ClientListModel.ClienteRole)
+            btn_editar, btn_compras = self._botoes(option.rect)
+            if btn_editar.contains(event.pos()):
+                self.editar.emit(cliente.id)
+                return True
+            if btn_compras.contains(event.pos()):
+                self.ver_compras.emit(cliente.id)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class ClientPicker(QLineEdit):
+    # Campo de cliente da venda. Nada é carregado antes de digitar: após uma
+    # pausa o texto é buscado no banco (FTS, em segundo plano) e as
+    # MAX_SUGESTOES melhores ocorrências aparecem no completer.
+    MAX_SUGESTOES = 20
+    PAUSA = 200  # ms sem digitar antes de buscar
+    ClienteIdRole = Qt.UserRole + 1
+    
+    def __init__(self, db, pool, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.pool = pool
+        self._cliente_id = None
+        self.setPlaceholderText("Digite o nome, telefone ou e-mail do cliente...")
+        
+        self.sugestoes = QStandardItemModel(self)
+        completer = QCompleter(self.sugestoes, self)
+        # As sugestões já chegam filtradas e ordenadas pelo banco
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.activated[QModelIndex].connect(self._escolher)
+        self.setCompleter(completer)
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.PAUSA)
+        self.timer.timeout.connect(self._buscar)
+        self.textEdited.connect(self._editado)
+        
+        self.signals = SearchSignals(self)
+        self.signals.concluida.connect(self._exibir)
+        self.signals.falhou.connect(self._erro)
+        self.geracao = 0
+        self.cancelar = threading.Event()
+    
+    def cliente_id(self):
+        return self._cliente_id
+    
+    def atualizar(self):
+        # Refaz a busca do texto digitado (ex.: depois de cadastrar clientes)
+        if self._cliente_id is None and self.text().strip():
+            self._buscar()
+    
+    def limpar(self):
+        self.cancelar.set()
+        self.timer.stop()
+        self._cliente_id = None
+        self.sugestoes.clear()
+        self.clear()
+    
+    def _editado(self):
+        # Qualquer edição desfaz a escolha anterior
+        self._cliente_id = None
+        self.timer.start()
+    
+    def _buscar(self):
+        self.timer.stop()
+        self.cancelar.set()
+        self.cancelar = threading.Event()
+        self.geracao += 1
+        
+        termo = self.text().strip()
+        if not termo:
+            self.sugestoes.clear()
+            return
+        buscar = partial(self.db.search_clientes, termo, limit=self.MAX_SUGESTOES,
+                         tipo=CartaoCliente)
+        self.pool.start(SearchWorker(buscar, self.geracao, self.cancelar, self.signals))
+    
+    def _exibir(self, geracao, clientes):
+        if geracao != self.geracao:
+            return  # resultado de uma busca já substituída
+        self.sugestoes.clear()
+        for cliente in clientes:
+            texto = f"{cliente.nome} — {cliente.telefone}" if cliente.telefone else cliente.nome
+            item = QStandardItem(texto)
+            item.setData(cliente.id, self.ClienteIdRole)
+            self.sugestoes.appendRow(item)
+        if clientes and self.hasFocus():
+            self.completer().complete()
+    
+    def _erro(self, geracao, erro):
+        if geracao == self.geracao:
+            QMessageBox.critical(self, "Erro", f"Erro ao buscar clientes: {erro}")
+    
+    def _escolher(self, index):
+        self._cliente_id = index.data(self.ClienteIdRole)
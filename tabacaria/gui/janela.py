@@ -0,0 +1,1075 @@
+import os
+import importlib
+import threading
+from functools import partial
+from datetime import date
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget,
+                             QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
+                             QPushButton, QLabel, QMessageBox, QGroupBox, QDateEdit,
+                             QTextEdit, QComboBox, QGridLayout, QCheckBox, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QSystemTrayIcon, QMenu, QAction,
+                             QDialog, QSplitter, QListView, QStyle, QAbstractItemView,
+                             QFileDialog, QProgressBar)
+from PyQt5.QtCore import Qt, QDate, QTimer, QThreadPool, pyqtSignal
+
+from ..core import (DatabaseManager, NotificationScheduler, BackupScheduler, Importador,
+                    Exportador, resumo_importacao, CartaoCliente)
+from .clientes import ClientListModel, ClientCardDelegate, ClientPicker
+from .tarefas import TaskSignals, TaskWorker, SearchSignals, SearchWorker
+from .widgets import ModernButton, NotificationDialog, BirthdayWidget
+
+class MainWindow(QMainWindow):
+    # Emitidos pelas threads dos agendadores; entregues na thread da GUI
+    notificacoes_pendentes = pyqtSignal(object)
+    backup_automatico = pyqtSignal(str)
+    
+    # (chave, título) das abas; cada uma é montada por create_<chave>_tab
+    # na primeira vez em que é aberta
+    ABAS = (
+        ("dashboard", "Dashboard"),
+        ("cadastro", "Cadastro"),
+        ("clientes", "Clientes"),
+        ("vendas", "Vendas"),
+        ("relatorios", "Relatórios"),
+        ("configuracoes", "Configurações"),
+    )
+    
+    def __init__(self, db_name="tabacaria_crm.db"):
+        super().__init__()
+        self.db = DatabaseManager(db_name)
+        self.dialogo_notificacoes = None
+        # Importações e exportações rodam aqui, uma por vez
+        self.tarefas_pool = QThreadPool(self)
+        self.tarefas_pool.setMaxThreadCount(1)
+        self.tarefa_cancelar = threading.Event()  # sinalizado ao fechar
+        # Leituras que preenchem a tela (dashboard, combos, aniversariantes),
+        # fora da thread da GUI para a janela abrir sem esperar o banco
+        self.leituras_pool = QThreadPool(self)
+        self.leituras_pool.setMaxThreadCount(2)
+        self.init_ui()
+        self.setup_tray_icon()
+        
+        # Verificação de notificações em segundo plano: a primeira roda logo
+        # ao iniciar, sem bloquear a abertura da janela
+        self.notificacoes_pendentes.connect(self.exibir_notificacoes)
+        self.notificacoes_scheduler = NotificationScheduler(self.db, self.notificacoes_pendentes.emit)
+        self.notificacoes_scheduler.start()
+        
+        # Backups automáticos na pasta "backups" ao lado do banco
+        self.backup_automatico.connect(self.backup_automatico_concluido)
+        pasta_backups = os.path.join(os.path.dirname(os.path.abspath(db_name)), "backups")
+        self.backup_scheduler = BackupScheduler(self.db, pasta_backups, self.backup_automatico.emit)
+        self.backup_scheduler.start()
+        
+        # Só a aba visível é montada agora; as outras, quando forem abertas
+        self.tabs.currentChanged.connect(self.construir_aba)
+        self.construir_aba(self.tabs.currentIndex())
+        self.carregar_aniversariantes()
+    
+    def encerrar(self):
+        self.notificacoes_scheduler.parar()
+        self.backup_scheduler.parar()
+        # Nenhuma thread pode usar o banco depois do close: importação,
+        # exportação e buscas param no próximo lote; backup e restauração
+        # não são interrompidos no meio, e a saída espera por eles
+        self.tarefa_cancelar.set()
+        if self.aba_construida("clientes"):
+            self.cancelar_pesquisa()
+            self.search_pool.waitForDone()
+        if self.aba_construida("vendas"):
+            self.venda_cliente_picker.cancelar.set()
+        self.tarefas_pool.waitForDone()
+        self.leituras_pool.waitForDone()
+        # Resultados ainda na fila de eventos usariam o banco já fechado
+        QApplication.removePostedEvents(None)
+        self.db.close()
+        
+    def init_ui(self):
+        self.setWindowTitle('Tabacaria CRM - Sistema de Fidelização')
+        self.setGeometry(100, 100, 1200, 800)
+        
+        # Configurar layout principal
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QHBoxLayout(central_widget)
+        
+        # Criar splitter para divisão de área
+        splitter = QSplitter(Qt.Horizontal)
+        
+        # Área principal com abas
+        main_area = QWidget()
+        main_area_layout = QVBoxLayout(main_area)
+        
+        # Criar abas
+        self.tabs = QTabWidget()
+        main_area_layout.addWidget(self.tabs)
+        
+        # Adicionar abas, por enquanto só com o marcador "Carregando..."
+        self.abas_pendentes = set()
+        for chave, titulo in self.ABAS:
+            aba = QWidget()
+            aba_layout = QVBoxLayout(aba)
+            aba_layout.setContentsMargins(0, 0, 0, 0)
+            aba_layout.addWidget(self.criar_marcador_carregando())
+            self.tabs.addTab(aba, titulo)
+            self.abas_pendentes.add(chave)
+        
+        # Área lateral para aniversariantes
+        side_widget = QWidget()
+        side_widget.setMaximumWidth(300)
+        side_layout = QVBoxLayout(side_widget)
+        
+        # Widget de aniversariantes, preenchido por carregar_aniversariantes
+        self.birthday_widget = BirthdayWidget(parent=self)
+        side_layout.addWidget(self.birthday_widget)
+        
+        self.aniversariantes_signals = TaskSignals()
+        self.aniversariantes_signals.concluida.connect(self.birthday_widget.exibir)
+        self.aniversariantes_signals.falhou.connect(self.carregamento_falhou)
+        
+        # Adicionar widgets ao splitter
+        splitter.addWidget(main_area)
+        splitter.addWidget(side_widget)
+        splitter.setSizes([800, 200])
+        
+        main_layout.addWidget(splitter)
+        
+        # Aplicar estilo
+        self.apply_styles()
+    
+    def criar_marcador_carregando(self):
+        marcador = QLabel("Carregando...")
+        marcador.setAlignment(Qt.AlignCenter)
+        marcador.setStyleSheet("color: #7f8c8d; font-size: 14px;")
+        return marcador
+    
+    def construir_aba(self, indice):
+        chave = self.ABAS[indice][0]
+        if chave not in self.abas_pendentes:
+            return
+        self.abas_pendentes.discard(chave)
+        
+        # Troca o marcador pelo conteúdo da aba
+        layout = self.tabs.widget(indice).layout()
+        layout.takeAt(0).widget().deleteLater()
+        layout.addWidget(getattr(self, f"create_{chave}_tab")())
+    
+    def aba_construida(self, chave):
+        return chave not in self.abas_pendentes
+    
+    def iniciar_leitura(self, tarefa, signals):
+        # tarefa() roda no leituras_pool; o resultado chega por signals.concluida
+        self.leituras_pool.start(TaskWorker(lambda progresso, cancelar: tarefa(), signals))
+    
+    def iniciar_tarefa(self, tarefa, signals):
+        # tarefa(progresso, cancelar) roda no tarefas_pool; todas compartilham
+        # tarefa_cancelar, que só encerrar() sinaliza
+        self.tarefas_pool.start(TaskWorker(tarefa, signals, self.tarefa_cancelar))
+    
+    def carregamento_falhou(self, erro):
+        QMessageBox.critical(self, "Erro", f"Erro ao carregar dados: {erro}")
+    
+    def carregar_aniversariantes(self):
+        self.iniciar_leitura(self.db.get_aniversariantes_mes, self.aniversariantes_signals)
+        
+    def apply_styles(self):
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: #ecf0f1;
+            }
+            QTabWidget::pane {
+                border: 1px solid #bdc3c7;
+                background: white;
+            }
+            QTabBar::tab {
+                background: #95a5a6;
+                color: white;
+                padding: 10px;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            QTabBar::tab:selected {
+                background: #34495e;
+            }
+            QLabel {
+                color: #2c3e50;
+            }
+            QLineEdit, QDateEdit, QTextEdit, QComboBox {
+                padding: 8px;
+                border: 1px solid #bdc3c7;
+                border-radius: 4px;
+                background-color: white;
+            }
+            QGroupBox {
+                font-weight: bold;
+                border: 1px solid #bdc3c7;
+                border-radius: 6px;
+                margin-top: 10px;
+                padding-top: 15px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+            }
+            QTableWidget {
+                gridline-color: #bdc3c7;
+                background-color: white;
+                alternate-background-color: #f8f9fa;
+            }
+            QTableWidget::item:selected {
+                background-color: #3498db;
+                color: white;
+            }
+            QHeaderView::section {
+                background-color: #34495e;
+                color: white;
+                padding: 5px;
+                border: none;
+            }
+        """)
+        
+    def setup_tray_icon(self):
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
+        
+        tray_menu = QMenu()
+        show_action = QAction("Abrir", self)
+        quit_action = QAction("Sair", self)
+        
+        show_action.triggered.connect(self.show)
+        quit_action.triggered.connect(QApplication.quit)
+        
+        tray_menu.addAction(show_action)
+        tray_menu.addAction(quit_action)
+        
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.show()
+        
+    def alternar_notificacoes(self, ativo):
+        self.notificacoes_scheduler.ativo = ativo
+        if ativo:
+            self.notificacoes_scheduler.acordar()
+    
+    def exibir_notificacoes(self, notificacoes):
+        if not self.notificacoes_scheduler.ativo:
+            return
+        
+        self.tray_icon.showMessage(
+            "Tabacaria CRM - Notificações",
+            f"Você tem {len(notificacoes)} notificação(ões) hoje",
+            QSystemTrayIcon.Information,
+            2000
+        )
+        
+        # Mostrar diálogo de notificações se a janela estiver visível e não
+        # houver outro aberto desde a verificação anterior
+        if self.isVisible() and self.dialogo_notificacoes is None:
+            self.mostrar_dialogo_notificacoes(notificacoes)
+    
+    def mostrar_dialogo_notificacoes(self, notificacoes):
+        self.dialogo_notificacoes = NotificationDialog(notificacoes, self)
+        try:
+            self.dialogo_notificacoes.exec_()
+        finally:
+            self.dialogo_notificacoes = None
+    
+    def create_dashboard_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Resumo do negócio; os valores chegam com carregar_dashboard
+        resumo_group = QGroupBox("Resumo do Negócio")
+        resumo_layout = QGridLayout()
+        
+        self.dashboard_total_label = QLabel("...")
+        self.dashboard_ativos_label = QLabel("...")
+        self.dashboard_faturamento_label = QLabel("...")
+        
+        resumo_layout.addWidget(QLabel("Total de Clientes:"), 0, 0)
+        resumo_layout.addWidget(self.dashboard_total_label, 0, 1)
+        
+        resumo_layout.addWidget(QLabel("Clientes Ativos:"), 1, 0)
+        resumo_layout.addWidget(self.dashboard_ativos_label, 1, 1)
+        
+        resumo_layout.addWidget(QLabel("Faturamento Total:"), 2, 0)
+        resumo_layout.addWidget(self.dashboard_faturamento_label, 2, 1)
+        
+        resumo_group.setLayout(resumo_layout)
+        layout.addWidget(resumo_group)
+        
+        # O gráfico substitui o marcador quando os dados chegarem
+        self.dashboard_layout = layout
+        self.dashboard_canvas = None
+        self.dashboard_marcador = self.criar_marcador_carregando()
+        layout.addWidget(self.dashboard_marcador, 1)
+        
+        self.dashboard_signals = TaskSignals()
+        self.dashboard_signals.concluida.connect(self.exibir_dashboard)
+        self.dashboard_signals.falhou.connect(self.carregamento_falhou)
+        self.iniciar_leitura(self.carregar_dashboard, self.dashboard_signals)
+        
+        return tab
+    
+    def carregar_dashboard(self):
+        # Roda no leituras_pool, junto com o import do matplotlib, que sozinho
+        # leva mais que todo o resto da abertura da janela; exibir_dashboard
+        # encontra os módulos já carregados
+        importlib.import_module("matplotlib.backends.backend_qt5agg")
+        importlib.import_module("matplotlib.figure")
+        return self.db.get_estatisticas(), self.db.get_vendas_mensais(12)
+    
+    def exibir_dashboard(self, dados):
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
+        estatisticas, vendas_mensais = dados
+        self.dashboard_total_label.setText(f"{estatisticas['total_clientes']}")
+        self.dashboard_ativos_label.setText(f"{estatisticas['clientes_ativos']}")
+        self.dashboard_faturamento_label.setText(f"R$ {estatisticas['faturamento_total']:.2f}")
+        
+        # Gráfico de clientes por status
+        figure = Figure(figsize=(10, 6))
+        canvas = FigureCanvas(figure)
+        
+        # Dados para o gráfico
+        status = ['Ativos', 'Inativos']
+        quantidades = [estatisticas['clientes_ativos'], estatisticas['clientes_inativos']]
+        cores = ['#2ecc71', '#e74c3c']
+        
+        ax = figure.add_subplot(121)
+        ax.bar(status, quantidades, color=cores)
+        ax.set_title('Clientes por Status')
+        ax.set_ylabel('Quantidade')
+        
+        # Faturamento mensal, lido do resumo (uma linha por mês)
+        ax_vendas = figure.add_subplot(122)
+        ax_vendas.bar([v.mes[5:] + "/" + v.mes[2:4] for v in vendas_mensais],
+                      [v.valor for v in vendas_mensais], color='#3498db')
+        ax_vendas.set_title('Faturamento Mensal')
+        ax_vendas.set_ylabel('R$')
+        ax_vendas.tick_params(axis='x', labelrotation=45)
+        figure.tight_layout()
+        
+        self.dashboard_marcador.deleteLater()
+        self.dashboard_layout.addWidget(canvas)
+        self.dashboard_canvas = canvas
+    
+    def create_cadastro_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Formulário de cadastro
+        form_group = QGroupBox("Cadastro de Cliente")
+        form_layout = QFormLayout()
+        
+        self.nome_input = QLineEdit()
+        self.telefone_input = QLineEdit()
+        self.email_input = QLineEdit()
+        self.data_nascimento_input = QDateEdit()
+        self.data_nascimento_input.setCalendarPopup(True)
+        self.data_nascimento_input.setDate(QDate(1990, 1, 1))
+        
+        self.preferencias_input = QTextEdit()
+        self.observacoes_input = QTextEdit()
+        self.fumante_ativo_check = QCheckBox("Cliente fumante ativo")
+        self.fumante_ativo_check.setChecked(True)
+        
+        form_layout.addRow("Nome completo:", self.nome_input)
+        form_layout.addRow("Telefone:", self.telefone_input)
+        form_layout.addRow("Email:", self.email_input)
+        form_layout.addRow("Data de nascimento:", self.data_nascimento_input)
+        form_layout.addRow("Preferências:", self.preferencias_input)
+        form_layout.addRow("Observações:", self.observacoes_input)
+        form_layout.addRow("", self.fumante_ativo_check)
+        
+        form_group.setLayout(form_layout)
+        layout.addWidget(form_group)
+        
+        # Botão de cadastro
+        btn_cadastrar = ModernButton("Cadastrar Cliente")
+        btn_cadastrar.clicked.connect(self.cadastrar_cliente)
+        layout.addWidget(btn_cadastrar)
+        
+        return tab
+    
+    def create_clientes_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Barra de pesquisa
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Pesquisar clientes...")
+        self.search_input.textChanged.connect(self.agendar_pesquisa)
+        btn_pesquisar = ModernButton("Pesquisar")
+        btn_pesquisar.clicked.connect(self.pesquisar_clientes)
+        
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(btn_pesquisar)
+        layout.addLayout(search_layout)
+        
+        # Lista virtualizada: o delegate desenha os cards e o modelo busca
+        # os clientes em páginas conforme a rolagem
+        self.clientes_model = ClientListModel(self.db, self)
+        self.clientes_delegate = ClientCardDelegate(self)
+        self.clientes_delegate.editar.connect(self.abrir_edicao_cliente)
+        self.clientes_delegate.ver_compras.connect(self.ver_compras_cliente)
+        
+        self.clientes_view = QListView()
+        self.clientes_view.setModel(self.clientes_model)
+        self.clientes_view.setItemDelegate(self.clientes_delegate)
+        self.clientes_view.setUniformItemSizes(True)
+        self.clientes_view.setMouseTracking(True)
+        self.clientes_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.clientes_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.clientes_view.setStyleSheet("QListView { background-color: #ecf0f1; border: none; }")
+        layout.addWidget(self.clientes_view)
+        
+        self.clientes_vazio_label = QLabel()
+        self.clientes_vazio_label.setAlignment(Qt.AlignCenter)
+        self.clientes_vazio_label.hide()
+        layout.addWidget(self.clientes_vazio_label)
+        
+        # Busca assíncrona: o texto digitado só é pesquisado após uma pausa
+        # e apenas o resultado da busca mais recente é exibido
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.pesquisar_clientes)
+        
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(2)
+        self.search_signals = SearchSignals(self)
+        self.search_signals.concluida.connect(self.exibir_resultado_pesquisa)
+        self.search_signals.falhou.connect(self.exibir_erro_pesquisa)
+        self.search_geracao = 0
+        self.search_cancelar = threading.Event()
+        self.search_fonte = None
+        
+        # Carregar clientes inicialmente
+        self.carregar_clientes()
+        
+        return tab
+    
+    def create_vendas_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Formulário de venda
+        form_group = QGroupBox("Registrar Venda")
+        form_layout = QFormLayout()
+        
+        # Cliente: buscado no banco conforme o caixa digita
+        self.venda_cliente_picker = ClientPicker(self.db, self.leituras_pool)
+        form_layout.addRow("Cliente:", self.venda_cliente_picker)
+        
+        # Produto
+        self.venda_produto_combo = QComboBox()
+        self.carregar_produtos_combo()
+        form_layout.addRow("Produto:", self.venda_produto_combo)
+        
+        # Quantidade
+        self.venda_quantidade = QLineEdit("1")
+        form_layout.addRow("Quantidade:", self.venda_quantidade)
+        
+        # Data
+        self.venda_data = QDateEdit()
+        self.venda_data.setCalendarPopup(True)
+        self.venda_data.setDate(QDate.currentDate())
+        form_layout.addRow("Data da venda:", self.venda_data)
+        
+        # Valor (calculado automaticamente)
+        self.venda_valor = QLabel("R$ 0.00")
+        self.venda_produto_combo.currentIndexChanged.connect(self.calcular_valor_venda)
+        self.venda_quantidade.textChanged.connect(self.calcular_valor_venda)
+        form_layout.addRow("Valor total:", self.venda_valor)
+        
+        form_group.setLayout(form_layout)
+        layout.addWidget(form_group)
+        
+        # Botão de registrar venda
+        btn_registrar = ModernButton("Registrar Venda")
+        btn_registrar.clicked.connect(self.registrar_venda)
+        layout.addWidget(btn_registrar)
+        
+        return tab
+    
+    def create_relatorios_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Filtros
+        filtros_group = QGroupBox("Filtros")
+        filtros_layout = QHBoxLayout()
+        
+        self.relatorio_mes_combo = QComboBox()
+        meses = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", 
+                "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"]
+        self.relatorio_mes_combo.addItems(meses)
+        self.relatorio_mes_combo.setCurrentIndex(date.today().month - 1)
+        
+        self.relatorio_ano = QLineEdit(str(date.today().year))
+        
+        self.relatorio_agrupamento = QComboBox()
+        self.relatorio_agrupamento.addItem("Dia", "dia")
+        self.relatorio_agrupamento.addItem("Semana", "semana")
+        
+        btn_gerar = ModernButton("Gerar Relatório")
+        btn_gerar.clicked.connect(self.gerar_relatorio)
+        
+        # Exportação em segundo plano; os relatórios usam o mês e o ano acima
+        self.exportacao_conjunto = QComboBox()
+        self.exportacao_conjunto.addItem("Relatório por período", "relatorio_periodos")
+        self.exportacao_conjunto.addItem("Relatório por produto", "relatorio_produtos")
+        self.exportacao_conjunto.addItem("Clientes", "clientes")
+        self.exportacao_conjunto.addItem("Histórico de compras", "compras")
+        self.exportacao_btn = ModernButton("Exportar...")
+        self.exportacao_btn.clicked.connect(self.exportar_dados)
+        self.exportacao_progresso = QProgressBar()
+        self.exportacao_progresso.setVisible(False)
+        
+        self.exportacao_signals = TaskSignals()
+        self.exportacao_signals.progresso.connect(self.exportacao_progresso.setValue)
+        self.exportacao_signals.concluida.connect(self.exportacao_concluida)
+        self.exportacao_signals.falhou.connect(self.exportacao_falhou)
+        
+        filtros_layout.addWidget(QLabel("Mês:"))
+        filtros_layout.addWidget(self.relatorio_mes_combo)
+        filtros_layout.addWidget(QLabel("Ano:"))
+        filtros_layout.addWidget(self.relatorio_ano)
+        filtros_layout.addWidget(QLabel("Agrupar por:"))
+        filtros_layout.addWidget(self.relatorio_agrupamento)
+        filtros_layout.addWidget(btn_gerar)
+        filtros_layout.addStretch()
+        
+        filtros_group.setLayout(filtros_layout)
+        layout.addWidget(filtros_group)
+        
+        exportacao_layout = QHBoxLayout()
+        exportacao_layout.addWidget(QLabel("Exportar:"))
+        exportacao_layout.addWidget(self.exportacao_conjunto)
+        exportacao_layout.addWidget(self.exportacao_btn)
+        exportacao_layout.addWidget(self.exportacao_progresso, 1)
+        layout.addLayout(exportacao_layout)
+        
+        # Área do relatório
+        self.relatorio_area = QTextEdit()
+        self.relatorio_area.setReadOnly(True)
+        layout.addWidget(self.relatorio_area)
+        
+        return tab
+    
+    def create_configuracoes_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        label = QLabel("Configurações do Sistema")
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(label)
+        
+        # Opções de configuração
+        config_group = QGroupBox("Opções")
+        config_layout = QFormLayout()
+        
+        self.notificacoes_check = QCheckBox("Ativar notificações")
+        self.notificacoes_check.setChecked(self.notificacoes_scheduler.ativo)
+        self.notificacoes_check.toggled.connect(self.alternar_notificacoes)
+        config_layout.addRow(self.notificacoes_check)
+        
+        self.backup_dias = QComboBox()
+        self.backup_dias.addItem("Diário", "diario")
+        self.backup_dias.addItem("Semanal", "semanal")
+        self.backup_dias.addItem("Mensal", "mensal")
+        self.backup_dias.setCurrentIndex(max(self.backup_dias.findData(
+            self.db.get_configuracao("backup_frequencia", BackupScheduler.FREQUENCIA_PADRAO)), 0))
+        self.backup_dias.currentIndexChanged.connect(self.alterar_frequencia_backup)
+        config_layout.addRow("Frequência de backup:", self.backup_dias)
+        
+        config_group.setLayout(config_layout)
+        layout.addWidget(config_group)
+        
+        # Importação de dados em lote (CSV/JSONL), em segundo plano
+        importacao_group = QGroupBox("Importar Dados")
+        importacao_layout = QHBoxLayout()
+        
+        self.importacao_tipo = QComboBox()
+        for tipo in Importador.TIPOS:
+            self.importacao_tipo.addItem(tipo.capitalize(), tipo)
+        self.importacao_btn = ModernButton("Importar Arquivo...")
+        self.importacao_btn.clicked.connect(self.importar_dados)
+        self.importacao_progresso = QProgressBar()
+        self.importacao_progresso.setVisible(False)
+        
+        importacao_layout.addWidget(self.importacao_tipo)
+        importacao_layout.addWidget(self.importacao_btn)
+        importacao_layout.addWidget(self.importacao_progresso, 1)
+        importacao_group.setLayout(importacao_layout)
+        layout.addWidget(importacao_group)
+        
+        self.importacao_signals = TaskSignals()
+        self.importacao_signals.progresso.connect(self.importacao_progresso.setValue)
+        self.importacao_signals.concluida.connect(self.importacao_concluida)
+        self.importacao_signals.falhou.connect(self.importacao_falhou)
+        
+        # Botões de ação
+        backup_btn = ModernButton("Fazer Backup do Banco de Dados")
+        backup_btn.clicked.connect(self.fazer_backup)
+        
+        restore_btn = ModernButton("Restaurar Backup")
+        restore_btn.clicked.connect(self.restaurar_backup)
+        
+        notificacoes_btn = ModernButton("Ver Notificações")
+        notificacoes_btn.clicked.connect(self.ver_notificacoes)
+        
+        self.backup_progresso = QProgressBar()
+        self.backup_progresso.setVisible(False)
+        self.backup_signals = TaskSignals()
+        self.backup_signals.concluida.connect(self.backup_concluido)
+        self.restauracao_signals = TaskSignals()
+        self.restauracao_signals.concluida.connect(self.restauracao_concluida)
+        for signals in (self.backup_signals, self.restauracao_signals):
+            signals.progresso.connect(self.backup_progresso.setValue)
+            signals.falhou.connect(self.backup_falhou)
+        self.botoes_backup = (backup_btn, restore_btn)
+        
+        layout.addWidget(backup_btn)
+        layout.addWidget(restore_btn)
+        layout.addWidget(self.backup_progresso)
+        layout.addWidget(notificacoes_btn)
+        layout.addStretch()
+        
+        return tab
+    
+    def carregar_produtos_combo(self):
+        produtos = self.db.get_produtos()
+        self.venda_produto_combo.clear()
+        for produto in produtos:
+            self.venda_produto_combo.addItem(f"{produto.nome} - R$ {produto.preco:.2f}", produto.id)
+    
+    def calcular_valor_venda(self):
+        try:
+            produto_id = self.venda_produto_combo.currentData()
+            quantidade = int(self.venda_quantidade.text())
+            
+            # Chamado a cada tecla: o preço vem do catálogo em memória
+            produto = self.db.get_produto(produto_id, validar=False)
+            
+            if produto:
+                valor_total = produto.preco * quantidade
+                self.venda_valor.setText(f"R$ {valor_total:.2f}")
+        except:
+            self.venda_valor.setText("R$ 0.00")
+    
+    def cadastrar_cliente(self):
+        # Coletar dados do formulário
+        nome = self.nome_input.text().strip()
+        telefone = self.telefone_input.text().strip()
+        email = self.email_input.text().strip()
+        data_nascimento = self.data_nascimento_input.date().toString("yyyy-MM-dd")
+        data_cadastro = QDate.currentDate().toString("yyyy-MM-dd")
+        preferencias = self.preferencias_input.toPlainText().strip()
+        observacoes = self.observacoes_input.toPlainText().strip()
+        fumante_ativo = 1 if self.fumante_ativo_check.isChecked() else 0
+        
+        # Validar dados
+        if not nome:
+            QMessageBox.warning(self, "Aviso", "O nome do cliente é obrigatório!")
+            return
+        
+        # Preparar dados para inserção
+        cliente_data = (nome, telefone, email, data_nascimento, data_cadastro, 
+                       preferencias, observacoes, fumante_ativo)
+        
+        try:
+            # Inserir no banco de dados
+            self.db.add_cliente(cliente_data)
+            if self.aba_construida("vendas"):
+                self.venda_cliente_picker.atualizar()
+            
+            # Aniversariante do dia: avisar já, sem esperar o próximo disparo
+            if data_nascimento[5:] == date.today().strftime("%m-%d"):
+                self.notificacoes_scheduler.acordar()
+            
+            # Limpar formulário
+            self.nome_input.clear()
+            self.telefone_input.clear()
+            self.email_input.clear()
+            self.data_nascimento_input.setDate(QDate(1990, 1, 1))
+            self.preferencias_input.clear()
+            self.observacoes_input.clear()
+            self.fumante_ativo_check.setChecked(True)
+            
+            QMessageBox.information(self, "Sucesso", "Cliente cadastrado com sucesso!")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao cadastrar cliente: {str(e)}")
+    
+    def atualizar_lista_vazia(self, mensagem_vazia):
+        vazia = self.clientes_model.rowCount() == 0
+        self.clientes_vazio_label.setText(mensagem_vazia)
+        self.clientes_vazio_label.setVisible(vazia)
+        self.clientes_view.setVisible(not vazia)
+    
+    def carregar_clientes(self):
+        self.clientes_model.carregar_todos()
+        self.atualizar_lista_vazia("Nenhum cliente cadastrado.")
+    
+    def agendar_pesquisa(self):
+        # Reinicia a espera a cada tecla digitada; um resultado ainda a caminho
+        # já é de um texto antigo e é descartado
+        self.cancelar_pesquisa()
+        self.search_timer.start()
+    
+    def cancelar_pesquisa(self):
+        self.search_cancelar.set()
+        self.search_cancelar = threading.Event()
+        self.search_geracao += 1
+    
+    def pesquisar_clientes(self):
+        self.search_timer.stop()
+        
+        # Cancela a busca anterior (se ainda estiver rodando) e inicia a nova
+        self.cancelar_pesquisa()
+        
+        # Sem termo a lista volta a ser paginada direto do banco
+        termo = self.search_input.text().strip()
+        if not termo:
+            self.carregar_clientes()
+            return
+        
+        # Só a primeira página é buscada em segundo plano; as seguintes vêm
+        # do modelo conforme a rolagem, sempre com o termo desta busca
+        self.search_fonte = partial(self.db.search_clientes, termo, ordem="nome",
+                                    tipo=CartaoCliente)
+        buscar = partial(self.search_fonte, limit=ClientListModel.TAMANHO_PAGINA)
+        worker = SearchWorker(buscar, self.search_geracao,
+                              self.search_cancelar, self.search_signals)
+        self.search_pool.start(worker)
+    
+    def exibir_resultado_pesquisa(self, geracao, clientes):
+        if geracao != self.search_geracao:
+            return  # resultado de uma busca já substituída
+        self.clientes_model.carregar(self.search_fonte, clientes)
+        self.atualizar_lista_vazia("Nenhum cliente encontrado.")
+    
+    def exibir_erro_pesquisa(self, geracao, erro):
+        if geracao == self.search_geracao:
+            QMessageBox.critical(self, "Erro", f"Erro ao pesquisar clientes: {erro}")
+    
+    def registrar_venda(self):
+        cliente_id = self.venda_cliente_picker.cliente_id()
+        produto_id = self.venda_produto_combo.currentData()
+        if cliente_id is None:
+            QMessageBox.warning(self, "Aviso", "Selecione um cliente!")
+            return
+        data_compra = self.venda_data.date().toString("yyyy-MM-dd")
+        
+        try:
+            quantidade = int(self.venda_quantidade.text())
+        except:
+            QMessageBox.warning(self, "Aviso", "Quantidade deve ser um número válido!")
+            return
+        
+        if produto_id is None:
+            QMessageBox.warning(self, "Aviso", "Selecione um produto!")
+            return
+        
+        try:
+            # Compra, total gasto e notificação em uma única transação
+            venda = self.db.registrar_venda(cliente_id, produto_id, quantidade, data_compra)
+        except Exception as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao registrar venda: {str(e)}")
+            return
+        
+        QMessageBox.information(self, "Sucesso", f"Venda registrada com sucesso!\n\n{venda.mensagem}")
+        
+        # Limpar campos
+        self.venda_quantidade.setText("1")
+        self.calcular_valor_venda()
+    
+    def gerar_relatorio(self):
+        mes = self.relatorio_mes_combo.currentIndex() + 1
+        ano = self.relatorio_ano.text()
+        
+        try:
+            ano = int(ano)
+            relatorio = self.db.get_relatorio_mensal(ano, mes, self.relatorio_agrupamento.currentData())
+        except ValueError:
+            QMessageBox.warning(self, "Aviso", "Ano deve ser um número válido!")
+            return
+        
+        linhas = [f"Relatório gerado para {mes:02d}/{ano}", ""]
+        
+        # Vendas do mês
+        linhas.append(f"Vendas no mês: {relatorio['num_vendas']}")
+        linhas.append(f"Itens vendidos: {relatorio['quantidade']}")
+        linhas.append(f"Faturamento do mês: R$ {relatorio['valor_total']:.2f}")
+        linhas.append(f"Clientes atendidos: {relatorio['clientes_distintos']}")
+        
+        if relatorio["por_periodo"]:
+            titulo = "Vendas por dia:" if self.relatorio_agrupamento.currentData() == "dia" else "Vendas por semana:"
+            linhas += ["", titulo]
+            for linha in relatorio["por_periodo"]:
+                linhas.append(f"{linha.periodo}: {linha.vendas} venda(s), "
+                              f"{linha.quantidade} item(ns) - R$ {linha.valor:.2f}")
+        
+        if relatorio["por_categoria"]:
+            linhas += ["", "Vendas por categoria:"]
+            for linha in relatorio["por_categoria"]:
+                linhas.append(f"{linha.categoria}: {linha.quantidade} item(ns) - R$ {linha.valor:.2f}")
+        
+        if relatorio["por_produto"]:
+            linhas += ["", "Vendas por produto:"]
+            for linha in relatorio["por_produto"]:
+                linhas.append(f"{linha.produto or 'Produto removido'}: {linha.quantidade} item(ns) "
+                              f"- R$ {linha.valor:.2f}")
+        
+        linhas += ["", "---", ""]
+        
+        # Informações gerais da base de clientes
+        estatisticas = self.db.get_estatisticas()
+        
+        linhas.append(f"Total de clientes: {estatisticas['total_clientes']}")
+        linhas.append(f"Clientes ativos: {estatisticas['clientes_ativos']}")
+        linhas.append(f"Faturamento total: R$ {estatisticas['faturamento_total']:.2f}")
+        linhas += ["", "---", ""]
+        
+        # Top 5 clientes que mais gastaram
+        linhas.append("Top 5 clientes (por gastos):")
+        for i, cliente in enumerate(self.db.get_top_clientes(5)):
+            linhas.append(f"{i+1}. {cliente.nome} - R$ {cliente.total_gasto:.2f}")
+        
+        self.relatorio_area.setPlainText("\n".join(linhas))
+    
+    def importar_dados(self):
+        tipo = self.importacao_tipo.currentData()
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, f"Importar {tipo}", "", "Dados (*.csv *.jsonl *.ndjson);;Todos os arquivos (*)")
+        if not caminho:
+            return
+        
+        def tarefa(progresso, cancelar):
+            return Importador(self.db).importar(
+                tipo, caminho, lambda lidos, total, _: progresso(lidos * 100 // max(total, 1)),
+                cancelar)
+        
+        self.importacao_btn.setEnabled(False)
+        self.importacao_progresso.setValue(0)
+        self.importacao_progresso.setVisible(True)
+        self.iniciar_tarefa(tarefa, self.importacao_signals)
+    
+    def importacao_concluida(self, resultado):
+        self.importacao_btn.setEnabled(True)
+        self.importacao_progresso.setVisible(False)
+        
+        # Os dados novos aparecem nas listas e combos (das abas já abertas;
+        # as outras leem os dados quando forem montadas)
+        if resultado["tipo"] == "produtos":
+            if self.aba_construida("vendas"):
+                self.carregar_produtos_combo()
+        else:
+            if self.aba_construida("clientes"):
+                self.carregar_clientes()
+            if resultado["tipo"] == "clientes":
+                if self.aba_construida("vendas"):
+                    self.venda_cliente_picker.atualizar()
+                self.carregar_aniversariantes()
+        
+        mensagem = resumo_importacao(resultado)
+        if resultado["erros"]:
+            mensagem += "\n\n" + "\n".join(f"Linha {numero}: {erro}"
+                                            for numero, erro in resultado["erros"][:10])
+        QMessageBox.information(self, "Importação", mensagem)
+    
+    def importacao_falhou(self, erro):
+        self.importacao_btn.setEnabled(True)
+        self.importacao_progresso.setVisible(False)
+        QMessageBox.critical(self, "Erro", f"Erro ao importar: {erro}")
+    
+    def exportar_dados(self):
+        # Widgets lidos aqui, na thread da interface: a tarefa só usa os valores
+        conjunto = self.exportacao_conjunto.currentData()
+        agrupamento = self.relatorio_agrupamento.currentData()
+        mes = self.relatorio_mes_combo.currentIndex() + 1
+        try:
+            ano = int(self.relatorio_ano.text())
+        except ValueError:
+            QMessageBox.warning(self, "Aviso", "Ano deve ser um número válido!")
+            return
+        
+        filtros = {"CSV (*.csv)": ".csv", "JSON Lines (*.jsonl)": ".jsonl", "Parquet (*.parquet)": ".parquet"}
+        caminho, filtro = QFileDialog.getSaveFileName(
+            self, "Exportar", f"{conjunto}_{ano}-{mes:02d}.csv", ";;".join(filtros))
+        if not caminho:
+            return
+        if not os.path.splitext(caminho)[1]:
+            caminho += filtros.get(filtro, ".csv")
+        
+        def tarefa(progresso, cancelar):
+            return Exportador(self.db).exportar(
+                conjunto, caminho, progresso=lambda linhas, total: progresso(linhas * 100 // max(total, 1)),
+                cancelar=cancelar, ano=ano, mes=mes, agrupamento=agrupamento)
+        
+        self.exportacao_btn.setEnabled(False)
+        self.exportacao_progresso.setValue(0)
+        self.exportacao_progresso.setVisible(True)
+        self.iniciar_tarefa(tarefa, self.exportacao_signals)
+    
+    def exportacao_concluida(self, resultado):
+        self.exportacao_btn.setEnabled(True)
+        self.exportacao_progresso.setVisible(False)
+        QMessageBox.information(self, "Exportação",
+                                f"{resultado['linhas']} linha(s) exportada(s) para {resultado['caminho']}")
+    
+    def exportacao_falhou(self, erro):
+        self.exportacao_btn.setEnabled(True)
+        self.exportacao_progresso.setVisible(False)
+        QMessageBox.critical(self, "Erro", f"Erro ao exportar: {erro}")
+    
+    def alterar_frequencia_backup(self):
+        self.db.set_configuracao("backup_frequencia", self.backup_dias.currentData())
+        self.backup_scheduler.acordar()
+    
+    def backup_automatico_concluido(self, caminho):
+        self.tray_icon.showMessage("Tabacaria CRM - Backup", f"Backup automático salvo em {caminho}",
+                                   QSystemTrayIcon.Information, 2000)
+    
+    def iniciar_tarefa_backup(self, tarefa, signals):
+        for botao in self.botoes_backup:
+            botao.setEnabled(False)
+        self.backup_progresso.setValue(0)
+        self.backup_progresso.setVisible(True)
+        self.iniciar_tarefa(tarefa, signals)
+    
+    def finalizar_tarefa_backup(self):
+        for botao in self.botoes_backup:
+            botao.setEnabled(True)
+        self.backup_progresso.setVisible(False)
+    
+    def fazer_backup(self):
+        caminho, _ = QFileDialog.getSaveFileName(
+            self, "Fazer Backup", f"backup_tabacaria_{date.today().strftime('%Y%m%d')}.db.gz",
+            "Backup compactado (*.db.gz);;Banco SQLite (*.db)")
+        if not caminho:
+            return
+        
+        def tarefa(progresso, cancelar):
+            self.db.fazer_backup(caminho, progresso)
+            return caminho
+        
+        self.iniciar_tarefa_backup(tarefa, self.backup_signals)
+    
+    def backup_concluido(self, caminho):
+        self.finalizar_tarefa_backup()
+        QMessageBox.information(self, "Backup", f"Backup criado com sucesso: {caminho}")
+    
+    def restaurar_backup(self):
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, "Restaurar Backup", "", "Backups (*.db.gz *.db);;Todos os arquivos (*)")
+        if not caminho:
+            return
+        
+        resposta = QMessageBox.question(
+            self, "Restaurar Backup",
+            "Todos os dados atuais serão substituídos pelos do backup. Deseja continuar?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if resposta != QMessageBox.Yes:
+            return
+        
+        def tarefa(progresso, cancelar):
+            self.db.restaurar_backup(caminho, progresso)
+            return caminho
+        
+        self.iniciar_tarefa_backup(tarefa, self.restauracao_signals)
+    
+    def restauracao_concluida(self, caminho):
+        self.finalizar_tarefa_backup()
+        
+        # Recarregar as telas com os dados restaurados
+        if self.aba_construida("clientes"):
+            self.carregar_clientes()
+        if self.aba_construida("vendas"):
+            # O cliente escolhido pode não existir no backup
+            self.venda_cliente_picker.limpar()
+            self.carregar_produtos_combo()
+        self.carregar_aniversariantes()
+        QMessageBox.information(self, "Restauração", "Backup restaurado com sucesso")
+    
+    def backup_falhou(self, erro):
+        self.finalizar_tarefa_backup()
+        QMessageBox.critical(self, "Erro", f"Erro no backup: {erro}")
+    
+    def ver_notificacoes(self):
+        notificacoes = self.db.get_notificacoes_hoje()
+        if notificacoes:
+            self.mostrar_dialogo_notificacoes(notificacoes)
+        else:
+            QMessageBox.information(self, "Notificações", "Não há notificações para hoje")
+    
+    def abrir_edicao_cliente(self, cliente_id):
+        cliente = self.db.get_cliente(cliente_id)
+        
+        if cliente:
+            # Aqui você implementaria um diálogo de edição
+            QMessageBox.information(self, "Editar Cliente", f"Edição do cliente: {cliente.nome}")
+    
+    def ver_compras_cliente(self, cliente_id):
+        cliente = self.db.get_cliente(cliente_id)
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Compras de {cliente.nome}")
+        dialog.setGeometry(100, 100, 600, 400)
+        
+        layout = QVBoxLayout()
+        
+        resumo = self.db.get_resumo_cliente(cliente_id)
+        if resumo.compras:
+            layout.addWidget(QLabel(f"{resumo.compras} compra(s), {resumo.quantidade} item(ns), "
+                                    f"R$ {resumo.valor_total:.2f} — de {resumo.primeira_compra} "
+                                    f"a {resumo.ultima_compra}"))
+        
+        table = QTableWidget()
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Data", "Produto", "Quantidade", "Valor"])
+        
+        # Histórico paginado: a próxima página é buscada quando a rolagem
+        # chega ao fim da tabela
+        tamanho_pagina = 200
+        paginacao = {"after": None, "tem_mais": True}
+        
+        def carregar_pagina():
+            if not paginacao["tem_mais"]:
+                return
+            compras = self.db.get_compras_cliente(cliente_id, after=paginacao["after"],
+                                                  limit=tamanho_pagina)
+            paginacao["tem_mais"] = len(compras) == tamanho_pagina
+            if not compras:
+                return
+            paginacao["after"] = (compras[-1].data_compra, compras[-1].id)
+            
+            inicio = table.rowCount()
+            table.setRowCount(inicio + len(compras))
+            for row, compra in enumerate(compras, start=inicio):
+                table.setItem(row, 0, QTableWidgetItem(compra.data_compra))
+                table.setItem(row, 1, QTableWidgetItem(compra.produto))
+                table.setItem(row, 2, QTableWidgetItem(str(compra.quantidade)))
+                table.setItem(row, 3, QTableWidgetItem(f"R$ {compra.valor_total:.2f}"))
+        
+        def rolagem(valor):
+            if valor == table.verticalScrollBar().maximum():
+                carregar_pagina()
+        
+        carregar_pagina()
+        table.verticalScrollBar().valueChanged.connect(rolagem)
+        
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(table)
+        
+        btn_fechar = QPushButton("Fechar")
+        btn_fechar.clicked.connect(dialog.close)
+        layout.addWidget(btn_fechar)
+        
+        dialog.setLayout(layout)
+        dialog.exec_()
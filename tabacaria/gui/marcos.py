@@ -0,0 +1,26 @@
+import json
+import time
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication
+
+# Com esta variável de ambiente apontando para um arquivo, o app grava nele
+# os marcos da abertura e sai logo após a primeira pintura da janela
+VARIAVEL_MARCOS = "TABACARIA_SAIR_APOS_PINTURA"
+
+class MarcosAbertura(QObject):
+    # Filtro de eventos da MainWindow. Os marcos são instantes de
+    # time.perf_counter, o mesmo relógio do processo que mediu o lançamento;
+    # vão para um arquivo (e não para stdout) porque os executáveis
+    # empacotados sem console não têm saída padrão.
+    def __init__(self, caminho, marcos, parent=None):
+        super().__init__(parent)
+        self.caminho = caminho
+        self.marcos = dict(marcos)
+    
+    def eventFilter(self, objeto, evento):
+        if evento.type() == QEvent.Paint and "pintura" not in self.marcos:
+            self.marcos["pintura"] = time.perf_counter()
+            with open(self.caminho, "w", encoding="utf-8") as arquivo:
+                json.dump(self.marcos, arquivo)
+            QTimer.singleShot(0, QApplication.quit)
+        return False
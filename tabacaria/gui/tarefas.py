@@ -0,0 +1,55 @@
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+class TaskSignals(QObject):
+    progresso = pyqtSignal(int)  # percentual concluído
+    concluida = pyqtSignal(object)
+    falhou = pyqtSignal(str)
+
+class TaskWorker(QRunnable):
+    # Executa uma tarefa longa, tarefa(progresso=..., cancelar=...), em uma
+    # thread do QThreadPool; progresso(percentual) e o resultado chegam à
+    # GUI pelos sinais de TaskSignals
+    def __init__(self, tarefa, signals, cancelar=None):
+        super().__init__()
+        self.tarefa = tarefa
+        self.signals = signals
+        self.cancelar = cancelar or threading.Event()
+    
+    def run(self):
+        try:
+            resultado = self.tarefa(progresso=self.signals.progresso.emit, cancelar=self.cancelar)
+        except Exception as e:
+            self.signals.falhou.emit(str(e))
+            return
+        self.signals.concluida.emit(resultado)
+
+class SearchSignals(QObject):
+    concluida = pyqtSignal(int, object)  # geração da busca, clientes encontrados
+    falhou = pyqtSignal(int, str)
+
+class SearchWorker(QRunnable):
+    # Executa uma consulta (buscar(cancelar=...)) em uma thread do
+    # QThreadPool. Uma busca mais nova sinaliza `cancelar`, o que aborta a
+    # consulta no SQLite e descarta o resultado desta.
+    def __init__(self, buscar, geracao, cancelar, signals):
+        super().__init__()
+        self.buscar = buscar
+        self.geracao = geracao
+        self.cancelar = cancelar
+        self.signals = signals
+    
+    def run(self):
+        if self.cancelar.is_set():
+            return
+        
+        try:
+            clientes = self.buscar(cancelar=self.cancelar)
+        except Exception as e:
+            # Cancelada, a consulta termina com "interrupted": não é um erro
+            if not self.cancelar.is_set():
+                self.signals.falhou.emit(self.geracao, str(e))
+            return
+        
+        if not self.cancelar.is_set():
+            self.signals.concluida.emit(self.geracao, clientes)
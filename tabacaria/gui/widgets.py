@@ -0,0 +1,130 @@
+from datetime import datetime, date
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame,
+                             QDialog, QListWidget, QListWidgetItem)
+from PyQt5.QtCore import Qt
+
+class ModernButton(QPushButton):
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setStyleSheet("""
+            QPushButton {
+                background-color: #2c3e50;
+                color: white;
+                border: none;
+                padding: 10px;
+                border-radius: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #34495e;
+            }
+            QPushButton:pressed {
+                background-color: #2c3e50;
+            }
+        """)
+
+class NotificationDialog(QDialog):
+    def __init__(self, notificacoes, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Notificações")
+        self.setGeometry(100, 100, 500, 400)
+        
+        layout = QVBoxLayout()
+        
+        self.list_widget = QListWidget()
+        for notif in notificacoes:
+            item = QListWidgetItem(f"{notif.titulo} - {notif.mensagem}")
+            item.setData(Qt.UserRole, notif.id)
+            self.list_widget.addItem(item)
+        
+        layout.addWidget(QLabel("Notificações do dia:"))
+        layout.addWidget(self.list_widget)
+        
+        btn_layout = QHBoxLayout()
+        btn_ok = QPushButton("OK")
+        btn_ok.clicked.connect(self.marcar_como_lida)
+        btn_layout.addWidget(btn_ok)
+        
+        btn_fechar = QPushButton("Fechar")
+        btn_fechar.clicked.connect(self.close)
+        btn_layout.addWidget(btn_fechar)
+        
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+    
+    def marcar_como_lida(self):
+        current_item = self.list_widget.currentItem()
+        if current_item:
+            notif_id = current_item.data(Qt.UserRole)
+            self.parent().db.marcar_notificacao_lida(notif_id)
+            self.list_widget.takeItem(self.list_widget.row(current_item))
+
+class BirthdayWidget(QWidget):
+    # Com muitos clientes o mês tem milhares de aniversariantes; só os
+    # próximos MAX_ITENS ganham um card
+    MAX_ITENS = 30
+    
+    def __init__(self, aniversariantes=None, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+        self.exibir(aniversariantes)
+    
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        
+        title = QLabel("Aniversariantes do Mês")
+        title.setStyleSheet("font-weight: bold; font-size: 16px; color: #2c3e50;")
+        layout.addWidget(title)
+        
+        # Itens da lista, refeitos a cada exibir()
+        self.itens_layout = QVBoxLayout()
+        layout.addLayout(self.itens_layout)
+        
+        layout.addStretch()
+        self.setLayout(layout)
+    
+    def exibir(self, aniversariantes):
+        # aniversariantes=None enquanto a lista ainda está sendo lida do banco
+        self.aniversariantes = aniversariantes
+        while self.itens_layout.count():
+            self.itens_layout.takeAt(0).widget().deleteLater()
+        
+        if aniversariantes is None:
+            self.itens_layout.addWidget(QLabel("Carregando..."))
+        elif not aniversariantes:
+            self.itens_layout.addWidget(QLabel("Nenhum aniversariante este mês."))
+        else:
+            hoje = date.today()
+            proximos = []
+            for aniv in aniversariantes:
+                # Calcular idade
+                nascimento = datetime.strptime(aniv.data_nascimento, "%Y-%m-%d").date()
+                idade = hoje.year - nascimento.year - ((hoje.month, hoje.day) < (nascimento.month, nascimento.day))
+                
+                # Calcular dias até o aniversário
+                next_birthday = date(hoje.year, nascimento.month, nascimento.day)
+                if next_birthday < hoje:
+                    next_birthday = date(hoje.year + 1, nascimento.month, nascimento.day)
+                
+                dias_restantes = (next_birthday - hoje).days
+                proximos.append((dias_restantes, aniv, nascimento, idade))
+            proximos.sort(key=lambda p: p[0])
+            
+            for dias_restantes, aniv, nascimento, idade in proximos[:self.MAX_ITENS]:
+                frame = QFrame()
+                frame.setFrameShape(QFrame.StyledPanel)
+                frame.setStyleSheet("QFrame { background-color: #f8f9fa; border-radius: 5px; padding: 5px; }")
+                frame_layout = QHBoxLayout()
+                
+                info_label = QLabel(f"{aniv.nome} - {nascimento.day}/{nascimento.month} ({idade} anos)")
+                frame_layout.addWidget(info_label)
+                
+                days_label = QLabel(f"{dias_restantes} dias")
+                days_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                frame_layout.addWidget(days_label)
+                
+                frame.setLayout(frame_layout)
+                self.itens_layout.addWidget(frame)
+            
+            if len(proximos) > self.MAX_ITENS:
+                self.itens_layout.addWidget(QLabel(f"... e mais {len(proximos) - self.MAX_ITENS} aniversariante(s)"))
@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 
 a = Analysis(
@@ -6,7 +7,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['PyQt5', 'matplotlib.backends.backend_qt5agg', 'numpy', 'sqlite3', 'datetime', 'json'],
+    hiddenimports=['tabacaria.gui', 'tabacaria.core.servidor', 'PyQt5', 'matplotlib.backends.backend_qt5agg',
+                   'numpy', 'sqlite3', 'datetime', 'json'],
     hookspath=['hooks'],
     hooksconfig={},
     runtime_hooks=[],
@@ -16,23 +18,58 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='tabacaria_crm',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+# Variantes comparadas por benchmarks/bench_empacotamento.py:
+# TABACARIA_ONEDIR=1 gera uma pasta (dist/tabacaria_crm/) em vez do executável
+# único, que se extrai em um diretório temporário a cada abertura, e
+# TABACARIA_SEM_UPX=1 desliga a compressão UPX dos binários
+ONEDIR = os.environ.get('TABACARIA_ONEDIR') == '1'
+UPX = os.environ.get('TABACARIA_SEM_UPX') != '1'
+
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='tabacaria_crm',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=UPX,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=UPX,
+        upx_exclude=[],
+        name='tabacaria_crm',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='tabacaria_crm',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=UPX,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from tabacaria.core import DatabaseManager
+
+
+class BuscaClientesTest(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.pasta.name, "busca.db"))
+        self.db.add_clientes_many(
+            (f"Cliente {i}", f"11 9{i:04d}", f"c{i}@exemplo.com", "1990-01-01", "2024-01-01",
+             "", "", 1)
+            for i in range(1, 451))
+
+    def tearDown(self):
+        self.db.close()
+        self.pasta.cleanup()
+
+    def nomes(self, termo, **kwargs):
+        return {cliente.nome for cliente in self.db.search_clientes(termo, **kwargs)}
+
+    def test_sufixo_numerico_curto_restringe(self):
+        nomes = self.nomes("Cliente 45")
+        self.assertIn("Cliente 45", nomes)
+        self.assertIn("Cliente 145", nomes)
+        self.assertNotIn("Cliente 44", nomes)
+        self.assertLess(len(nomes), 450)
+
+    def test_so_palavras_curtas(self):
+        # Trechos no meio do email e do telefone, não só no início do nome
+        self.assertEqual(self.nomes("9@"), {f"Cliente {i}" for i in range(9, 451, 10)})
+        self.assertEqual(self.nomes("9@ 13"), {"Cliente 139"})
+        self.assertEqual(self.nomes("zz"), set())
+
+    def test_palavras_curtas_com_paginacao(self):
+        pagina = self.db.search_clientes("cliente 1", ordem="nome", limit=5)
+        seguinte = self.db.search_clientes("cliente 1", ordem="nome", limit=5,
+                                           after=(pagina[-1].nome, pagina[-1].id))
+        self.assertTrue(all("1" in cliente.nome for cliente in pagina + seguinte))
+        self.assertGreater(seguinte[0].nome, pagina[-1].nome)
+
+
+if __name__ == "__main__":
+    unittest.main()
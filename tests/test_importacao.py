@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from tabacaria.core import DatabaseManager, Importador
+
+
+class ImportacaoNumerosTest(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.pasta.name, "importacao.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.pasta.cleanup()
+
+    def importar_produtos(self, linhas):
+        caminho = os.path.join(self.pasta.name, "produtos.csv")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write("nome;categoria;preco\n")
+            arquivo.writelines(f"{nome};Teste;{preco}\n" for nome, preco in linhas)
+        resultado = Importador(self.db).importar("produtos", caminho)
+        precos = {produto.nome: produto.preco for produto in self.db.get_produtos()}
+        return resultado, precos
+
+    def test_ultimo_separador_e_o_decimal(self):
+        resultado, precos = self.importar_produtos([
+            ("Brasileiro", "1.234,56"), ("Americano", "1,234.56"),
+            ("Sem milhar", "1234,5"), ("Simples", "12.5")])
+        self.assertEqual(resultado["importados"], 4)
+        self.assertEqual(precos["Brasileiro"], 1234.56)
+        self.assertEqual(precos["Americano"], 1234.56)
+        self.assertEqual(precos["Sem milhar"], 1234.5)
+        self.assertEqual(precos["Simples"], 12.5)
+
+    def test_milhar_sem_decimal_e_ambiguo(self):
+        resultado, precos = self.importar_produtos([
+            ("Ponto", "1.500"), ("Virgula", "1,500"), ("Com centavos", "1.500,00"),
+            ("Milhões", "1.234.567")])
+        self.assertEqual(resultado["importados"], 2)
+        self.assertEqual(resultado["invalidos"], 2)
+        self.assertTrue(all("ambíguo" in mensagem for _, mensagem in resultado["erros"]))
+        self.assertEqual(precos["Com centavos"], 1500.0)
+        self.assertEqual(precos["Milhões"], 1234567.0)
+        self.assertNotIn("Ponto", precos)
+        self.assertNotIn("Virgula", precos)
+
+    def test_grupos_de_milhar_invalidos(self):
+        resultado, precos = self.importar_produtos([("Grupo curto", "12,34.5"), ("Dois decimais", "1,2,3")])
+        self.assertEqual(resultado["importados"], 0)
+        self.assertEqual(resultado["invalidos"], 2)
+        self.assertNotIn("Grupo curto", precos)
+
+
+if __name__ == "__main__":
+    unittest.main()
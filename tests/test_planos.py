@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+from tabacaria.core import DatabaseManager
+
+
+class PlanosConsultaTest(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.pasta.name, "planos.db"))
+        self.db.add_clientes_many(
+            (f"Cliente {i}", f"11 9{i:04d}", f"c{i}@exemplo.com", f"1990-01-{i % 28 + 1:02d}",
+             "2024-01-01", "", "", 1)
+            for i in range(50))
+        self.db.add_compras_many((i % 50 + 1, i % 7 + 1, f"2024-{i % 12 + 1:02d}-10", 1, 10.0)
+                                 for i in range(200))
+        with self.db.transaction() as conn:
+            conn.execute("ANALYZE")
+
+    def tearDown(self):
+        self.db.close()
+        self.pasta.cleanup()
+
+    def test_consultas_criticas_usam_indices(self):
+        self.assertEqual(self.db.verificar_planos_consulta(), [])
+
+    def test_indice_removido_e_apontado(self):
+        with self.db.transaction() as conn:
+            conn.execute("DROP INDEX idx_compras_cliente_data")
+        consultas = {nome for nome, _ in self.db.verificar_planos_consulta()}
+        self.assertIn("get_compras_cliente", consultas)
+
+
+if __name__ == "__main__":
+    unittest.main()